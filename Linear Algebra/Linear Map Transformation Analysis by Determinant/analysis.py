@@ -0,0 +1,182 @@
+import numpy as np
+
+DTYPE = np.float64
+
+
+def analysis_dtype(dtype=None) -> np.dtype:
+    """
+    Row layout of analyze_matrices() reports: one row per matrix of the analysed stack.
+
+    Parameters:
+    dtype: Floating point dtype of the real fields, DTYPE by default; the eigenvalues
+    use the complex dtype of the same precision.
+
+    Returns:
+    np.dtype: The structured dtype.
+    """
+    real = np.dtype(DTYPE if dtype is None else dtype)
+    complex_ = np.result_type(real, np.complex64)
+    return np.dtype([
+        ("determinant", real),
+        ("eigenvalue_1", complex_),
+        ("eigenvalue_2", complex_),
+        ("singular_value_1", real),
+        ("singular_value_2", real),
+        ("condition_number", real),
+        ("rank", np.int8),
+        ("orientation_flip", np.bool_),
+        ("shoelace_area", real),
+        ("area_scale", real),
+        ("area_scale_error", real),
+    ])
+
+
+def transformation_matrices(type:str, **params) -> np.ndarray:
+    """
+    Builds a stack of 2x2 transformation matrices of one family.
+
+    Same families and defaults as Matrix._create_transformation_matrix, but every
+    parameter may be an array so a whole family can be generated at once.
+
+    Parameters:
+    type (str): The type of matrix transformation ('rotation', 'scaling', 'shearing', 'reflection', 'collapse').
+    params: Family parameters ('angle', 'scale_x', 'scale_y', 'shear_x', 'shear_y') as scalars or arrays.
+    For 'reflection' and 'collapse' an optional 'count' gives the stack size.
+
+    Returns:
+    np.ndarray: Matrix stack with shape (M, 2, 2).
+
+    Raises:
+    ValueError: If the provided type is not supported.
+    """
+
+    if type == "rotation":
+        angle = np.atleast_1d(np.asarray(params.get("angle", np.pi / 4), dtype=DTYPE))
+        c, s = np.cos(angle), np.sin(angle)
+        entries = (c, -s, s, c)
+    elif type == "scaling":
+        scale_x, scale_y = np.broadcast_arrays(np.atleast_1d(params.get("scale_x", 2)),
+                                               np.atleast_1d(params.get("scale_y", 3)))
+        zeros = np.zeros(scale_x.shape)
+        entries = (scale_x, zeros, zeros, scale_y)
+    elif type == "shearing":
+        shear_x, shear_y = np.broadcast_arrays(np.atleast_1d(params.get("shear_x", 1)),
+                                               np.atleast_1d(params.get("shear_y", 0)))
+        ones = np.ones(shear_x.shape)
+        entries = (ones, shear_x, shear_y, ones)
+    elif type == "reflection":
+        count = params.get("count", 1)
+        return np.broadcast_to(np.array([[1., 0.], [0., -1.]], dtype=DTYPE), (count, 2, 2)).copy()
+    elif type == "collapse":
+        count = params.get("count", 1)
+        return np.broadcast_to(np.array([[1., 1.], [2., 2.]], dtype=DTYPE), (count, 2, 2)).copy()
+    else:
+        raise ValueError(f"Matrix type '{type}' is not supported.")
+
+    a, b, c, d = np.broadcast_arrays(*entries)
+    return np.stack([np.stack([a, b], axis=-1), np.stack([c, d], axis=-1)], axis=-2).reshape(-1, 2, 2).astype(DTYPE)
+
+
+def circular_vector_space(n:int = 100) -> np.ndarray:
+    """
+    Creates the unit circle sampling used by Matrix for the 'circular' vector space.
+
+    Parameters:
+    n (int): Number of sampling points. Default is 100.
+
+    Returns:
+    np.ndarray: The vector space with shape (2, n).
+    """
+    theta = np.linspace(0, 2 * np.pi, n, dtype=DTYPE)
+    return np.vstack([np.cos(theta), np.sin(theta)])
+
+
+def shoelace_area(points:np.ndarray) -> np.ndarray:
+    """
+    Signed area of closed polygons by the shoelace formula.
+
+    A = 1/2 * sum_i (x_i * y_{i+1} - x_{i+1} * y_i)
+
+    Parameters:
+    points (np.ndarray): Polygon vertices with shape (..., 2, n).
+
+    Returns:
+    np.ndarray: Signed areas with shape (...).
+    """
+    x, y = points[..., 0, :], points[..., 1, :]
+    return 0.5 * np.sum(x * np.roll(y, -1, axis=-1) - np.roll(x, -1, axis=-1) * y, axis=-1)
+
+
+def analyze_matrices(matrices:np.ndarray, n:int = 100, chunk_size:int = 8192) -> np.ndarray:
+    """
+    Spectral and geometric analysis of a stack of 2x2 transformation matrices.
+
+    Besides det(A), computes eigenvalues, singular values, condition number, rank and
+    whether the map flips orientation. As an empirical check of |det(A)| being the area
+    scale, the circular vector space is transformed and its shoelace area divided by π
+    (the area of the unit circle) is compared against |det(A)|.
+
+    Parameters:
+    matrices (np.ndarray): A single (2, 2) matrix or a stack with shape (M, 2, 2).
+    n (int): Number of points of the circular vector space. Default is 100.
+    chunk_size (int): Matrices transformed per chunk, bounds the (chunk, 2, n) temporary.
+
+    Returns:
+    np.ndarray: Structured array (analysis_dtype() of the matrices' precision) with one row per matrix.
+
+    Raises:
+    ValueError: If the input is not a stack of 2x2 matrices.
+    """
+    matrices = np.asarray(matrices, dtype=DTYPE)
+    if matrices.ndim == 2:
+        matrices = matrices[np.newaxis]
+    if matrices.ndim != 3 or matrices.shape[1:] != (2, 2):
+        raise ValueError(f"Expected a stack of 2x2 matrices, got shape {matrices.shape}")
+
+    report = np.zeros(matrices.shape[0], dtype=analysis_dtype(matrices.dtype))
+
+    determinant = np.linalg.det(matrices)
+    eigenvalues = np.linalg.eigvals(matrices)
+    singular_values = np.linalg.svd(matrices, compute_uv=False)
+
+    report["determinant"] = determinant
+    report["eigenvalue_1"] = eigenvalues[:, 0]
+    report["eigenvalue_2"] = eigenvalues[:, 1]
+    report["singular_value_1"] = singular_values[:, 0]
+    report["singular_value_2"] = singular_values[:, 1]
+    # Same tolerance as np.linalg.matrix_rank, reusing the singular values already computed
+    tolerance = singular_values[:, :1] * 2 * np.finfo(matrices.dtype).eps
+    report["rank"] = np.count_nonzero(singular_values > tolerance, axis=1)
+    # Singular (collapsed) maps get an infinite condition number
+    with np.errstate(divide="ignore", invalid="ignore"):
+        report["condition_number"] = np.where(report["rank"] == 2,
+                                              singular_values[:, 0] / singular_values[:, 1], np.inf)
+    report["orientation_flip"] = determinant < 0
+
+    circle = circular_vector_space(n)
+    for start in range(0, matrices.shape[0], chunk_size):
+        stop = start + chunk_size
+        transformed = matrices[start:stop] @ circle
+        report["shoelace_area"][start:stop] = shoelace_area(transformed)
+
+    report["area_scale"] = np.abs(report["shoelace_area"]) / np.pi
+    report["area_scale_error"] = np.abs(report["area_scale"] - np.abs(determinant))
+
+    return report
+
+
+if __name__ == "__main__":
+    matrix_operation_types:list[str] = ['rotation','scaling','shearing','reflection', 'collapse']
+
+    for matrix_type in matrix_operation_types:
+        report = analyze_matrices(transformation_matrices(matrix_type), n=1800)[0]
+        print(f"{matrix_type.capitalize()} Transformation:")
+        print(f"det(A) = {report['determinant']:.3f}, shoelace area / π = {report['area_scale']:.3f}")
+        print(f"eigenvalues = {report['eigenvalue_1']:.3f}, {report['eigenvalue_2']:.3f}")
+        print(f"singular values = {report['singular_value_1']:.3f}, {report['singular_value_2']:.3f}")
+        print(f"condition number = {report['condition_number']:.3f}, rank = {report['rank']}, orientation flip = {report['orientation_flip']}")
+        print()
+
+    angles = np.random.uniform(0, 2 * np.pi, 50_000)
+    report = analyze_matrices(transformation_matrices("rotation", angle=angles))
+    print(f"Screened {report.size} rotations, max area scale error: {report['area_scale_error'].max():.2e}")
@@ -1,12 +1,10 @@
 import numpy as np  
-from matplotlib import pyplot as plt
-import seaborn as sns
 
-sns.set_theme(style="darkgrid")
+_theme_set = False
 
 
 class Matrix:
-    def __init__(self, type:str, vector_space_type:str, n:int = 100,save_path:str = "./Determinant/figures/default.png", **matrix_kwargs) -> None:
+    def __init__(self, type:str, vector_space_type:str, n:int = 100,save_path:str = "./Determinant/figures/default.png", render:bool = True, **matrix_kwargs) -> None:
         """
         Initializes the Matrix class with a given 2D numpy array.
 
@@ -14,6 +12,8 @@ class Matrix:
         type (str): The type of matrix transformation ('rotation', 'scaling', 'shearing', 'reflection', 'collapse').
         vector_space_type (str): The type of vector space ('rectangular', 'circular').
         n (int): Number of elements in the vector space (sampling points). Default is 100.
+        render (bool): Whether to save the visualization on creation. Default is True.
+        Pass False for compute-only use, matplotlib and seaborn are then never imported.
         matrix_kwargs: Additional keyword arguments for matrix creation.
         Example:
         {"rotation": ["angle"],
@@ -70,7 +70,8 @@ class Matrix:
 
         self.vector_space_elements_prime:np.ndarray = self.applyTransform(self.vector_space_elements)
 
-        self.visualize()
+        if render:
+            self.visualize()
 
 
     def applyTransform(self,vector_space_elements:np.ndarray) -> np.ndarray:
@@ -174,33 +175,40 @@ class Matrix:
             raise ValueError(f"Vector space type '{vector_space_type}' is not supported.")
 
         return vectors
-    def visualize(self) -> None:
+    @staticmethod
+    def figure_template(vector_space_type:str) -> tuple:
         """
-        Visualizes the matrix transformation.
-        with seaborn and matplotlib.
-        Returns:
-        None
+        Builds the empty two-panel figure used by visualize().
 
+        Parameters:
+        vector_space_type (str): 'rectangular' or 'circular', which decides the artists.
+
+        Returns:
+        tuple: (fig, artists), reusable across matrices through visualize(template=...).
         """
-        import os
+        # Plotting libraries are imported on first render, keeping compute-only use light
+        from matplotlib import pyplot as plt
+
+        global _theme_set
+        if not _theme_set:
+            # The theme is global matplotlib state, set once for all later templates
+            import seaborn as sns
+            sns.set_theme(style="darkgrid")
+            _theme_set = True
 
-        os.makedirs(os.path.dirname(self.save_path), exist_ok=True)
-        
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
-        
-        if self.vector_space_type == "rectangular":
-            ax1.scatter(self.vector_space_elements[0, :], 
-                       self.vector_space_elements[1, :], 
+        artists = {"axes": (ax1, ax2)}
+        empty = np.empty((0, 2))
+
+        if vector_space_type == "rectangular":
+            artists["original_points"] = ax1.scatter(empty[:, 0], empty[:, 1],
                        c='blue', s=50, alpha=0.8, label='Original Vectors', edgecolors='navy', linewidth=0.5)
         else:  # circular
             # For circular, show as a line
-            ax1.plot(self.vector_space_elements[0, :], 
-                    self.vector_space_elements[1, :], 
-                    'b-', linewidth=2, label='Original Circle')
-            ax1.scatter(self.vector_space_elements[0, :], 
-                       self.vector_space_elements[1, :], 
+            artists["original_line"], = ax1.plot([], [], 'b-', linewidth=2, label='Original Circle')
+            artists["original_points"] = ax1.scatter(empty[:, 0], empty[:, 1],
                        c='blue', s=30, alpha=0.8, edgecolors='navy', linewidth=0.5)
-        
+
         # Add basis vectors to original space
         # Standard basis vectors: e1 = [1,0], e2 = [0,1]
         ax1.arrow(0, 0, 1, 0, head_width=0.05, head_length=0.08, fc='green', ec='green', linewidth=3, label='$\hat{i}$')
@@ -212,28 +220,20 @@ class Matrix:
         ax1.grid(True, alpha=0.3)
         ax1.set_aspect('equal')
         ax1.legend()
-        
+
         # Transformed vector space (right plot)
-        if self.vector_space_type == "rectangular":
-            ax2.scatter(self.vector_space_elements_prime[0, :], 
-                       self.vector_space_elements_prime[1, :], 
+        if vector_space_type == "rectangular":
+            artists["transformed_points"] = ax2.scatter(empty[:, 0], empty[:, 1],
                        c='red', s=50, alpha=0.8, label='Transformed Vectors', edgecolors='darkred', linewidth=0.5)
         else:  # circular
-            ax2.plot(self.vector_space_elements_prime[0, :], 
-                    self.vector_space_elements_prime[1, :], 
-                    'r-', linewidth=2, label='Transformed Circle')
-            ax2.scatter(self.vector_space_elements_prime[0, :], 
-                       self.vector_space_elements_prime[1, :], 
+            artists["transformed_line"], = ax2.plot([], [], 'r-', linewidth=2, label='Transformed Circle')
+            artists["transformed_points"] = ax2.scatter(empty[:, 0], empty[:, 1],
                        c='red', s=30, alpha=0.8, edgecolors='darkred', linewidth=0.5)
-        
-        # Add transformed basis vectors
-        # Transform the basis vectors: A*e1 and A*e2
-        transformed_e1 = self.Matrix @ np.array([1, 0])  # First column of matrix
-        transformed_e2 = self.Matrix @ np.array([0, 1])  # Second column of matrix
-        
-        ax2.arrow(0, 0, transformed_e1[0], transformed_e1[1], 
+
+        # Transformed basis vectors, their direction is set per matrix
+        artists["transformed_e1"] = ax2.arrow(0, 0, 1, 0,
                  head_width=0.05, head_length=0.08, fc='green', ec='green', linewidth=3, label="$A·\hat{i}$")
-        ax2.arrow(0, 0, transformed_e2[0], transformed_e2[1], 
+        artists["transformed_e2"] = ax2.arrow(0, 0, 0, 1,
                  head_width=0.05, head_length=0.08, fc='orange', ec='orange', linewidth=3, label="$A·\hat{j}$")
 
         ax2.set_title('Transformed Vector Space', fontsize=14, fontweight='bold')
@@ -242,23 +242,77 @@ class Matrix:
         ax2.grid(True, alpha=0.3)
         ax2.set_aspect('equal')
         ax2.legend()
-        
+
+        artists["title"] = fig.suptitle("", fontsize=16, fontweight='bold', fontfamily='monospace')
+        return fig, artists
+
+    def draw(self, template:tuple):
+        """
+        Puts this matrix and its vector spaces into a figure from figure_template().
+
+        Returns:
+        matplotlib.figure.Figure: The updated figure.
+        """
+        fig, artists = template
+        ax1, ax2 = artists["axes"]
+        for ax, points, prefix in ((ax1, self.vector_space_elements, "original"),
+                                   (ax2, self.vector_space_elements_prime, "transformed")):
+            artists[f"{prefix}_points"].set_offsets(points.T)
+            if f"{prefix}_line" in artists:
+                artists[f"{prefix}_line"].set_data(points[0, :], points[1, :])
+
+        # Add transformed basis vectors
+        # Transform the basis vectors: A*e1 and A*e2
+        transformed_e1 = self.Matrix @ np.array([1, 0])  # First column of matrix
+        transformed_e2 = self.Matrix @ np.array([0, 1])  # Second column of matrix
+        artists["transformed_e1"].set_data(dx=transformed_e1[0], dy=transformed_e1[1])
+        artists["transformed_e2"].set_data(dx=transformed_e2[0], dy=transformed_e2[1])
+
+        # Scatter collections are not part of relim(), add their points explicitly
+        for ax, points in ((ax1, self.vector_space_elements), (ax2, self.vector_space_elements_prime)):
+            ax.relim()
+            ax.update_datalim(points.T)
+            ax.autoscale_view()
+
         # Create main title with matrix information
         matrix_str = f"⎡{self.Matrix[0,0]:8.3f}  {self.Matrix[0,1]:8.3f}⎤\n⎣{self.Matrix[1,0]:8.3f}  {self.Matrix[1,1]:8.3f}⎦"
-        
-        fig.suptitle(f"{self.type.capitalize()} Transformation\n" +
+
+        artists["title"].set_text(f"{self.type.capitalize()} Transformation\n" +
                     f"Transformation Matrix A:\n" +
-                    matrix_str + f"\ndet(A) = {self.determinant:.3f}", 
-                    fontsize=16, fontweight='bold', fontfamily='monospace')
-        
+                    matrix_str + f"\ndet(A) = {self.determinant:.3f}")
+        return fig
+
+    def visualize(self, template:tuple|None = None) -> None:
+        """
+        Visualizes the matrix transformation.
+        with seaborn and matplotlib.
+
+        Parameters:
+        template (tuple): A figure_template() for this vector space type to draw into.
+        It is kept open for the next matrix; by default a new figure is built and closed.
+        Returns:
+        None
+
+        """
+        import os
+        from matplotlib import pyplot as plt
+
+        os.makedirs(os.path.dirname(self.save_path), exist_ok=True)
+
+        reuse = template is not None
+        if not reuse:
+            template = self.figure_template(self.vector_space_type)
+        fig = self.draw(template)
+
         # Adjust layout to prevent overlap
-        plt.tight_layout()
-        plt.subplots_adjust(top=0.75)
-        
+        fig.tight_layout()
+        fig.subplots_adjust(top=0.75)
+
         # Save as PNG image
-        plt.savefig(self.save_path, dpi=300, bbox_inches='tight', 
+        fig.savefig(self.save_path, dpi=300, bbox_inches='tight', 
                    facecolor='white', edgecolor='none')
-        plt.close()
+        if not reuse:
+            plt.close(fig)
         
         print(f"Matrix transformation visualization created!")
         print(f"Type: {self.type.capitalize()} transformation")
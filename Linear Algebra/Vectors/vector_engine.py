@@ -0,0 +1,145 @@
+import numpy as np
+import os
+
+DTYPE = np.float64
+
+
+# Keys written by WriteToJsonVector (vector.cpp), in the same (std::map) order.
+JSON_KEYS:list[str] = ["Angle (radians)", "Cross Product", "Cross Product Magnitude",
+                       "Cross Product Unit", "Dot Product", "Vector A", "Vector A Length",
+                       "Vector A Unit", "Vector B", "Vector B Length", "Vector B Unit"]
+
+
+def _unit(vectors:np.ndarray, lengths:np.ndarray) -> np.ndarray:
+    # Zero-length vectors have no direction: their unit vector is defined as (0, 0, 0)
+    safe_lengths = np.where(lengths > 0, lengths, 1)
+    return np.where(lengths[:, np.newaxis] > 0, vectors / safe_lengths[:, np.newaxis], 0)
+
+
+def analyze_pairs(vec_a:np.ndarray, vec_b:np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Computes every quantity of vector.cpp for N vector pairs in one call.
+
+    The angle uses theta = atan2(|A × B|, A · B), which stays accurate for nearly
+    parallel or anti-parallel pairs where acos(A · B / (|A||B|)) loses precision.
+
+    Zero-length vectors are well defined: their unit vector is (0, 0, 0) and, since
+    both |A × B| and A · B vanish, the angle is 0. The same holds for the cross product
+    unit vector of parallel pairs.
+
+    Parameters:
+    vec_a (np.ndarray): Vectors A with shape (N, 3) or (3,).
+    vec_b (np.ndarray): Vectors B with shape (N, 3) or (3,).
+
+    Returns:
+    dict[str, np.ndarray]: Arrays keyed like vector_data.json. Vector quantities have
+    shape (N, 3) and scalar quantities shape (N,).
+
+    Raises:
+    ValueError: If the inputs are not (N, 3) arrays of the same length.
+    """
+    vec_a = np.atleast_2d(np.asarray(vec_a, dtype=DTYPE))
+    vec_b = np.atleast_2d(np.asarray(vec_b, dtype=DTYPE))
+    if vec_a.shape != vec_b.shape or vec_a.shape[-1] != 3 or vec_a.ndim != 2:
+        raise ValueError(f"Expected two (N, 3) arrays, got shapes {vec_a.shape} and {vec_b.shape}")
+
+    cross = np.cross(vec_a, vec_b)
+    dot = np.einsum("ij,ij->i", vec_a, vec_b)
+    length_a = np.sqrt(np.einsum("ij,ij->i", vec_a, vec_a))
+    length_b = np.sqrt(np.einsum("ij,ij->i", vec_b, vec_b))
+    cross_magnitude = np.sqrt(np.einsum("ij,ij->i", cross, cross))
+
+    return {
+        "Angle (radians)": np.arctan2(cross_magnitude, dot),
+        "Cross Product": cross,
+        "Cross Product Magnitude": cross_magnitude,
+        "Cross Product Unit": _unit(cross, cross_magnitude),
+        "Dot Product": dot,
+        "Vector A": vec_a,
+        "Vector A Length": length_a,
+        "Vector A Unit": _unit(vec_a, length_a),
+        "Vector B": vec_b,
+        "Vector B Length": length_b,
+        "Vector B Unit": _unit(vec_b, length_b),
+    }
+
+
+def slerp_arcs(unit_a:np.ndarray, unit_b:np.ndarray, angle:np.ndarray, n_points:int = 20) -> np.ndarray:
+    """
+    Spherical linear interpolation from unit vector A to unit vector B for N pairs.
+
+    p(t) = (sin((1 - t) * theta) * a + sin(t * theta) * b) / sin(theta)
+
+    Every arc point lies on the unit sphere at a uniform angular step, unlike re-normalized
+    linear interpolation. Pairs with sin(theta) ~ 0 (parallel, anti-parallel or zero-length)
+    have no unique great circle and fall back to the straight segment between the two.
+
+    Parameters:
+    unit_a (np.ndarray): Unit vectors A with shape (N, 3).
+    unit_b (np.ndarray): Unit vectors B with shape (N, 3).
+    angle (np.ndarray): Angles between the pairs with shape (N,).
+    n_points (int): Points per arc. Default is 20.
+
+    Returns:
+    np.ndarray: Arc points with shape (N, n_points, 3).
+    """
+    unit_a = np.atleast_2d(unit_a)[:, np.newaxis, :]
+    unit_b = np.atleast_2d(unit_b)[:, np.newaxis, :]
+    theta = np.atleast_1d(angle)[:, np.newaxis, np.newaxis]
+    t = np.linspace(0, 1, n_points)[np.newaxis, :, np.newaxis]
+
+    sin_theta = np.sin(theta)
+    great_circle = np.abs(sin_theta) > 1e-9
+    safe_sin_theta = np.where(great_circle, sin_theta, 1)
+    weight_a = np.where(great_circle, np.sin((1 - t) * theta) / safe_sin_theta, 1 - t)
+    weight_b = np.where(great_circle, np.sin(t * theta) / safe_sin_theta, t)
+    return weight_a * unit_a + weight_b * unit_b
+
+
+def pair_record(result:dict[str, np.ndarray], index:int = 0) -> dict[str, list[float]]:
+    """
+    Extracts one pair of an analyze_pairs result in the vector_data.json layout.
+
+    Scalars are stored as one-element lists, like vector.cpp does.
+
+    Parameters:
+    result (dict): Output of analyze_pairs.
+    index (int): Which pair to extract. Default is 0.
+
+    Returns:
+    dict[str, list[float]]: The record, ready for VectorVisualizer or json.dump.
+    """
+    return {key: np.atleast_1d(result[key][index]).tolist() for key in JSON_KEYS}
+
+
+def write_vector_json(result:dict[str, np.ndarray], json_path:str|os.PathLike, index:int = 0) -> None:
+    """
+    Writes one pair to disk exactly as WriteToJsonVector does (sorted keys, 6 decimals).
+
+    vector.cpp computes in float, so values are rounded to float32 before formatting;
+    the text then matches vector_data.json even where the double result rounds the
+    other way (e.g. the cross product magnitude 14.696939).
+
+    Parameters:
+    result (dict): Output of analyze_pairs.
+    json_path (str | os.PathLike): Destination file.
+    index (int): Which pair to write. Default is 0.
+    """
+    record = pair_record(result, index)
+    lines = [f'  "{key}": [' + ", ".join(f"{value:.6f}" for value in np.float32(record[key]).tolist()) + "]"
+             for key in JSON_KEYS]
+    with open(json_path, "w") as f:
+        f.write("{\n" + ",\n".join(lines) + "\n}\n")
+
+
+if __name__ == "__main__":
+    # Same pair as vector.cpp main()
+    result = analyze_pairs([1, 2, 3], [5, 4, 3])
+    for key, value in pair_record(result).items():
+        print(f"{key}: {value}")
+
+    rng = np.random.default_rng()
+    vec_a = rng.normal(size=(1_000_000, 3))
+    vec_b = rng.normal(size=(1_000_000, 3))
+    result = analyze_pairs(vec_a, vec_b)
+    print(f"Analyzed {vec_a.shape[0]} pairs, mean angle: {np.degrees(result['Angle (radians)'].mean()):.2f}°")
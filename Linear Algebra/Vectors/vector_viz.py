@@ -1,17 +1,82 @@
 import matplotlib.pyplot as plt
+from matplotlib.lines import Line2D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
 import numpy as np
 import os 
 
+from vector_engine import slerp_arcs
+
+DTYPE = np.float64
+
+
+def wedge_triangles(arcs:np.ndarray) -> np.ndarray:
+    """
+    Triangle fan from the origin over each arc: (origin, arc[i], arc[i+1]).
+
+    Parameters:
+    arcs (np.ndarray): Scaled arc points with shape (N, n_points, 3).
+
+    Returns:
+    np.ndarray: Triangles with shape (N * (n_points - 1), 3, 3).
+    """
+    starts = arcs[:, :-1]
+    ends = arcs[:, 1:]
+    origins = np.zeros_like(starts)
+    return np.stack([origins, starts, ends], axis=2).reshape(-1, 3, 3)
+
+
+def draw_vector_pairs(ax, vec_a:np.ndarray, vec_b:np.ndarray, vec_cross:np.ndarray,
+                      arcs:np.ndarray, arrow_length_ratio:float = 0.1, linewidth:float = 3):
+    """
+    Draws N vector pairs with a constant number of artists: one quiver for all arrows,
+    one Line3DCollection for all angle arcs and one Poly3DCollection for all wedges.
+
+    Parameters:
+    ax: A 3D matplotlib axis.
+    vec_a, vec_b, vec_cross (np.ndarray): Vectors with shape (N, 3).
+    arcs (np.ndarray): Scaled arc points with shape (N, n_points, 3).
+
+    Returns:
+    tuple: The quiver, arc and wedge collections.
+    """
+    n_pairs = vec_a.shape[0]
+    vectors = np.concatenate([vec_a, vec_b, vec_cross])
+    origins = np.zeros_like(vectors)
+    colors = np.repeat(np.array(['blue', 'green', 'purple']), n_pairs)
+    # Axes3D.quiver emits the shafts, then the left heads, then the right heads
+    arrows = ax.quiver(origins[:, 0], origins[:, 1], origins[:, 2],
+                       vectors[:, 0], vectors[:, 1], vectors[:, 2],
+                       colors=np.tile(colors, 3), arrow_length_ratio=arrow_length_ratio,
+                       linewidth=linewidth)
+
+    arc_lines = Line3DCollection(arcs, colors='red', linewidths=linewidth + 1, alpha=0.9)
+    ax.add_collection3d(arc_lines)
+
+    wedges = Poly3DCollection(wedge_triangles(arcs), facecolors='red', edgecolors='none', alpha=0.4)
+    ax.add_collection3d(wedges)
+
+    return arrows, arc_lines, wedges
+
+
 class VectorVisualizer:
-    def __init__(self, json_path:str|os.PathLike):
+    def __init__(self, json_path:str|os.PathLike|None = None, data:dict|None = None):
+        if data is not None:
+            self.data = data
+            return
         import json
         with open(json_path, 'r') as f:
             self.data = json.load(f)
+
+    @classmethod
+    def from_vectors(cls, vec_a, vec_b, index:int = 0):
+        """Builds the visualizer straight from vectors, without running vector.cpp."""
+        from vector_engine import analyze_pairs, pair_record
+        return cls(data=pair_record(analyze_pairs(vec_a, vec_b), index))
         
-    def plot_vectors(self):
-        vec_a = np.array(self.data["Vector A"])
-        vec_b = np.array(self.data["Vector B"])
-        vec_cross = np.array(self.data["Cross Product"])
+    def plot_vectors(self, save_path:str|os.PathLike = "images/vector_visualization.png", n_points:int = 20):
+        vec_a = np.asarray(self.data["Vector A"], dtype=DTYPE)
+        vec_b = np.asarray(self.data["Vector B"], dtype=DTYPE)
+        vec_cross = np.asarray(self.data["Cross Product"], dtype=DTYPE)
         
         # Extract all metadata from JSON (no calculations)
         length_a = self.data["Vector A Length"][0]
@@ -21,54 +86,25 @@ class VectorVisualizer:
         angle_rad = self.data["Angle (radians)"][0]
         angle_deg = angle_rad * 180.0 / np.pi  # Convert to degrees
         
-        origin = np.array([0, 0, 0])
-        
         fig = plt.figure(figsize=(12, 8))
         ax = fig.add_subplot(111, projection='3d')
         
-        # Plot vector A
-        ax.quiver(*origin, vec_a[0], vec_a[1], vec_a[2], 
-                 color='blue', label=f'Vector A: ({vec_a[0]}, {vec_a[1]}, {vec_a[2]})', 
-                 arrow_length_ratio=0.1, linewidth=3)
-        
-        # Plot vector B
-        ax.quiver(*origin, vec_b[0], vec_b[1], vec_b[2], 
-                 color='green', label=f'Vector B: ({vec_b[0]}, {vec_b[1]}, {vec_b[2]})', 
-                 arrow_length_ratio=0.1, linewidth=3)
-        
-        # Plot cross product vector
-        ax.quiver(*origin, vec_cross[0], vec_cross[1], vec_cross[2], 
-                 color='purple', label=f'A × B: ({vec_cross[0]:.1f}, {vec_cross[1]:.1f}, {vec_cross[2]:.1f})', 
-                 arrow_length_ratio=0.1, linewidth=3)
-        
-        # Create angle arc/shading using unit vectors from JSON
-        vec_a_unit = np.array(self.data["Vector A Unit"])
-        vec_b_unit = np.array(self.data["Vector B Unit"])
-        
-        # Create points for the angle arc
-        n_points = 20
-        t = np.linspace(0, 1, n_points)
-        
-        # Create arc points using spherical linear interpolation (slerp)
-        arc_points = []
-        for ti in t:
-            # Simple linear interpolation between unit vectors from JSON
-            interp_vec = (1-ti) * vec_a_unit + ti * vec_b_unit
-            interp_vec = interp_vec / np.linalg.norm(interp_vec)  # Re-normalize
-            arc_points.append(interp_vec * min(length_a, length_b) * 0.6)  # Scale based on smaller vector, more visible
-        
-        arc_points = np.array(arc_points)
-        
-        # Plot the angle arc
-        ax.plot(arc_points[:, 0], arc_points[:, 1], arc_points[:, 2], 
-               color='red', linewidth=4, alpha=0.9, label=f'Angle: {angle_deg:.1f}°')
-        
-        # Create angle shading (triangle fan from origin) - make it more substantial
-        for i in range(len(arc_points)-1):
-            # Create triangle vertices: origin, arc_point[i], arc_point[i+1]
-            triangle = np.array([origin, arc_points[i], arc_points[i+1]])
-            ax.plot_trisurf(triangle[:, 0], triangle[:, 1], triangle[:, 2], 
-                           color='red', alpha=0.4)
+        # Angle arc by slerp between the unit vectors from JSON,
+        # scaled based on the smaller vector to stay visible
+        unit_a = np.asarray(self.data["Vector A Unit"], dtype=DTYPE)
+        unit_b = np.asarray(self.data["Vector B Unit"], dtype=DTYPE)
+        arcs = slerp_arcs(unit_a, unit_b, np.array([angle_rad], dtype=DTYPE), n_points) * min(length_a, length_b) * 0.6
+        
+        # Vectors A, B, A × B, angle arc and shading
+        draw_vector_pairs(ax, vec_a[np.newaxis], vec_b[np.newaxis], vec_cross[np.newaxis], arcs)
+        
+        # Collections carry no per-item labels, so the legend uses proxy artists
+        legend_handles = [
+            Line2D([], [], color='blue', linewidth=3, label=f'Vector A: ({vec_a[0]}, {vec_a[1]}, {vec_a[2]})'),
+            Line2D([], [], color='green', linewidth=3, label=f'Vector B: ({vec_b[0]}, {vec_b[1]}, {vec_b[2]})'),
+            Line2D([], [], color='purple', linewidth=3, label=f'A × B: ({vec_cross[0]:.1f}, {vec_cross[1]:.1f}, {vec_cross[2]:.1f})'),
+            Line2D([], [], color='red', linewidth=4, alpha=0.9, label=f'Angle: {angle_deg:.1f}°'),
+        ]
         
         # Set axis limits based on all vector magnitudes
         max_range = max(length_a, length_b, cross_magnitude) * 1.2
@@ -107,10 +143,53 @@ class VectorVisualizer:
                  family='monospace')
         
         # Legend
-        ax.legend(loc='upper right', bbox_to_anchor=(1.0, 0.85))
+        ax.legend(handles=legend_handles, loc='upper right', bbox_to_anchor=(1.0, 0.85))
+        
+        plt.tight_layout()
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        plt.show()
+
+    @staticmethod
+    def plot_pairs(result:dict, save_path:str|os.PathLike = "images/vector_pairs.png", n_points:int = 20):
+        """
+        Renders many vector pairs in one figure.
+
+        Parameters:
+        result (dict): Output of vector_engine.analyze_pairs.
+        save_path (str | os.PathLike): Where to save the PNG.
+        n_points (int): Points per angle arc. Default is 20.
+        """
+        vec_a = result["Vector A"]
+        vec_b = result["Vector B"]
+        vec_cross = result["Cross Product"]
+        radius = np.minimum(result["Vector A Length"], result["Vector B Length"]) * 0.6
+        arcs = slerp_arcs(result["Vector A Unit"], result["Vector B Unit"],
+                          result["Angle (radians)"], n_points) * radius[:, np.newaxis, np.newaxis]
+        
+        fig = plt.figure(figsize=(12, 8))
+        ax = fig.add_subplot(111, projection='3d')
+        draw_vector_pairs(ax, vec_a, vec_b, vec_cross, arcs, arrow_length_ratio=0.05, linewidth=1)
+        
+        max_range = max(result["Vector A Length"].max(), result["Vector B Length"].max(),
+                        result["Cross Product Magnitude"].max()) * 1.2
+        ax.set_xlim([-max_range, max_range])
+        ax.set_ylim([-max_range, max_range])
+        ax.set_zlim([-max_range, max_range])
+        
+        ax.set_xlabel('X axis')
+        ax.set_ylabel('Y axis')
+        ax.set_zlabel('Z axis')
+        ax.grid(True, alpha=0.3)
+        ax.set_title(f'3D Vector Analysis: {vec_a.shape[0]} pairs', fontsize=14, fontweight='bold', pad=20)
+        
+        ax.legend(handles=[Line2D([], [], color='blue', label='Vectors A'),
+                           Line2D([], [], color='green', label='Vectors B'),
+                           Line2D([], [], color='purple', label='A × B'),
+                           Line2D([], [], color='red', label='Angles')],
+                  loc='upper right')
         
         plt.tight_layout()
-        plt.savefig("images/vector_visualization.png", dpi=300, bbox_inches='tight')
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
         plt.show()
 
 if __name__ == "__main__":
@@ -0,0 +1,176 @@
+import numpy as np
+
+DTYPE = np.float64
+
+
+def collision(m1, v1, m2, v2, k) -> dict[str, np.ndarray]:
+    """
+    Perfectly inelastic collision followed by harmonic oscillation, vectorized.
+
+    Mirrors ProjectileSpringBlock::Collision in main.cpp, plus the period and frequency
+    computed in its constructor. All parameters broadcast against each other.
+
+    Parameters:
+    m1, v1: Mass (kg) and velocity (m/s) of the projectile.
+    m2, v2: Mass (kg) and velocity (m/s) of the block.
+    k: Spring constant (N/m).
+
+    Returns:
+    dict[str, np.ndarray]: system_info quantities keyed like the JSON output.
+    """
+    m1, v1, m2, v2, k = np.broadcast_arrays(*(np.asarray(p, dtype=DTYPE) for p in (m1, v1, m2, v2, k)))
+
+    # vf = (m1v1 + m2v2) / (m1+m2)
+    velocity_at_collision = (m1 * v1 + m2 * v2) / (m1 + m2)
+    kinectic_energy = ((m1 + m2) * velocity_at_collision**2) / 2
+    amplitude = np.sqrt(2 * kinectic_energy / k)
+    w = np.sqrt(k / (m1 + m2))
+    period = 2.0 * np.pi / w
+
+    return {
+        "Amplitude": amplitude,
+        "frequency": 1.0 / period,
+        "k": k,
+        "kinectic_energy": kinectic_energy,
+        "mass": m1 + m2,
+        "period": period,
+        "system_velocity_at_collision": velocity_at_collision,
+        "w": w,
+    }
+
+
+def oscillate(amplitude, w, mass, k, time:np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Samples x = A cos(wt) and its derivatives and energies at the given times.
+
+    Mirrors ProjectileSpringBlock::Oscillate. Parameters broadcast against time, so
+    passing column vectors evaluates many runs at once.
+
+    Returns:
+    dict[str, np.ndarray]: oscillation_info columns keyed like the JSON output.
+    """
+    x = amplitude * np.cos(w * time)
+    v = -w * amplitude * np.sin(w * time)
+    a = -w**2 * amplitude * np.cos(w * time)
+
+    kinetic_energy = (mass * v**2) / 2
+    potential_energy = (k * x**2) / 2
+
+    return {
+        "acceleration": a,
+        "kinetic_energy": kinetic_energy,
+        "position": x,
+        "potential_energy": potential_energy,
+        "time": np.broadcast_to(time, x.shape),
+        "total_energy": kinetic_energy + potential_energy,
+        "velocity": v,
+    }
+
+
+def damped_driven(amplitude, w, mass, k, time:np.ndarray, damping=0.0, drive_force=0.0, drive_w=None) -> dict[str, np.ndarray]:
+    """
+    Samples the underdamped, sinusoidally driven oscillator at the given times.
+
+    Solves x'' + 2 damping x' + w² x = (drive_force / mass) cos(drive_w t) with the same
+    start as oscillate(), x(0) = A and v(0) = 0: a decaying transient plus the steady
+    state response. With damping = drive_force = 0 it reduces to oscillate().
+    Parameters broadcast against time.
+
+    Parameters:
+    amplitude, w, mass, k: As in oscillate().
+    damping: Damping rate gamma (1/s), below w.
+    drive_force: Amplitude of the driving force (N).
+    drive_w: Angular frequency of the drive (rad/s), defaults to w.
+
+    Returns:
+    dict[str, np.ndarray]: oscillation_info columns keyed like the JSON output.
+
+    Raises:
+    ValueError: If the damping is not below w, or the drive is undamped at resonance.
+    """
+    drive_w = w if drive_w is None else drive_w
+    if np.any(np.asarray(damping) >= w):
+        raise ValueError("Only underdamped oscillators are supported (damping < w)")
+    detuning = w**2 - drive_w**2
+    response = np.sqrt(detuning**2 + (2 * damping * drive_w)**2)
+    if np.any((response == 0) & (np.asarray(drive_force) != 0)):
+        raise ValueError("An undamped oscillator driven at resonance has no bounded solution")
+
+    # Steady state R cos(drive_w t - delta)
+    steady = np.divide(drive_force / mass, response, out=np.zeros(np.broadcast(response, drive_force, mass).shape),
+                       where=response != 0)
+    delta = np.arctan2(2 * damping * drive_w, detuning)
+    # Transient e^(-damping t) (c1 cos(w1 t) + c2 sin(w1 t)) matching x(0) = A, v(0) = 0
+    w1 = np.sqrt(w**2 - damping**2)
+    c1 = amplitude - steady * np.cos(delta)
+    c2 = (damping * c1 - steady * drive_w * np.sin(delta)) / w1
+
+    decay = np.exp(-damping * time)
+    cos_t, sin_t = np.cos(w1 * time), np.sin(w1 * time)
+    drive_phase = drive_w * time - delta
+    x = decay * (c1 * cos_t + c2 * sin_t) + steady * np.cos(drive_phase)
+    v = (decay * ((w1 * c2 - damping * c1) * cos_t - (w1 * c1 + damping * c2) * sin_t)
+         - steady * drive_w * np.sin(drive_phase))
+    a = drive_force / mass * np.cos(drive_w * time) - 2 * damping * v - w**2 * x
+
+    kinetic_energy = (mass * v**2) / 2
+    potential_energy = (k * x**2) / 2
+
+    return {
+        "acceleration": a,
+        "kinetic_energy": kinetic_energy,
+        "position": x,
+        "potential_energy": potential_energy,
+        "time": np.broadcast_to(time, x.shape),
+        "total_energy": kinetic_energy + potential_energy,
+        "velocity": v,
+    }
+
+
+def simulate_oscillator(m1:float = 2.0, v1:float = 10.0, m2:float = 1.0, v2:float = 0.0, k:float = 50.0,
+                        num_cycles:int = 5, samples_per_cycle:int = 20, damping:float = 0.0,
+                        drive_force:float = 0.0, drive_w:float|None = None) -> dict:
+    """
+    Python port of the ProjectileSpringBlock class in main.cpp.
+
+    Returns the same "system_info"/"oscillation_info" layout that saveJson writes
+    (time series as NumPy arrays).
+
+    Parameters:
+    m1, v1 (float): Mass (kg) and velocity (m/s) of the projectile.
+    m2, v2 (float): Mass (kg) and velocity (m/s) of the block.
+    k (float): Spring constant (N/m).
+    num_cycles (int): Number of complete oscillation cycles.
+    samples_per_cycle (int): Samples per complete cycle.
+    damping, drive_force, drive_w (float): Damping rate and sinusoidal drive, see
+    damped_driven(). When set they are recorded in system_info, and cycles count drive
+    periods; the defaults reproduce main.cpp.
+
+    Returns:
+    dict: {"system_info": {...}, "oscillation_info": {...}}
+    """
+    system_info = {key: float(value) for key, value in collision(m1, v1, m2, v2, k).items()}
+    period = system_info["period"]
+    if damping or drive_force:
+        drive_w = system_info["w"] if drive_w is None else float(drive_w)
+        system_info.update(damping=float(damping), drive_force=float(drive_force), drive_w=drive_w)
+        period = 2.0 * np.pi / drive_w
+    system_info["total_time"] = num_cycles * period
+
+    delta_t = period / samples_per_cycle
+    time = (np.arange(num_cycles * samples_per_cycle) * delta_t).astype(DTYPE)
+    if damping or drive_force:
+        oscillation_info = damped_driven(system_info["Amplitude"], system_info["w"], system_info["mass"],
+                                         system_info["k"], time, damping, drive_force, drive_w)
+    else:
+        oscillation_info = oscillate(system_info["Amplitude"], system_info["w"],
+                                     system_info["mass"], system_info["k"], time)
+
+    return {"system_info": dict(sorted(system_info.items())), "oscillation_info": oscillation_info}
+
+
+if __name__ == "__main__":
+    # Same parameters as main.cpp
+    data = simulate_oscillator()
+    for key, value in data["system_info"].items():
+        print(f"{key}: {value:.6f}")
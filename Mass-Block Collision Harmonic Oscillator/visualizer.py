@@ -1,37 +1,46 @@
 import json
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 from matplotlib.patches import Rectangle, Circle
 from matplotlib.lines import Line2D
 import os
 
+DTYPE = np.float64
+
 # Load the JSON data
-def load_data():
-    with open('json_data/collision_in_mass_spring.json', 'r') as f:
+def load_data(json_path='json_data/collision_in_mass_spring.json'):
+    with open(json_path, 'r') as f:
         data = json.load(f)
     return data
 
-def create_oscillation_animation():
-    # Load data
-    data = load_data()
-    system_info = data['system_info']
-    osc_info = data['oscillation_info']
-    
-    # Extract parameters
-    mass = system_info['mass']
-    k = system_info['k']
-    amplitude = system_info['Amplitude']
-    
-    # Extract time series data (time is already in seconds)
-    time = np.array(osc_info['time'])
-    position = np.array(osc_info['position'])
-    velocity = np.array(osc_info['velocity'])
-    acceleration = np.array(osc_info['acceleration'])
-    kinetic_energy = np.array(osc_info['kinetic_energy'])
-    potential_energy = np.array(osc_info['potential_energy'])
-    total_energy = np.array(osc_info['total_energy'])
-    
+# Spring visualization parameters
+equilibrium_pos = 1.5  # Position where spring is at natural length
+spring_coils = 8
+block_size = 0.2
+
+# Create spring coordinates (zigzag pattern)
+def create_spring_coords(x_block):
+    # Spring extends from wall (x=0) to block
+    spring_x = np.linspace(0.05, x_block - block_size/2, spring_coils * 4)
+    spring_y = np.zeros_like(spring_x)
+    
+    # Create zigzag pattern
+    for i in range(1, len(spring_x) - 1):
+        if i % 4 == 1:
+            spring_y[i] = 0.1
+        elif i % 4 == 3:
+            spring_y[i] = -0.1
+    
+    return spring_x, spring_y + 0.5
+
+def build_oscillation_figure():
+    """
+    Builds the animation figure without data, for bind_oscillation_data.
+    The figure can be reused for any number of runs (see toolkit.templates).
+
+    Returns:
+    tuple: (fig, artists) where artists maps names to the axes and artists to update
+    """
     # Create figure with subplots
     fig = plt.figure(figsize=(16, 12))
     
@@ -40,18 +49,21 @@ def create_oscillation_animation():
     # Bottom row: Position, Velocity, Acceleration plots
     
     # Animation subplot (top left, larger)
-    ax_anim = plt.subplot2grid((3, 3), (0, 0), colspan=2, rowspan=1)
+    ax_anim = plt.subplot2grid((3, 3), (0, 0), colspan=2, rowspan=1, fig=fig)
     
     # Energy plot (top right)
-    ax_energy = plt.subplot2grid((3, 3), (0, 2), rowspan=1)
+    ax_energy = plt.subplot2grid((3, 3), (0, 2), rowspan=1, fig=fig)
     
     # Bottom row plots
-    ax_pos = plt.subplot2grid((3, 3), (1, 0), rowspan=1)
-    ax_vel = plt.subplot2grid((3, 3), (1, 1), rowspan=1)
-    ax_acc = plt.subplot2grid((3, 3), (1, 2), rowspan=1)
+    ax_pos = plt.subplot2grid((3, 3), (1, 0), rowspan=1, fig=fig)
+    ax_vel = plt.subplot2grid((3, 3), (1, 1), rowspan=1, fig=fig)
+    ax_acc = plt.subplot2grid((3, 3), (1, 2), rowspan=1, fig=fig)
     
     # Additional plot for total energy verification
-    ax_total = plt.subplot2grid((3, 3), (2, 0), colspan=3, rowspan=1)
+    ax_total = plt.subplot2grid((3, 3), (2, 0), colspan=3, rowspan=1, fig=fig)
+    
+    artists = {"ax_energy": ax_energy, "ax_pos": ax_pos, "ax_vel": ax_vel,
+               "ax_acc": ax_acc, "ax_total": ax_total}
     
     # Set up animation subplot
     ax_anim.set_xlim(-0.5, 3.5)
@@ -60,42 +72,22 @@ def create_oscillation_animation():
     ax_anim.set_title('Block-Spring Oscillation Animation', fontsize=14, fontweight='bold')
     ax_anim.grid(True, alpha=0.3)
     
-    # Spring visualization parameters
-    equilibrium_pos = 1.5  # Position where spring is at natural length
-    spring_coils = 8
-    block_size = 0.2
-    
-    # Create spring coordinates (zigzag pattern)
-    def create_spring_coords(x_block):
-        # Spring extends from wall (x=0) to block
-        spring_x = np.linspace(0.05, x_block - block_size/2, spring_coils * 4)
-        spring_y = np.zeros_like(spring_x)
-        
-        # Create zigzag pattern
-        for i in range(1, len(spring_x) - 1):
-            if i % 4 == 1:
-                spring_y[i] = 0.1
-            elif i % 4 == 3:
-                spring_y[i] = -0.1
-        
-        return spring_x, spring_y + 0.5
-    
     # Initialize animation elements
     wall = Rectangle((-0.1, 0.3), 0.1, 0.4, facecolor='gray', edgecolor='black')
     ax_anim.add_patch(wall)
     
-    block = Rectangle((0, 0.4), block_size, block_size, facecolor='red', edgecolor='black')
-    ax_anim.add_patch(block)
+    artists["block"] = Rectangle((0, 0.4), block_size, block_size, facecolor='red', edgecolor='black')
+    ax_anim.add_patch(artists["block"])
     
-    spring_line, = ax_anim.plot([], [], 'b-', linewidth=2, label='Spring')
+    artists["spring"], = ax_anim.plot([], [], 'b-', linewidth=2, label='Spring')
     
     # Add equilibrium line
     ax_anim.axvline(x=equilibrium_pos, color='green', linestyle='--', alpha=0.5, label='Equilibrium')
     
     # Info text
-    info_text = ax_anim.text(0.02, 0.98, '', transform=ax_anim.transAxes, 
-                            verticalalignment='top', fontsize=10,
-                            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+    artists["info"] = ax_anim.text(0.02, 0.98, '', transform=ax_anim.transAxes, 
+                                   verticalalignment='top', fontsize=10,
+                                   bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
     
     ax_anim.legend(loc='upper right')
     
@@ -105,57 +97,98 @@ def create_oscillation_animation():
     ax_energy.set_ylabel('Energy (J)')
     ax_energy.grid(True, alpha=0.3)
     
-    ke_line, = ax_energy.plot([], [], 'r-', linewidth=2, label='Kinetic Energy')
-    pe_line, = ax_energy.plot([], [], 'b-', linewidth=2, label='Potential Energy')
-    te_line, = ax_energy.plot([], [], 'g-', linewidth=2, label='Total Energy')
-    energy_point, = ax_energy.plot([], [], 'ko', markersize=8)
+    artists["ke"], = ax_energy.plot([], [], 'r-', linewidth=2, label='Kinetic Energy')
+    artists["pe"], = ax_energy.plot([], [], 'b-', linewidth=2, label='Potential Energy')
+    artists["te"], = ax_energy.plot([], [], 'g-', linewidth=2, label='Total Energy')
+    artists["energy_point"], = ax_energy.plot([], [], 'ko', markersize=8)
     
     ax_energy.legend()
-    ax_energy.set_xlim(0, max(time))
-    ax_energy.set_ylim(0, max(total_energy) * 1.1)
     
     # Set up position plot
     ax_pos.set_title('Position vs Time', fontweight='bold')
     ax_pos.set_xlabel('Time (s)')
     ax_pos.set_ylabel('Position (m)')
     ax_pos.grid(True, alpha=0.3)
-    pos_line, = ax_pos.plot([], [], 'b-', linewidth=2)
-    pos_point, = ax_pos.plot([], [], 'ro', markersize=8)
-    ax_pos.set_xlim(0, max(time))
-    ax_pos.set_ylim(min(position) * 1.1, max(position) * 1.1)
+    artists["pos"], = ax_pos.plot([], [], 'b-', linewidth=2)
+    artists["pos_point"], = ax_pos.plot([], [], 'ro', markersize=8)
     
     # Set up velocity plot
     ax_vel.set_title('Velocity vs Time', fontweight='bold')
     ax_vel.set_xlabel('Time (s)')
     ax_vel.set_ylabel('Velocity (m/s)')
     ax_vel.grid(True, alpha=0.3)
-    vel_line, = ax_vel.plot([], [], 'r-', linewidth=2)
-    vel_point, = ax_vel.plot([], [], 'ro', markersize=8)
-    ax_vel.set_xlim(0, max(time))
-    ax_vel.set_ylim(min(velocity) * 1.1, max(velocity) * 1.1)
+    artists["vel"], = ax_vel.plot([], [], 'r-', linewidth=2)
+    artists["vel_point"], = ax_vel.plot([], [], 'ro', markersize=8)
     
     # Set up acceleration plot
     ax_acc.set_title('Acceleration vs Time', fontweight='bold')
     ax_acc.set_xlabel('Time (s)')
     ax_acc.set_ylabel('Acceleration (m/s²)')
     ax_acc.grid(True, alpha=0.3)
-    acc_line, = ax_acc.plot([], [], 'g-', linewidth=2)
-    acc_point, = ax_acc.plot([], [], 'ro', markersize=8)
-    ax_acc.set_xlim(0, max(time))
-    ax_acc.set_ylim(min(acceleration) * 1.1, max(acceleration) * 1.1)
+    artists["acc"], = ax_acc.plot([], [], 'g-', linewidth=2)
+    artists["acc_point"], = ax_acc.plot([], [], 'ro', markersize=8)
     
     # Set up total energy verification plot
     ax_total.set_title('Energy Conservation Verification', fontweight='bold')
     ax_total.set_xlabel('Time (s)')
     ax_total.set_ylabel('Energy (J)')
     ax_total.grid(True, alpha=0.3)
-    ax_total.plot(time, kinetic_energy, 'r-', linewidth=2, label='Kinetic Energy', alpha=0.7)
-    ax_total.plot(time, potential_energy, 'b-', linewidth=2, label='Potential Energy', alpha=0.7)
-    ax_total.plot(time, total_energy, 'g-', linewidth=2, label='Total Energy', alpha=0.7)
-    total_point, = ax_total.plot([], [], 'ko', markersize=8)
+    artists["total_ke"], = ax_total.plot([], [], 'r-', linewidth=2, label='Kinetic Energy', alpha=0.7)
+    artists["total_pe"], = ax_total.plot([], [], 'b-', linewidth=2, label='Potential Energy', alpha=0.7)
+    artists["total_te"], = ax_total.plot([], [], 'g-', linewidth=2, label='Total Energy', alpha=0.7)
+    artists["total_point"], = ax_total.plot([], [], 'ko', markersize=8)
     ax_total.legend()
-    ax_total.set_xlim(0, max(time))
-    ax_total.set_ylim(0, max(total_energy) * 1.1)
+    
+    return fig, artists
+
+def bind_oscillation_data(template, data):
+    """
+    Puts one run into a figure from build_oscillation_figure.
+
+    Parameters:
+    template (tuple): (fig, artists) from build_oscillation_figure
+    data (dict): The run in the collision_in_mass_spring.json layout
+
+    Returns:
+    tuple: (animate, frames) for FuncAnimation
+    """
+    fig, artists = template
+    osc_info = data['oscillation_info']
+    
+    # Extract time series data (time is already in seconds)
+    time = np.asarray(osc_info['time'], dtype=DTYPE)
+    position = np.asarray(osc_info['position'], dtype=DTYPE)
+    velocity = np.asarray(osc_info['velocity'], dtype=DTYPE)
+    acceleration = np.asarray(osc_info['acceleration'], dtype=DTYPE)
+    kinetic_energy = np.asarray(osc_info['kinetic_energy'], dtype=DTYPE)
+    potential_energy = np.asarray(osc_info['potential_energy'], dtype=DTYPE)
+    total_energy = np.asarray(osc_info['total_energy'], dtype=DTYPE)
+    
+    # Limits follow the run
+    artists["ax_energy"].set_xlim(0, max(time))
+    artists["ax_energy"].set_ylim(0, max(total_energy) * 1.1)
+    artists["ax_pos"].set_xlim(0, max(time))
+    artists["ax_pos"].set_ylim(min(position) * 1.1, max(position) * 1.1)
+    artists["ax_vel"].set_xlim(0, max(time))
+    artists["ax_vel"].set_ylim(min(velocity) * 1.1, max(velocity) * 1.1)
+    artists["ax_acc"].set_xlim(0, max(time))
+    artists["ax_acc"].set_ylim(min(acceleration) * 1.1, max(acceleration) * 1.1)
+    artists["ax_total"].set_xlim(0, max(time))
+    artists["ax_total"].set_ylim(0, max(total_energy) * 1.1)
+    
+    artists["total_ke"].set_data(time, kinetic_energy)
+    artists["total_pe"].set_data(time, potential_energy)
+    artists["total_te"].set_data(time, total_energy)
+    
+    block = artists["block"]
+    spring_line = artists["spring"]
+    info_text = artists["info"]
+    ke_line, pe_line, te_line = artists["ke"], artists["pe"], artists["te"]
+    energy_point = artists["energy_point"]
+    pos_line, pos_point = artists["pos"], artists["pos_point"]
+    vel_line, vel_point = artists["vel"], artists["vel_point"]
+    acc_line, acc_point = artists["acc"], artists["acc_point"]
+    total_point = artists["total_point"]
     
     # Animation function
     def animate(frame):
@@ -209,20 +242,34 @@ def create_oscillation_animation():
         return (block, spring_line, info_text, ke_line, pe_line, te_line, energy_point,
                 pos_line, pos_point, vel_line, vel_point, acc_line, acc_point, total_point)
     
+    return animate, len(time)
+
+def create_oscillation_animation(json_path='json_data/collision_in_mass_spring.json',
+                                 filename_base='block_spring_oscillation', data=None, show=True):
+    import matplotlib.animation as animation
+
+    # Load data (unless an already loaded run is given, e.g. from toolkit.store)
+    if data is None:
+        data = load_data(json_path)
+    
+    template = build_oscillation_figure()
+    fig = template[0]
+    animate, frames = bind_oscillation_data(template, data)
+    
     # Create animation
-    anim = animation.FuncAnimation(fig, animate, frames=len(time), 
+    anim = animation.FuncAnimation(fig, animate, frames=frames, 
                                  interval=200, blit=False, repeat=True)
     
     plt.tight_layout()
     
     # Save as GIF
     print("Saving animation as GIF...")
-    anim.save('block_spring_oscillation.gif', writer='pillow', fps=5, dpi=100)
+    anim.save(f'{filename_base}.gif', writer='pillow', fps=5, dpi=100)
     
     # Save as MP4 (requires ffmpeg)
     try:
         print("Saving animation as MP4...")
-        anim.save('block_spring_oscillation.mp4', writer='ffmpeg', fps=5, dpi=100)
+        anim.save(f'{filename_base}.mp4', writer='ffmpeg', fps=5, dpi=100)
         print("MP4 saved successfully!")
     except Exception as e:
         print(f"Could not save MP4: {e}")
@@ -231,7 +278,8 @@ def create_oscillation_animation():
     print("GIF saved successfully!")
     
     # Show the animation
-    plt.show()
+    if show:
+        plt.show()
     
     return anim
 
@@ -0,0 +1,125 @@
+import numpy as np
+
+DTYPE = np.float64
+
+
+def projectile_summary(v, v_angle, a_ox=0.0, a_oy=-9.81, s_ox=0.0, s_oy=0.0, mass=1.0) -> dict[str, np.ndarray]:
+    """
+    Closed-form projectile quantities of main.cpp, vectorized over launches.
+
+    All parameters broadcast against each other, so a whole grid or sample of
+    launches is evaluated in one call.
+
+    Parameters:
+    v: Initial velocity magnitude (m/s).
+    v_angle: Launch angle (radians).
+    a_ox, a_oy: Constant accelerations (m/s²).
+    s_ox, s_oy: Initial position (m).
+    mass: Mass of the projectile (kg).
+
+    Returns:
+    dict[str, np.ndarray]: apogee_time, total_time, h_max, range (x at total_time),
+    landing_x, energy_initial, energy_final, energy_loss and angle_of_collapse (degrees).
+    """
+    v, v_angle, a_ox, a_oy, s_ox, s_oy, mass = np.broadcast_arrays(
+        *(np.asarray(p, dtype=DTYPE) for p in (v, v_angle, a_ox, a_oy, s_ox, s_oy, mass)))
+
+    v_ox = v * np.cos(v_angle)
+    v_oy = v * np.sin(v_angle)
+
+    # apogee time = d/dt[sy] = 0 -> -Voy / ay
+    apogee_time = -v_oy / a_oy
+    total_time = 2 * apogee_time
+    h_max = s_oy + v_oy * apogee_time + (a_oy * apogee_time**2) / 2
+
+    landing_x = s_ox + v_ox * total_time + (a_ox * total_time**2) / 2
+    landing_y = s_oy + v_oy * total_time + (a_oy * total_time**2) / 2
+    vx_final = v_ox + a_ox * total_time
+    vy_final = v_oy + a_oy * total_time
+
+    energy_initial = mass * (v_ox**2 + v_oy**2) / 2
+    energy_final = mass * (vx_final**2 + vy_final**2) / 2 + mass * (-a_oy) * landing_y
+
+    return {
+        "apogee_time": apogee_time,
+        "total_time": total_time,
+        "h_max": h_max,
+        "range": landing_x - s_ox,
+        "landing_x": landing_x,
+        "energy_initial": energy_initial,
+        "energy_final": energy_final,
+        "energy_loss": 1 - energy_final / energy_initial,
+        "angle_of_collapse": np.degrees(np.arctan2(vy_final, vx_final)),
+    }
+
+
+def simulate_projectile(s_ox:float = 0.0, s_oy:float = 0.0, v:float = 65.0, v_angle:float = np.pi / 4,
+                        a_ox:float = 0.0, a_oy:float = -9.81, mass:float = 1.0,
+                        data_points_per_sec:int = 100) -> dict:
+    """
+    Python port of the ProjectileMotion class in main.cpp.
+
+    Samples data_points_per_sec + 1 points from t = 0 to the landing time, like the
+    C++ sample() loop, and returns the same "metadata"/"time_series" layout that
+    save_to_json writes (time series as NumPy arrays).
+
+    Parameters:
+    s_ox, s_oy (float): Initial position (m).
+    v (float): Initial velocity magnitude (m/s).
+    v_angle (float): Launch angle (radians).
+    a_ox, a_oy (float): Constant accelerations (m/s²).
+    mass (float): Mass of the projectile (kg).
+    data_points_per_sec (int): Number of sampling steps over the flight.
+
+    Returns:
+    dict: {"metadata": {...}, "time_series": {...}}
+    """
+    v_ox = v * np.cos(v_angle)
+    v_oy = v * np.sin(v_angle)
+
+    apogee_time = -v_oy / a_oy
+    total_time = 2 * apogee_time
+    delta_t = total_time / data_points_per_sec
+
+    time = np.arange(data_points_per_sec + 1) * delta_t
+    position_x = s_ox + v_ox * time + (a_ox * time**2) / 2
+    position_y = s_oy + v_oy * time + (a_oy * time**2) / 2
+    velocity_x = v_ox + a_ox * time
+    velocity_y = v_oy + a_oy * time
+
+    energy_initial = mass * (v_ox**2 + v_oy**2) / 2
+    energy_final = (mass * (velocity_x[-1]**2 + velocity_y[-1]**2) / 2
+                    + mass * (-a_oy) * position_y[-1])
+
+    metadata = {
+        "total_time": float(total_time),
+        "delta_t": float(delta_t),
+        "apogee_time": float(apogee_time),
+        "h_max": float(s_oy + v_oy * apogee_time + (a_oy * apogee_time**2) / 2),
+        "mass": float(mass),
+        "initial_acceleration_x": float(a_ox),
+        "initial_acceleration_y": float(a_oy),
+        "energy_initial": float(energy_initial),
+        "energy_final": float(energy_final),
+        "energy_loss": float(1 - energy_final / energy_initial),
+        "angle_of_collapse": float(np.degrees(np.arctan2(velocity_y[-1], velocity_x[-1]))),
+    }
+    time_series = {
+        "time": time,
+        "position_x": position_x,
+        "position_y": position_y,
+        "velocity_x": velocity_x,
+        "velocity_y": velocity_y,
+        "acceleration_x": np.full_like(time, a_ox),
+        "acceleration_y": np.full_like(time, a_oy),
+    }
+    # Sampled in float64 like the metadata, stored in the policy dtype
+    time_series = {key: values.astype(DTYPE, copy=False) for key, values in time_series.items()}
+    return {"metadata": metadata, "time_series": time_series}
+
+
+if __name__ == "__main__":
+    # Same launch as main.cpp
+    data = simulate_projectile(v=65.0, v_angle=np.pi / 4, a_ox=-3.0, a_oy=-9.81, mass=5.0)
+    for key, value in data["metadata"].items():
+        print(f"{key}: {value:.6f}")
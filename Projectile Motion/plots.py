@@ -2,27 +2,32 @@
 import json
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 from matplotlib.patches import Circle
 import os
 
+DTYPE = np.float64
+
 
 class ProjectileMotionVisualizer:
-    def __init__(self, json_file="projectile_motion_data.json", output_folder="plot_and_visualizers"):
-        with open(json_file, 'r') as f:
-            self.json_data = json.load(f)
+    def __init__(self, json_file="projectile_motion_data.json", output_folder="plot_and_visualizers", json_data=None):
+        # json_data: an already loaded run (e.g. from toolkit.store), skips reading json_file
+        if json_data is not None:
+            self.json_data = json_data
+        else:
+            with open(json_file, 'r') as f:
+                self.json_data = json.load(f)
         
-        # Extract data for convenience
-        self.time = np.array(self.json_data["time_series"]["time"])
-        self.x_pos = np.array(self.json_data["time_series"]["position_x"])
-        self.y_pos = np.array(self.json_data["time_series"]["position_y"])
-        self.x_vel = np.array(self.json_data["time_series"]["velocity_x"])
-        self.y_vel = np.array(self.json_data["time_series"]["velocity_y"])
+        # Extract data for convenience (asarray keeps memory-mapped columns of the policy dtype mapped)
+        self.time = np.asarray(self.json_data["time_series"]["time"], dtype=DTYPE)
+        self.x_pos = np.asarray(self.json_data["time_series"]["position_x"], dtype=DTYPE)
+        self.y_pos = np.asarray(self.json_data["time_series"]["position_y"], dtype=DTYPE)
+        self.x_vel = np.asarray(self.json_data["time_series"]["velocity_x"], dtype=DTYPE)
+        self.y_vel = np.asarray(self.json_data["time_series"]["velocity_y"], dtype=DTYPE)
         
         # Extract acceleration data if available
         if "acceleration_x" in self.json_data["time_series"]:
-            self.x_accel = np.array(self.json_data["time_series"]["acceleration_x"])
-            self.y_accel = np.array(self.json_data["time_series"]["acceleration_y"])
+            self.x_accel = np.asarray(self.json_data["time_series"]["acceleration_x"], dtype=DTYPE)
+            self.y_accel = np.asarray(self.json_data["time_series"]["acceleration_y"], dtype=DTYPE)
         else:
             # Calculate accelerations from velocity if not available
             self.x_accel = np.gradient(self.x_vel, self.time)
@@ -32,27 +37,47 @@ class ProjectileMotionVisualizer:
         self.metadata = self.json_data["metadata"]
         
         # Create output directory
-        self.output_dir = f"./{output_folder}"
+        self.output_dir = os.path.join(".", output_folder)
         os.makedirs(self.output_dir, exist_ok=True)
     
-    def plot_trajectory(self, save_image=True):
-        """Plot the complete trajectory"""
-        plt.figure(figsize=(12, 8))
-        plt.plot(self.x_pos, self.y_pos, 'b-', linewidth=2, label='Trajectory')
-        plt.plot(self.x_pos[0], self.y_pos[0], 'go', markersize=8, label='Start')
-        plt.plot(self.x_pos[-1], self.y_pos[-1], 'ro', markersize=8, label='End')
+    # Each figure is split into a template (figure, axes and styled artists, built
+    # once) and a draw step that only swaps data, limits and text. The plot_* and
+    # animate_* methods build a fresh template per call; toolkit.templates keeps the
+    # templates alive to render many datasets without rebuilding them.
+
+    @staticmethod
+    def trajectory_template():
+        """Empty trajectory figure, returns (fig, artists) for draw_trajectory"""
+        fig, ax = plt.subplots(figsize=(12, 8))
+        artists = {"ax": ax}
+        artists["trajectory"], = ax.plot([], [], 'b-', linewidth=2, label='Trajectory')
+        artists["start"], = ax.plot([], [], 'go', markersize=8, label='Start')
+        artists["end"], = ax.plot([], [], 'ro', markersize=8, label='End')
         
         # Mark the apogee
-        apogee_idx = np.argmax(self.y_pos)
-        plt.plot(self.x_pos[apogee_idx], self.y_pos[apogee_idx], 'o', 
-                color='orange', markersize=10, label='Apogee')
+        artists["apogee"], = ax.plot([], [], 'o', color='orange', markersize=10, label='Apogee')
+        
+        ax.set_xlabel('Horizontal Position (m)')
+        ax.set_ylabel('Vertical Position (m)')
+        ax.set_title('Projectile Motion Trajectory')
+        ax.grid(True, alpha=0.3)
+        ax.legend()
+        ax.set_aspect('equal', adjustable='datalim')
         
-        plt.xlabel('Horizontal Position (m)')
-        plt.ylabel('Vertical Position (m)')
-        plt.title('Projectile Motion Trajectory')
-        plt.grid(True, alpha=0.3)
-        plt.legend()
-        plt.axis('equal')
+        artists["info"] = ax.text(0.02, 0.98, '', transform=ax.transAxes, 
+                verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+        
+        return fig, artists
+    
+    def draw_trajectory(self, template):
+        """Put this dataset into a trajectory template"""
+        fig, artists = template
+        artists["trajectory"].set_data(self.x_pos, self.y_pos)
+        artists["start"].set_data([self.x_pos[0]], [self.y_pos[0]])
+        artists["end"].set_data([self.x_pos[-1]], [self.y_pos[-1]])
+        
+        apogee_idx = np.argmax(self.y_pos)
+        artists["apogee"].set_data([self.x_pos[apogee_idx]], [self.y_pos[apogee_idx]])
         
         # Add metadata text with all new information
         info_text = f"Max Height: {self.metadata['h_max']:.2f} m\n"
@@ -72,34 +97,33 @@ class ProjectileMotionVisualizer:
             energy_loss_percent = self.metadata['energy_loss'] * 100
             info_text += f"Energy Loss: {energy_loss_percent:.2f}%"
         
-        plt.text(0.02, 0.98, info_text, transform=plt.gca().transAxes, 
-                verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+        artists["info"].set_text(info_text)
         
-        plt.tight_layout()
+        ax = artists["ax"]
+        ax.relim()
+        ax.autoscale_view()
+        return fig
+    
+    def plot_trajectory(self, save_image=True):
+        """Plot the complete trajectory"""
+        fig = self.draw_trajectory(self.trajectory_template())
+        fig.tight_layout()
         
         # Save image
         if save_image:
             filename = os.path.join(self.output_dir, "trajectory_plot.png")
-            plt.savefig(filename, dpi=300, bbox_inches='tight')
+            fig.savefig(filename, dpi=300, bbox_inches='tight')
             print(f"Trajectory plot saved as: {filename}")
         
         plt.show()
     
-    def animate_projectile(self, interval=50, trail_length=20, save_gif=True, save_mp4=True, filename_base="projectile_motion"):
-        """
-        Animate the projectile motion
-        
-        Parameters:
-        interval: Animation interval in milliseconds
-        trail_length: Number of points to show in the trail
-        save_gif: Whether to save animation as GIF
-        filename: Name of the GIF file if saving
-        """
+    @staticmethod
+    def animation_template():
+        """Empty animation figure, returns (fig, artists) for draw_animation"""
         fig, ax = plt.subplots(figsize=(15, 10))
+        artists = {"ax": ax}
         
         # Set up the plot with margins for text
-        ax.set_xlim(-max(self.x_pos) * 0.05, max(self.x_pos) * 1.1)
-        ax.set_ylim(-max(self.y_pos) * 0.05, max(self.y_pos) * 1.15)
         ax.set_xlabel('Horizontal Position (m)', fontsize=12)
         ax.set_ylabel('Vertical Position (m)', fontsize=12)
         ax.set_title('Animated Projectile Motion', fontsize=14, pad=20)
@@ -107,21 +131,46 @@ class ProjectileMotionVisualizer:
         ax.set_aspect('equal')
         
         # Initialize plot elements
-        projectile = Circle((0, 0), radius=max(self.x_pos)*0.005, 
-                           color='red', zorder=5)
-        ax.add_patch(projectile)
+        artists["projectile"] = Circle((0, 0), radius=1, color='red', zorder=5)
+        ax.add_patch(artists["projectile"])
         
-        trail_line, = ax.plot([], [], 'b-', alpha=0.7, linewidth=2, label='Trail')
-        velocity_arrow = ax.annotate('', xy=(0, 0), xytext=(0, 0),
+        artists["trail"], = ax.plot([], [], 'b-', alpha=0.7, linewidth=2, label='Trail')
+        artists["velocity"] = ax.annotate('', xy=(0, 0), xytext=(0, 0),
                                    arrowprops=dict(arrowstyle='->', color='green', lw=2),
                                    zorder=4)
         
         # Text display - all in one box
-        info_text = ax.text(0.02, 0.90, '', transform=ax.transAxes, fontsize=11,
+        artists["info"] = ax.text(0.02, 0.90, '', transform=ax.transAxes, fontsize=11,
                            bbox=dict(boxstyle='round,pad=0.5', facecolor='lightblue', alpha=0.9),
                            verticalalignment='top')
         
-        # Metadata in a separate corner - including all new information
+        # Metadata in a separate corner
+        artists["metadata"] = ax.text(0.98, 0.97, '',
+                               transform=ax.transAxes, fontsize=9,
+                               verticalalignment='top', horizontalalignment='right',
+                               bbox=dict(boxstyle='round,pad=0.5', facecolor='wheat', alpha=0.9))
+        
+        return fig, artists
+    
+    def draw_animation(self, template, trail_length=20):
+        """
+        Put this dataset into an animation template
+        
+        Returns:
+        animate: the per-frame callback for FuncAnimation
+        """
+        fig, artists = template
+        ax = artists["ax"]
+        ax.set_xlim(-max(self.x_pos) * 0.05, max(self.x_pos) * 1.1)
+        ax.set_ylim(-max(self.y_pos) * 0.05, max(self.y_pos) * 1.15)
+        
+        projectile = artists["projectile"]
+        projectile.set_radius(max(self.x_pos)*0.005)
+        trail_line = artists["trail"]
+        velocity_arrow = artists["velocity"]
+        info_text = artists["info"]
+        
+        # Metadata - including all new information
         metadata_info = f"Max Height: {self.metadata['h_max']:.2f} m\n"
         metadata_info += f"Total Time: {self.metadata['total_time']:.2f} s\n"
         metadata_info += f"Range: {self.x_pos[-1]:.2f} m\n"
@@ -143,12 +192,10 @@ class ProjectileMotionVisualizer:
             metadata_info += f"Energy Loss: {energy_loss_percent:.2f}%\n"
         
         metadata_info += f"Angle of Collapse: {self.metadata['angle_of_collapse']:.2f}°"
+        artists["metadata"].set_text(metadata_info)
         
-        metadata_text = ax.text(0.98, 0.97, metadata_info,
-                               transform=ax.transAxes, fontsize=9,
-                               verticalalignment='top', horizontalalignment='right',
-                               bbox=dict(boxstyle='round,pad=0.5', facecolor='wheat', alpha=0.9))
-        
+        # Velocity arrow scale (for visibility)
+        scale = max(self.x_pos) * 0.001
         
         def animate(frame):
             if frame >= len(self.time):
@@ -167,8 +214,7 @@ class ProjectileMotionVisualizer:
             trail_y = self.y_pos[start_idx:frame+1]
             trail_line.set_data(trail_x, trail_y)
             
-            # Update velocity arrow (scaled for visibility)
-            scale = max(self.x_pos) * 0.001
+            # Update velocity arrow
             velocity_arrow.set_position((x, y))
             velocity_arrow.xy = (x + vx * scale, y + vy * scale)
             
@@ -181,12 +227,29 @@ class ProjectileMotionVisualizer:
             
             return projectile, trail_line, velocity_arrow, info_text
         
+        return animate
+    
+    def animate_projectile(self, interval=50, trail_length=20, save_gif=True, save_mp4=True, filename_base="projectile_motion"):
+        """
+        Animate the projectile motion
+        
+        Parameters:
+        interval: Animation interval in milliseconds
+        trail_length: Number of points to show in the trail
+        save_gif: Whether to save animation as GIF
+        filename: Name of the GIF file if saving
+        """
+        import matplotlib.animation as animation
+
+        template = self.animation_template()
+        fig = template[0]
+        animate = self.draw_animation(template, trail_length)
+        fig.tight_layout()
+        
         # Create animation
         anim = animation.FuncAnimation(fig, animate, frames=len(self.time),
                                      interval=interval, blit=True, repeat=True)
         
-        plt.tight_layout()
-        
         # Save animation files
         if save_gif:
             gif_filename = os.path.join(self.output_dir, f"{filename_base}.gif")
@@ -212,38 +275,56 @@ class ProjectileMotionVisualizer:
         plt.show()
         return anim
     
-    def plot_velocity_components(self, save_image=True):
-        """Plot velocity components over time"""
+    @staticmethod
+    def velocity_components_template():
+        """Empty velocity components figure, returns (fig, artists) for draw_velocity_components"""
         fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(12, 10))
+        artists = {"axes": (ax1, ax2, ax3)}
         
         # X velocity
-        ax1.plot(self.time, self.x_vel, 'b-', linewidth=2, label='Vx')
+        artists["vx"], = ax1.plot([], [], 'b-', linewidth=2, label='Vx')
         ax1.set_ylabel('X Velocity (m/s)')
         ax1.set_title('Velocity Components vs Time')
         ax1.grid(True, alpha=0.3)
         ax1.legend()
         
         # Y velocity
-        ax2.plot(self.time, self.y_vel, 'r-', linewidth=2, label='Vy')
+        artists["vy"], = ax2.plot([], [], 'r-', linewidth=2, label='Vy')
         ax2.axhline(y=0, color='k', linestyle='--', alpha=0.5)
         ax2.set_ylabel('Y Velocity (m/s)')
         ax2.grid(True, alpha=0.3)
         ax2.legend()
         
         # Speed (magnitude)
-        speed = np.sqrt(self.x_vel**2 + self.y_vel**2)
-        ax3.plot(self.time, speed, 'g-', linewidth=2, label='Speed')
+        artists["speed"], = ax3.plot([], [], 'g-', linewidth=2, label='Speed')
         ax3.set_xlabel('Time (s)')
         ax3.set_ylabel('Speed (m/s)')
         ax3.grid(True, alpha=0.3)
         ax3.legend()
         
-        plt.tight_layout()
+        return fig, artists
+    
+    def draw_velocity_components(self, template):
+        """Put this dataset into a velocity components template"""
+        fig, artists = template
+        speed = np.sqrt(self.x_vel**2 + self.y_vel**2)
+        artists["vx"].set_data(self.time, self.x_vel)
+        artists["vy"].set_data(self.time, self.y_vel)
+        artists["speed"].set_data(self.time, speed)
+        for ax in artists["axes"]:
+            ax.relim()
+            ax.autoscale_view()
+        return fig
+    
+    def plot_velocity_components(self, save_image=True):
+        """Plot velocity components over time"""
+        fig = self.draw_velocity_components(self.velocity_components_template())
+        fig.tight_layout()
         
         # Save image
         if save_image:
             filename = os.path.join(self.output_dir, "velocity_components.png")
-            plt.savefig(filename, dpi=300, bbox_inches='tight')
+            fig.savefig(filename, dpi=300, bbox_inches='tight')
             print(f"Velocity components plot saved as: {filename}")
         
         plt.show()
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The toolkit is run from the repository root (python -m toolkit); make it importable from here too
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
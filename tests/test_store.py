@@ -0,0 +1,54 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from toolkit.store import ResultStore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECTILE = os.path.join(ROOT, "Projectile Motion", "json_data", "projectile_motion_data_non_symmetric.json")
+OSCILLATOR = os.path.join(ROOT, "Mass-Block Collision Harmonic Oscillator", "json_data", "collision_in_mass_spring.json")
+
+
+def load(path:str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def test_put_and_open_round_trip(tmp_path):
+    store = ResultStore(tmp_path, chunk_size=16)
+    run_id = store.put_json(PROJECTILE)
+    data = load(PROJECTILE)
+
+    run = ResultStore(tmp_path).open(run_id)
+    assert run.kind == "projectile"
+    assert run.meta == pytest.approx(data["metadata"])
+    for column, values in data["time_series"].items():
+        np.testing.assert_array_equal(np.asarray(run[column]), values)
+        np.testing.assert_array_equal(run[column][5:40:3], np.asarray(values)[5:40:3])
+        np.testing.assert_array_equal(run.memmap(column), values)
+    assert run.to_dict(memmap=False)["metadata"] == pytest.approx(data["metadata"])
+
+
+def test_query_by_derived_and_given_params(tmp_path):
+    store = ResultStore(tmp_path)
+    store.put_json(PROJECTILE)
+    oscillator = store.put_json(OSCILLATOR, {"m1": 2.0, "v1": 10.0, "m2": 1.0, "v2": 0.0})
+
+    rows = store.query("projectile", speed=(60, 70), a_ox=(None, 0))
+    assert rows.size == 1 and rows["angle"][0] == pytest.approx(45.0)
+    rows = store.query(m1=2.0)
+    assert list(rows["run_id"]) == [oscillator]
+    assert rows["k"][0] == 50.0 and rows["mass"][0] == 3.0
+
+
+def test_handles_on_one_store_never_share_a_run(tmp_path):
+    first, second = ResultStore(tmp_path), ResultStore(tmp_path)
+    ids = [first.put_json(PROJECTILE), second.put_json(OSCILLATOR), first.put_json(OSCILLATOR)]
+    assert len(set(ids)) == 3
+
+    index = ResultStore(tmp_path).index
+    assert sorted(index["run_id"]) == sorted(ids)
+    for run_id, kind in zip(ids, ["projectile", "oscillator", "oscillator"]):
+        assert ResultStore(tmp_path).open(run_id).kind == kind
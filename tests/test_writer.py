@@ -0,0 +1,117 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from toolkit import precision, writer
+from toolkit.writer import format_fixed, is_fresh, load_run, sidecar_path, write_run
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JSON_DATA = [
+    os.path.join(ROOT, "Projectile Motion", "json_data", "projectile_motion_data_non_symmetric.json"),
+    os.path.join(ROOT, "Projectile Motion", "json_data", "projectile_motion_data_symmetric.json"),
+    os.path.join(ROOT, "Mass-Block Collision Harmonic Oscillator", "json_data", "collision_in_mass_spring.json"),
+]
+
+
+def printf(values, precision:int) -> bytes:
+    return ", ".join("%.*f" % (precision, value) for value in np.asarray(values).tolist()).encode()
+
+
+def read_as_float32(path:str) -> dict:
+    """A bundled output with its time series as the float32 arrays the C++ program formatted."""
+    with open(path) as f:
+        data = json.load(f)
+    series = "time_series" if "time_series" in data else "oscillation_info"
+    data[series] = {key: np.float32(values) for key, values in data[series].items()}
+    return data
+
+
+# ---------------------------------------------------------------- format_fixed
+
+@pytest.mark.parametrize("digits", [0, 1, 2, 6])
+def test_format_fixed_exact_binary_ties(digits):
+    values = np.array([0.125, 0.375, 0.625, 2.5, -2.5, 3.5, 1.0625, -0.0625])
+    assert format_fixed(values, digits) == printf(values, digits)
+
+
+def test_format_fixed_near_ties():
+    # Halfway points in decimal are not representable; each lands just above or below the tie
+    rng = np.random.default_rng(0)
+    values = np.round(rng.normal(0.0, 1e3, 200_000), 6) + 5e-7
+    assert format_fixed(values) == printf(values, 6)
+    assert format_fixed(values.astype(np.float32)) == printf(values.astype(np.float32), 6)
+
+
+def test_format_fixed_negative_zero():
+    values = np.array([-0.0, 0.0, -1e-9, -4e-7, -5e-7, 4e-7])
+    assert format_fixed(values) == printf(values, 6)
+    assert format_fixed(values).startswith(b"-0.000000, 0.000000, -0.000000")
+
+
+def test_format_fixed_large_magnitudes_and_non_finite():
+    values = np.array([1e15, -3e17, 2.0**62 / 1e6, 2.0**62, 1e300, -1e300, np.inf, -np.inf, np.nan])
+    for digits in (0, 6):
+        assert format_fixed(values, digits) == printf(values, digits)
+
+
+def test_format_fixed_separator_and_empty():
+    assert format_fixed(np.array([1.0, -2.0]), 2, separator=b",") == b"1.00,-2.00"
+    assert format_fixed(np.array([])) == b""
+
+
+# ---------------------------------------------------------------- write_run
+
+@pytest.mark.parametrize("path", JSON_DATA, ids=os.path.basename)
+def test_write_run_reproduces_bundled_outputs(path, tmp_path):
+    output = write_run(read_as_float32(path), tmp_path / "run.json", sidecar=False)
+    with open(output, "rb") as written, open(path, "rb") as bundled:
+        assert written.read() == bundled.read()
+
+
+# ---------------------------------------------------------------- sidecars
+
+def test_load_run_prefers_a_fresh_sidecar(tmp_path):
+    path = write_run(read_as_float32(JSON_DATA[0]), tmp_path / "run.json")
+    assert is_fresh(sidecar_path(path), path)
+    data = load_run(path)
+    # Sidecar columns come back as arrays of the stored dtype, JSON ones as lists
+    assert isinstance(data["time_series"]["time"], np.ndarray)
+    assert data["time_series"]["time"].dtype == np.float32
+
+
+def test_load_run_ignores_a_stale_sidecar(tmp_path):
+    path = write_run(read_as_float32(JSON_DATA[0]), tmp_path / "run.json")
+    # Rewritten by another program (e.g. the C++ one) without a sidecar
+    other = read_as_float32(JSON_DATA[1])
+    write_run(other, tmp_path / "other.json", sidecar=False)
+    os.replace(tmp_path / "other.json", path)
+    stat = os.stat(sidecar_path(path))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert not is_fresh(sidecar_path(path), path)
+    data = load_run(path)
+    assert isinstance(data["time_series"]["time"], list)
+    assert data["metadata"] == pytest.approx(other["metadata"])
+
+
+def test_load_run_converts_over_budget_outputs_into_the_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(writer, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(precision._Policy, "memory_budget", 1024)
+    source = tmp_path / "source"
+    source.mkdir()
+    path = write_run(read_as_float32(JSON_DATA[2]), source / "run.json", sidecar=False)
+
+    data = load_run(path)
+    assert os.listdir(source) == ["run.json"]
+    assert len(os.listdir(tmp_path / "cache")) == 1
+    with open(path) as f:
+        expected = json.load(f)["oscillation_info"]
+    for column, values in expected.items():
+        np.testing.assert_allclose(data["oscillation_info"][column], values, rtol=1e-6, atol=1e-6)
+
+    # A rewritten JSON gets its own cache entry
+    os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 1_000_000))
+    load_run(path)
+    assert len(os.listdir(tmp_path / "cache")) == 2
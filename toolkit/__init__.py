@@ -0,0 +1,8 @@
+"""
+Shared tooling for the Computational Physics projects.
+
+The projects live in folders with spaces in their names, so they are not importable
+packages; toolkit.modules loads them by path. Run the command line with:
+
+    python -m toolkit --help
+"""
@@ -0,0 +1,282 @@
+"""
+Benchmark suite for the load, compute, render and encode paths.
+
+Each case builds a synthetic dataset of a given size (untimed), then times the
+operation, keeping the best of a few repeats. Results are written as JSON so two
+runs can be compared:
+
+    python -m toolkit bench --output before.json
+    python -m toolkit bench --output after.json --baseline before.json --threshold 0.2
+
+Rendering and GIF encoding are far slower per sample than the compute paths, so
+each case has a maximum size; larger requested sizes are skipped for it.
+"""
+import json
+import os
+import platform
+import tempfile
+import time
+import warnings
+from datetime import datetime, timezone
+
+import numpy as np
+
+from toolkit import modules
+
+DEFAULT_SIZES:list[int] = [10**2, 10**3, 10**4, 10**5, 10**6, 10**7]
+
+
+# ---------------------------------------------------------------- synthetic datasets
+
+def synthetic_projectile(size:int, a_ox:float = -3.0) -> dict:
+    """Projectile run with `size` samples, same layout as Projectile Motion/main.cpp output."""
+    return modules.load("kinematics").simulate_projectile(v=65.0, v_angle=np.pi / 4, a_ox=a_ox, mass=5.0,
+                                                          data_points_per_sec=max(size - 1, 1))
+
+
+def synthetic_oscillator(size:int, samples_per_cycle:int = 20) -> dict:
+    """Oscillator run with `size` samples, same layout as the collision main.cpp output."""
+    num_cycles = max(size // samples_per_cycle, 1)
+    return modules.load("oscillator").simulate_oscillator(num_cycles=num_cycles, samples_per_cycle=samples_per_cycle)
+
+
+def write_json(data:dict, path:str) -> str:
+    serializable = {section: {key: value.tolist() if hasattr(value, "tolist") else value
+                              for key, value in fields.items()}
+                    for section, fields in data.items()}
+    with open(path, "w") as f:
+        json.dump(serializable, f)
+    return path
+
+
+# ---------------------------------------------------------------- cases
+# Each setup receives (size, workdir) and returns the zero-argument callable to time.
+
+def _setup_projectile_json_load(size:int, workdir:str):
+    path = write_json(synthetic_projectile(size), os.path.join(workdir, f"projectile_{size}.json"))
+
+    def run():
+        with open(path) as f:
+            json.load(f)
+    return run
+
+
+def _setup_oscillator_json_load(size:int, workdir:str):
+    visualizer = modules.load("visualizer")
+    path = write_json(synthetic_oscillator(size), os.path.join(workdir, f"oscillator_{size}.json"))
+    return lambda: visualizer.load_data(path)
+
+
+def _setup_projectile_json_write(size:int, workdir:str):
+    from toolkit.writer import write_run
+    data = synthetic_projectile(size)
+    path = os.path.join(workdir, f"projectile_{size}_written.json")
+    return lambda: write_run(data, path, sidecar=True)
+
+
+def _setup_projectile_derived(size:int, workdir:str):
+    series = synthetic_projectile(size)["time_series"]
+    columns = {key: values.tolist() for key, values in series.items()}
+
+    def run():
+        # What ProjectileMotionVisualizer derives from the parsed lists
+        time_ = np.array(columns["time"])
+        x_vel = np.array(columns["velocity_x"])
+        y_vel = np.array(columns["velocity_y"])
+        np.array(columns["position_x"])
+        np.array(columns["position_y"])
+        np.gradient(x_vel, time_)
+        np.gradient(y_vel, time_)
+        np.sqrt(x_vel**2 + y_vel**2)
+    return run
+
+
+def _setup_projectile_simulate(size:int, workdir:str):
+    return lambda: synthetic_projectile(size)
+
+
+def _setup_projectile_trajectory_plot(size:int, workdir:str):
+    import matplotlib.pyplot as plt
+    plots = modules.load("plots")
+    path = write_json(synthetic_projectile(size), os.path.join(workdir, f"projectile_{size}.json"))
+    viz = plots.ProjectileMotionVisualizer(json_file=path, output_folder=os.path.join(workdir, "plots"))
+
+    def run():
+        viz.plot_trajectory(save_image=True)
+        plt.close("all")
+    return run
+
+
+def _setup_projectile_animation_frame(size:int, workdir:str):
+    import matplotlib.pyplot as plt
+    plots = modules.load("plots")
+    path = write_json(synthetic_projectile(size), os.path.join(workdir, f"projectile_{size}.json"))
+    viz = plots.ProjectileMotionVisualizer(json_file=path, output_folder=os.path.join(workdir, "plots"))
+    template = viz.animation_template()
+    fig = template[0]
+    animate = viz.draw_animation(template)
+    fig.tight_layout()
+    frames = np.linspace(0, size - 1, min(size, 50)).astype(int)
+
+    def run():
+        # Callback plus canvas draw, per frame
+        for frame in frames:
+            animate(frame)
+            fig.canvas.draw()
+    run.frames = len(frames)
+    run.teardown = lambda: plt.close("all")
+    return run
+
+
+def _setup_projectile_gif_encode(size:int, workdir:str):
+    import matplotlib.pyplot as plt
+    plots = modules.load("plots")
+    path = write_json(synthetic_projectile(size), os.path.join(workdir, f"projectile_{size}.json"))
+    viz = plots.ProjectileMotionVisualizer(json_file=path, output_folder=os.path.join(workdir, "plots"))
+    anim = viz.animate_projectile(save_gif=False, save_mp4=False)
+    gif_path = os.path.join(workdir, "bench.gif")
+
+    def run():
+        anim.save(gif_path, writer="pillow", fps=20, dpi=50)
+    run.teardown = lambda: plt.close("all")
+    return run
+
+
+def _setup_oscillator_animation(size:int, workdir:str):
+    import matplotlib.pyplot as plt
+    visualizer = modules.load("visualizer")
+    path = write_json(synthetic_oscillator(size), os.path.join(workdir, f"oscillator_{size}.json"))
+    filename_base = os.path.join(workdir, "oscillation")
+
+    def run():
+        # Figure setup, every frame and the GIF encode (MP4 fails fast without ffmpeg)
+        visualizer.create_oscillation_animation(json_path=path, filename_base=filename_base, show=False)
+        plt.close("all")
+    return run
+
+
+def _setup_matrix_transform(size:int, workdir:str):
+    determinant = modules.load("determinant")
+    matrix = determinant.Matrix(type="shearing", vector_space_type="circular", n=2, render=False)
+    vectors = np.random.default_rng(0).uniform(-1, 1, (2, size))
+    return lambda: matrix.applyTransform(vectors)
+
+
+def _setup_matrix_analysis(size:int, workdir:str):
+    analysis = modules.load("analysis")
+    matrices = analysis.transformation_matrices("rotation", angle=np.random.default_rng(0).uniform(0, 2 * np.pi, size))
+    return lambda: analysis.analyze_matrices(matrices)
+
+
+def _setup_vector_pairs(size:int, workdir:str):
+    vector_engine = modules.load("vector_engine")
+    rng = np.random.default_rng(0)
+    vec_a, vec_b = rng.normal(size=(size, 3)), rng.normal(size=(size, 3))
+    return lambda: vector_engine.analyze_pairs(vec_a, vec_b)
+
+
+# Case name -> (setup, largest size it runs at)
+CASES:dict = {
+    "projectile_json_load": (_setup_projectile_json_load, 10**6),
+    "oscillator_json_load": (_setup_oscillator_json_load, 10**6),
+    "projectile_json_write": (_setup_projectile_json_write, 10**6),
+    "projectile_derived": (_setup_projectile_derived, 10**7),
+    "projectile_simulate": (_setup_projectile_simulate, 10**7),
+    "projectile_trajectory_plot": (_setup_projectile_trajectory_plot, 10**5),
+    "projectile_animation_frame": (_setup_projectile_animation_frame, 10**5),
+    "projectile_gif_encode": (_setup_projectile_gif_encode, 10**2),
+    "oscillator_animation": (_setup_oscillator_animation, 10**2),
+    "matrix_transform": (_setup_matrix_transform, 10**7),
+    "matrix_analysis": (_setup_matrix_analysis, 10**6),
+    "vector_pairs": (_setup_vector_pairs, 10**7),
+}
+
+
+# ---------------------------------------------------------------- runner
+
+def run_benchmarks(sizes:list[int]|None = None, cases:list[str]|None = None, repeat:int = 3) -> dict:
+    """
+    Runs the benchmark cases over the requested sizes.
+
+    Parameters:
+    sizes (list[int]): Dataset sizes (samples). Defaults to 10^2 ... 10^7.
+    cases (list[str]): Case names (keys of CASES). Defaults to all.
+    repeat (int): Timed repeats per measurement, the best one is kept. Default is 3.
+    Repeats stop early once a measurement has taken 5 seconds in total.
+
+    Returns:
+    dict: {"meta": {...}, "results": [{"case", "size", "seconds", "samples_per_second"}, ...]}
+
+    Raises:
+    ValueError: If a case name is unknown.
+    """
+    sizes = sizes or DEFAULT_SIZES
+    cases = cases or list(CASES)
+    unknown = [case for case in cases if case not in CASES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark cases {unknown}. Available cases are: {list(CASES)}")
+
+    import matplotlib
+    matplotlib.use("Agg")
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir, warnings.catch_warnings():
+        # plt.show() under Agg warns on every call
+        warnings.simplefilter("ignore", UserWarning)
+        for case in cases:
+            setup, max_size = CASES[case]
+            for size in sizes:
+                if size > max_size:
+                    continue
+                run = setup(size, workdir)
+                timings = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    run()
+                    timings.append(time.perf_counter() - start)
+                    # Encodes take minutes; a single timing is precise enough for those
+                    if sum(timings) > 5.0:
+                        break
+                getattr(run, "teardown", lambda: None)()
+
+                seconds = min(timings)
+                result = {"case": case, "size": size, "seconds": seconds, "samples_per_second": size / seconds}
+                if hasattr(run, "frames"):
+                    result["seconds_per_frame"] = seconds / run.frames
+                results.append(result)
+                print(f"{case:>28} {size:>10}: {seconds * 1e3:11.3f} ms ({size / seconds:,.0f} samples/s)")
+
+    meta = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+        "platform": platform.platform(),
+        "repeat": repeat,
+    }
+    return {"meta": meta, "results": results}
+
+
+def compare(baseline:dict, current:dict, threshold:float = 0.1) -> list[dict]:
+    """
+    Flags measurements that got slower than the baseline by more than `threshold`.
+
+    Parameters:
+    baseline (dict): Output of run_benchmarks (or its saved JSON) for the reference run.
+    current (dict): Output of run_benchmarks for the new run.
+    threshold (float): Allowed relative slowdown, 0.1 = 10%. Default is 0.1.
+
+    Returns:
+    list[dict]: One entry per regression with case, size, both timings and the ratio.
+    """
+    reference = {(result["case"], result["size"]): result["seconds"] for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        key = (result["case"], result["size"])
+        if key not in reference:
+            continue
+        ratio = result["seconds"] / reference[key]
+        if ratio > 1 + threshold:
+            regressions.append({"case": key[0], "size": key[1], "baseline_seconds": reference[key],
+                                "seconds": result["seconds"], "ratio": ratio})
+    return regressions
@@ -0,0 +1,522 @@
+"""
+Single command-line entry point for the projects.
+
+    python -m toolkit simulate projectile --speed 65 --angle 45 --ax -3 --output run.json
+    python -m toolkit render projectile --input run.json --output-dir plots
+    python -m toolkit render phase --input driven.json --skip-cycles 100
+    python -m toolkit analyze matrix --type rotation --param angle=0:3.14:10000
+    python -m toolkit sweep projectile --speed 10:100:50 --angle 5:85:50 --output sweep.npy
+    python -m toolkit dispersion --draws 100000000 --speed normal:65:1 --angle normal:45:0.5 --ax uniform:-3.5:-2.5
+    python -m toolkit validate results/*.json --rtol 1e-4
+    python -m toolkit bench
+    python -m toolkit --dtype float32 --memory-budget 2GB validate results/*.json
+
+Only NumPy is imported for compute subcommands; matplotlib (and seaborn for the
+matrix figures) is imported when a render subcommand actually runs.
+"""
+import argparse
+import json
+import os
+import sys
+
+from toolkit import modules
+
+
+def _grid(spec:str):
+    """Parses 'value' or 'start:stop:count' into an array."""
+    import numpy as np
+    parts = spec.split(":")
+    if len(parts) == 1:
+        return np.array([float(parts[0])])
+    if len(parts) != 3:
+        raise argparse.ArgumentTypeError(f"Expected 'value' or 'start:stop:count', got '{spec}'")
+    return np.linspace(float(parts[0]), float(parts[1]), int(parts[2]))
+
+
+def _use_backend(show:bool) -> None:
+    # Without --show, render off-screen so batch runs never block on plt.show()
+    import matplotlib
+    if not show:
+        matplotlib.use("Agg")
+
+
+# ---------------------------------------------------------------- simulate
+
+def cmd_simulate(args) -> None:
+    import numpy as np
+
+    if args.system == "projectile":
+        kinematics = modules.load("kinematics")
+        data = kinematics.simulate_projectile(args.x0, args.y0, args.speed, np.radians(args.angle),
+                                              args.ax, args.ay, args.mass, args.points)
+        summary = data["metadata"]
+    else:
+        oscillator = modules.load("oscillator")
+        data = oscillator.simulate_oscillator(args.m1, args.v1, args.m2, args.v2, args.k,
+                                              args.cycles, args.samples, args.damping, args.drive_force, args.drive_w)
+        summary = data["system_info"]
+
+    for key, value in summary.items():
+        print(f"{key}: {value:.6f}")
+    if args.output:
+        from toolkit.writer import sidecar_path, write_run
+        # Same text as the C++ save_to_json / saveJson
+        write_run(data, args.output, precision=args.precision, sidecar=args.sidecar)
+        print(f"Data saved to {args.output}" + (f" (+ {sidecar_path(args.output)})" if args.sidecar else ""))
+
+
+# ---------------------------------------------------------------- render
+
+def cmd_render(args) -> None:
+    _use_backend(args.show)
+
+    if args.target in ("projectile", "oscillator") and len(args.input) > 1:
+        # Several datasets: decode the next ones in the background while rendering
+        from toolkit import pipeline
+        if args.target == "projectile":
+            report = pipeline.render_projectile_files(args.input, args.output_dir, depth=args.prefetch,
+                                                      animation=not args.no_animation)
+        else:
+            report = pipeline.render_oscillator_files(args.input, args.output_dir, depth=args.prefetch)
+        print(pipeline.format_report(report))
+
+    elif args.target == "matrix" and len(args.type) * len(args.space) > 1:
+        # Several figures: vector spaces and transforms are computed in the background while rendering
+        import itertools
+        from toolkit import pipeline
+        specs = [{"type": matrix_type, "vector_space_type": space, "n": args.n,
+                  "save_path": os.path.join(args.output_dir, f"{matrix_type}_{space}.png")}
+                 for matrix_type, space in itertools.product(args.type, args.space)]
+        print(pipeline.format_report(pipeline.render_matrices(specs, depth=args.prefetch)))
+
+    elif args.target == "projectile":
+        plots = modules.load("plots")
+        viz = plots.ProjectileMotionVisualizer(json_file=args.input[0], output_folder=args.output_dir)
+        viz.plot_trajectory(save_image=True)
+        viz.plot_velocity_components(save_image=True)
+        if not args.no_animation:
+            viz.animate_projectile(save_gif=True, save_mp4=False)
+
+    elif args.target == "oscillator":
+        visualizer = modules.load("visualizer")
+        visualizer.create_oscillation_animation(json_path=args.input[0], filename_base=args.output, show=args.show)
+
+    elif args.target == "phase":
+        from toolkit.phase import render_phase_space
+        render_phase_space(args.input, args.output, bins=args.bins, phase=args.phase,
+                           skip_cycles=args.skip_cycles, upsample=args.upsample)
+
+    elif args.target == "matrix":
+        determinant = modules.load("determinant")
+        determinant.Matrix(type=args.type[0], vector_space_type=args.space[0], n=args.n, save_path=args.output)
+
+    elif args.target == "vectors":
+        vector_viz = modules.load("vector_viz")
+        if args.input:
+            viz = vector_viz.VectorVisualizer(args.input)
+        else:
+            viz = vector_viz.VectorVisualizer.from_vectors(args.a, args.b)
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        viz.plot_vectors(save_path=args.output)
+
+
+# ---------------------------------------------------------------- analyze
+
+def cmd_analyze(args) -> None:
+    import numpy as np
+
+    if args.target == "matrix":
+        analysis = modules.load("analysis")
+        params = {}
+        for item in args.param:
+            name, _, spec = item.partition("=")
+            params[name] = _grid(spec)
+        if args.type in ("reflection", "collapse"):
+            params["count"] = args.count
+        report = analysis.analyze_matrices(analysis.transformation_matrices(args.type, **params), n=args.n)
+
+        print(f"Analyzed {report.size} {args.type} matrices")
+        for field in ("determinant", "condition_number", "area_scale", "area_scale_error"):
+            values = report[field]
+            print(f"{field}: min {values.min():.6g}, max {values.max():.6g}")
+        print(f"orientation flips: {np.count_nonzero(report['orientation_flip'])}, "
+              f"singular: {np.count_nonzero(report['rank'] < 2)}")
+
+    else:
+        vector_engine = modules.load("vector_engine")
+        if args.random:
+            rng = np.random.default_rng(args.seed)
+            result = vector_engine.analyze_pairs(rng.normal(size=(args.random, 3)), rng.normal(size=(args.random, 3)))
+        else:
+            result = vector_engine.analyze_pairs(args.a, args.b)
+
+        angles = np.degrees(result["Angle (radians)"])
+        print(f"Analyzed {angles.size} vector pairs")
+        print(f"angle: min {angles.min():.3f}°, mean {angles.mean():.3f}°, max {angles.max():.3f}°")
+        if angles.size == 1:
+            for key, value in vector_engine.pair_record(result).items():
+                print(f"{key}: {value}")
+        report = result
+
+    if args.output:
+        if isinstance(report, dict):
+            np.savez(args.output, **report)
+        else:
+            np.save(args.output, report)
+        print(f"Report saved to {args.output}")
+
+
+# ---------------------------------------------------------------- sweep
+
+def cmd_sweep(args) -> None:
+    import numpy as np
+    from toolkit.sweep import MATRIX_PARAMETERS, run_sweep
+
+    count = 1
+    if args.system == "projectile":
+        grid = {"v": _grid(args.speed), "v_angle": np.radians(_grid(args.angle))}
+        fixed = {"a_ox": args.ax, "a_oy": args.ay, "mass": args.mass}
+    elif args.system == "oscillator":
+        grid = {"m1": _grid(args.m1), "k": _grid(args.k)}
+        fixed = {"v1": args.v1, "m2": args.m2, "v2": args.v2}
+    else:
+        grid = {}
+        for item in args.param:
+            name, _, spec = item.partition("=")
+            if name not in MATRIX_PARAMETERS[args.type]:
+                sys.exit(f"error: '{args.type}' has no parameter '{name}' "
+                         f"(parameters: {', '.join(MATRIX_PARAMETERS[args.type]) or 'none, use --count'})")
+            grid[name] = _grid(spec)
+        fixed = {"type": args.type, "n": args.n}
+        count = args.count
+
+    run_sweep(args.system, grid, args.output, fixed=fixed, chunk_size=args.chunk_size,
+              max_workers=args.workers, resume=not args.restart, count=count)
+
+
+# ---------------------------------------------------------------- dispersion
+
+def _distribution(spec:str) -> tuple:
+    """Parses 'value' (fixed) or 'method:param:...' (numpy.random.Generator method) into a distribution."""
+    method, *parameters = spec.split(":")
+    try:
+        return ("fixed", float(method)) if not parameters else (method, *map(float, parameters))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected 'value' or 'method:param:...', got '{spec}'") from None
+
+
+def cmd_dispersion(args) -> None:
+    from toolkit.montecarlo import input_means, plot_dispersion, run_monte_carlo
+
+    distributions = {"speed": args.speed, "angle": args.angle, "a_ox": args.ax}
+    fixed = {"a_oy": args.ay, "s_oy": args.height, "mass": args.mass}
+    stats = run_monte_carlo(args.draws, distributions, fixed=fixed, chunk_size=args.chunk_size,
+                            seed=args.seed, max_workers=args.workers)
+    for name, entry in stats.summary().items():
+        print(f"{name:<18} " + "  ".join(f"{key}={value:.4f}" for key, value in entry.items()))
+    if args.output:
+        stats.save(args.output)
+        print(f"Dispersion statistics saved to {args.output}")
+    if args.plot:
+        # Nominal trajectory at the input means, estimated from a pilot draw whatever the distribution
+        nominal = input_means(distributions, seed=args.seed)
+        plot_dispersion(stats, args.plot, fixed=fixed, nominal=nominal)
+
+
+# ---------------------------------------------------------------- bench
+
+def cmd_bench(args) -> None:
+    from toolkit import bench
+
+    report = bench.run_benchmarks(sizes=args.sizes, cases=args.cases, repeat=args.repeat)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Benchmark results saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = bench.compare(baseline, report, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression['case']} @ {regression['size']}: "
+                  f"{regression['baseline_seconds'] * 1e3:.3f} ms -> {regression['seconds'] * 1e3:.3f} ms "
+                  f"(x{regression['ratio']:.2f})")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+
+# ---------------------------------------------------------------- store
+
+def cmd_store(args) -> None:
+    from toolkit.store import INDEX_FIELDS, ResultStore
+
+    store = ResultStore(args.root)
+    if args.action == "put":
+        params = {}
+        for item in args.param:
+            name, _, value = item.partition("=")
+            if name not in INDEX_FIELDS:
+                sys.exit(f"error: '{name}' is not an index field. Index fields are: {INDEX_FIELDS}")
+            params[name] = float(value)
+        for path in args.files:
+            run_id = store.put_json(path, params)
+            print(f"{path} -> {run_id}")
+        return
+
+    ranges = {}
+    for item in args.where:
+        name, _, spec = item.partition("=")
+        low, _, high = spec.partition(":")
+        ranges[name] = (float(low) if low else None, float(high) if high else None) if ":" in spec else float(spec)
+    rows = store.query(args.kind, **ranges)
+    for row in rows:
+        values = ", ".join(f"{field}={row[field]:.6g}" for field in INDEX_FIELDS if row[field] == row[field])
+        print(f"{row['run_id']}  {row['kind']:<10} samples={row['length']:<8} {values}")
+    print(f"{rows.size} runs")
+
+
+# ---------------------------------------------------------------- validate
+
+def cmd_validate(args) -> None:
+    from toolkit.validate import format_table, validate
+
+    runs = list(args.files)
+    if args.store:
+        from toolkit.store import ResultStore
+        runs += list(ResultStore(args.store).runs(args.kind))
+    table = validate(runs, rtol=args.rtol)
+    print(format_table(table))
+    if args.output:
+        import numpy as np
+        np.save(args.output, table)
+        print(f"Validation table saved to {args.output}")
+    if not table["passed"].all():
+        sys.exit(1)
+
+
+# ---------------------------------------------------------------- parser
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m toolkit", description="Computational Physics command line")
+    parser.add_argument("--profile", metavar="PATH", help="Record timing spans and write a JSON profile (+ .folded stacks)")
+    parser.add_argument("--trace-memory", action="store_true", help="With --profile, also record peak memory (tracemalloc)")
+    parser.add_argument("--dtype", choices=["float32", "float64"], help="Precision of loaded and computed arrays (default float64)")
+    parser.add_argument("--memory-budget", metavar="SIZE",
+                        help="Memory for datasets and batches, e.g. 2GB (default half the physical memory)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    # simulate
+    simulate = commands.add_parser("simulate", help="Run a simulation (no plotting libraries imported)")
+    systems = simulate.add_subparsers(dest="system", required=True)
+
+    projectile = systems.add_parser("projectile", help="Projectile motion (Projectile Motion/main.cpp)")
+    projectile.add_argument("--speed", type=float, default=65.0, help="Initial velocity (m/s)")
+    projectile.add_argument("--angle", type=float, default=45.0, help="Launch angle (degrees)")
+    projectile.add_argument("--ax", type=float, default=0.0, help="Horizontal acceleration (m/s²)")
+    projectile.add_argument("--ay", type=float, default=-9.81, help="Vertical acceleration (m/s²)")
+    projectile.add_argument("--x0", type=float, default=0.0)
+    projectile.add_argument("--y0", type=float, default=0.0)
+    projectile.add_argument("--mass", type=float, default=1.0)
+    projectile.add_argument("--points", type=int, default=100)
+    projectile.add_argument("--output", help="JSON file to write")
+
+    oscillator = systems.add_parser("oscillator", help="Mass-block collision oscillator (main.cpp)")
+    oscillator.add_argument("--m1", type=float, default=2.0)
+    oscillator.add_argument("--v1", type=float, default=10.0)
+    oscillator.add_argument("--m2", type=float, default=1.0)
+    oscillator.add_argument("--v2", type=float, default=0.0)
+    oscillator.add_argument("--k", type=float, default=50.0)
+    oscillator.add_argument("--cycles", type=int, default=5)
+    oscillator.add_argument("--samples", type=int, default=20, help="Samples per cycle")
+    oscillator.add_argument("--damping", type=float, default=0.0, help="Damping rate (1/s), below w")
+    oscillator.add_argument("--drive-force", type=float, default=0.0, help="Amplitude of a sinusoidal drive (N)")
+    oscillator.add_argument("--drive-w", type=float, default=None, help="Drive angular frequency (rad/s), defaults to w")
+    oscillator.add_argument("--output", help="JSON file to write")
+
+    for system in (projectile, oscillator):
+        system.add_argument("--precision", type=int, default=6, help="Decimals in the JSON output (C++: 6)")
+        system.add_argument("--sidecar", action="store_true", help="Also write the binary columnar .cols file")
+    simulate.set_defaults(func=cmd_simulate)
+
+    # render
+    render = commands.add_parser("render", help="Render figures and animations")
+    render.add_argument("--show", action="store_true", help="Open interactive windows")
+    targets = render.add_subparsers(dest="target", required=True)
+
+    projectile = targets.add_parser("projectile")
+    projectile.add_argument("--input", required=True, nargs="+",
+                            help="JSON file(s); several are rendered into OUTPUT_DIR/<file stem>")
+    projectile.add_argument("--output-dir", default="plot_and_visualizers")
+    projectile.add_argument("--no-animation", action="store_true")
+
+    oscillator = targets.add_parser("oscillator")
+    oscillator.add_argument("--input", required=True, nargs="+",
+                            help="JSON file(s); several are rendered into OUTPUT_DIR/<file stem>.gif")
+    oscillator.add_argument("--output", default="block_spring_oscillation",
+                            help="Output file name without extension, for a single input")
+    oscillator.add_argument("--output-dir", default="oscillations", help="Output folder, for several inputs")
+
+    for target in (projectile, oscillator):
+        target.add_argument("--prefetch", type=int, default=2, help="Datasets decoded ahead while rendering several")
+
+    phase = targets.add_parser("phase", help="Phase portrait and Poincaré section density images")
+    phase.add_argument("--input", required=True, nargs="+", help="Oscillator JSON file(s) or .cols sidecars")
+    phase.add_argument("--output", default="phase_space.png")
+    phase.add_argument("--bins", type=int, default=512, help="Bins per axis")
+    phase.add_argument("--phase", type=float, default=0.0, help="Section phase as a fraction of the drive period")
+    phase.add_argument("--skip-cycles", type=int, default=0, help="Drive periods dropped as transient")
+    phase.add_argument("--upsample", type=int, help="Portrait points per sampling interval "
+                       "(default: enough for consecutive points to be at most one bin apart)")
+
+    matrix = targets.add_parser("matrix")
+    matrix.add_argument("--type", nargs="+", default=["rotation"],
+                        choices=['rotation', 'scaling', 'shearing', 'reflection', 'collapse'],
+                        help="Transformation type(s); several types or spaces render every combination")
+    matrix.add_argument("--space", nargs="+", default=["rectangular"], choices=["rectangular", "circular"])
+    matrix.add_argument("-n", type=int, default=100)
+    matrix.add_argument("--output", default="figures/default.png", help="PNG file, for a single figure")
+    matrix.add_argument("--output-dir", default="figures",
+                        help="Output folder of several figures, named <type>_<space>.png")
+    matrix.add_argument("--prefetch", type=int, default=2, help="Matrices computed ahead while rendering several")
+
+    vectors = targets.add_parser("vectors")
+    vectors.add_argument("--input", help="vector_data.json produced by vector.cpp")
+    vectors.add_argument("--a", type=float, nargs=3, default=[1, 2, 3])
+    vectors.add_argument("--b", type=float, nargs=3, default=[5, 4, 3])
+    vectors.add_argument("--output", default="images/vector_visualization.png")
+    render.set_defaults(func=cmd_render)
+
+    # analyze
+    analyze = commands.add_parser("analyze", help="Batched matrix / vector-pair analysis")
+    targets = analyze.add_subparsers(dest="target", required=True)
+
+    matrix = targets.add_parser("matrix")
+    matrix.add_argument("--type", default="rotation", choices=['rotation', 'scaling', 'shearing', 'reflection', 'collapse'])
+    matrix.add_argument("--param", action="append", default=[], metavar="NAME=SPEC",
+                        help="Family parameter as 'value' or 'start:stop:count', e.g. angle=0:3.14:1000")
+    matrix.add_argument("--count", type=int, default=1, help="Stack size for parameterless types")
+    matrix.add_argument("-n", type=int, default=100, help="Points of the circular vector space")
+    matrix.add_argument("--output", help=".npy file for the structured report")
+
+    vectors = targets.add_parser("vectors")
+    vectors.add_argument("--a", type=float, nargs=3, default=[1, 2, 3])
+    vectors.add_argument("--b", type=float, nargs=3, default=[5, 4, 3])
+    vectors.add_argument("--random", type=int, default=0, help="Analyze N random pairs instead")
+    vectors.add_argument("--seed", type=int, default=None)
+    vectors.add_argument("--output", help=".npz file for the results")
+    analyze.set_defaults(func=cmd_analyze)
+
+    # sweep
+    sweep = commands.add_parser("sweep", help="Resumable parameter sweeps on a process pool")
+    systems = sweep.add_subparsers(dest="system", required=True)
+
+    projectile = systems.add_parser("projectile")
+    projectile.add_argument("--speed", default="10:100:10", help="'value' or 'start:stop:count' (m/s)")
+    projectile.add_argument("--angle", default="5:85:17", help="'value' or 'start:stop:count' (degrees)")
+    projectile.add_argument("--ax", type=float, default=0.0)
+    projectile.add_argument("--ay", type=float, default=-9.81)
+    projectile.add_argument("--mass", type=float, default=1.0)
+
+    oscillator = systems.add_parser("oscillator")
+    oscillator.add_argument("--m1", default="1:10:10", help="Projectile mass, 'value' or 'start:stop:count' (kg)")
+    oscillator.add_argument("--k", default="10:100:10", help="'value' or 'start:stop:count' (N/m)")
+    oscillator.add_argument("--v1", type=float, default=10.0)
+    oscillator.add_argument("--m2", type=float, default=1.0)
+    oscillator.add_argument("--v2", type=float, default=0.0)
+
+    matrix = systems.add_parser("matrix")
+    matrix.add_argument("--type", default="rotation", choices=['rotation', 'scaling', 'shearing', 'reflection', 'collapse'])
+    matrix.add_argument("--param", action="append", default=[], metavar="NAME=SPEC",
+                        help="Family parameter as 'value' or 'start:stop:count', e.g. angle=0:3.14:1000")
+    matrix.add_argument("--count", type=int, default=1, help="Rows for the parameterless types (reflection, collapse)")
+    matrix.add_argument("-n", type=int, default=100, help="Points of the circular vector space")
+
+    for system in (projectile, oscillator, matrix):
+        system.add_argument("--output", default="sweep.npy", help=".npy file for the results")
+        system.add_argument("--chunk-size", type=int, default=10_000)
+        system.add_argument("--workers", type=int, default=None, help="Defaults to the CPU count")
+        system.add_argument("--restart", action="store_true", help="Ignore the checkpoint manifest")
+    sweep.set_defaults(func=cmd_sweep)
+
+    # dispersion
+    dispersion = commands.add_parser("dispersion", help="Monte Carlo dispersion of projectile landing and apogee")
+    dispersion.add_argument("--draws", type=int, default=1_000_000)
+    dispersion.add_argument("--speed", type=_distribution, default=("normal", 65.0, 1.0),
+                            help="'value' or 'method:param:...', e.g. normal:65:1 (m/s)")
+    dispersion.add_argument("--angle", type=_distribution, default=("normal", 45.0, 0.5),
+                            help="'value' or 'method:param:...' (degrees)")
+    dispersion.add_argument("--ax", type=_distribution, default=("fixed", 0.0),
+                            help="'value' or 'method:param:...', e.g. uniform:-3.5:-2.5 (m/s²)")
+    dispersion.add_argument("--ay", type=float, default=-9.81)
+    dispersion.add_argument("--height", type=float, default=0.0, help="Launch height above the landing ground (m)")
+    dispersion.add_argument("--mass", type=float, default=5.0)
+    dispersion.add_argument("--chunk-size", type=int, default=1_000_000, help="Draws per chunk, bounds memory")
+    dispersion.add_argument("--seed", type=int, default=0)
+    dispersion.add_argument("--workers", type=int, default=1, help="Worker processes, 0 for the CPU count")
+    dispersion.add_argument("--output", help=".npz file for the statistics")
+    dispersion.add_argument("--plot", metavar="PNG", help="Dispersion plot over the nominal trajectory")
+    dispersion.set_defaults(func=cmd_dispersion)
+
+    # store
+    store = commands.add_parser("store", help="Result store with a parameter index")
+    store.add_argument("--root", default="results", help="Store folder")
+    actions = store.add_subparsers(dest="action", required=True)
+    put = actions.add_parser("put", help="Add JSON outputs to the store")
+    put.add_argument("files", nargs="+")
+    put.add_argument("--param", action="append", default=[], metavar="FIELD=VALUE",
+                     help="Index parameter the outputs do not record (e.g. m1, v1, m2, v2 of oscillator "
+                          "runs), applied to every file")
+    query = actions.add_parser("query", help="List runs by parameter ranges")
+    query.add_argument("--kind", choices=["projectile", "oscillator"])
+    query.add_argument("--where", action="append", default=[], metavar="FIELD=LOW:HIGH",
+                       help="Inclusive range (either end may be empty) or FIELD=VALUE")
+    store.set_defaults(func=cmd_store)
+
+    # validate
+    validate = commands.add_parser("validate", help="Check outputs against the analytic solutions")
+    validate.add_argument("files", nargs="*", help="Projectile / oscillator JSON outputs")
+    validate.add_argument("--store", metavar="ROOT", help="Also validate the runs of a result store")
+    validate.add_argument("--kind", choices=["projectile", "oscillator"], help="With --store, only this kind")
+    validate.add_argument("--rtol", type=float, default=1e-4,
+                          help="Largest relative error, energy drift and metadata mismatch to pass")
+    validate.add_argument("--output", help=".npy file for the structured table")
+    validate.set_defaults(func=cmd_validate)
+
+    # bench
+    bench = commands.add_parser("bench", help="Benchmark load, compute, render and encode paths")
+    bench.add_argument("--sizes", type=int, nargs="+", default=None, help="Dataset sizes, default 10^2 ... 10^7")
+    bench.add_argument("--cases", nargs="+", default=None, help="Subset of benchmark cases")
+    bench.add_argument("--repeat", type=int, default=3)
+    bench.add_argument("--output", help="JSON file for the results")
+    bench.add_argument("--baseline", help="Earlier results JSON to compare against")
+    bench.add_argument("--threshold", type=float, default=0.1, help="Allowed relative slowdown (0.1 = 10%%)")
+    bench.set_defaults(func=cmd_bench)
+
+    return parser
+
+
+def main(argv:list[str]|None = None) -> None:
+    args = build_parser().parse_args(argv)
+    if args.dtype or args.memory_budget:
+        from toolkit import precision
+        precision.configure(dtype=args.dtype, memory_budget=args.memory_budget)
+    if not args.profile:
+        args.func(args)
+        return
+
+    from toolkit import instrument
+    instrument.enable(trace_memory=args.trace_memory)
+    instrument.instrument_projects()
+    try:
+        with instrument.span(args.command):
+            args.func(args)
+    finally:
+        instrument.disable()
+        instrument.write_profile(args.profile)
+        print(instrument.summary())
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
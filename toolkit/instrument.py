@@ -0,0 +1,257 @@
+"""
+Opt-in timing spans for the pipeline stages.
+
+    from toolkit import instrument
+
+    instrument.enable(trace_memory=True)
+    with instrument.span("render"):
+        ...
+    instrument.write_profile("profile.json")
+    print(instrument.summary())
+
+Spans nest; each one records wall time, call count and, with trace_memory, the
+peak traced memory (tracemalloc) above the level at which it started. Each thread
+nests its own spans, so work done by background threads (toolkit.pipeline) shows up
+as separate root spans; tracemalloc peaks are process-wide. While
+disabled, span() hands back one shared no-op context manager and instrumented
+functions cost a single flag check per call.
+
+instrument_projects() wraps the project loaders, the FuncAnimation callbacks,
+Figure.savefig, Animation.save and Matrix.visualize, so the unmodified scripts
+report their stages too. `python -m toolkit --profile run.json ...` does all of it.
+"""
+import contextlib
+import functools
+import json
+import platform
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from toolkit import modules
+
+
+class _State:
+    enabled:bool = False
+    trace_memory:bool = False
+    started_tracemalloc:bool = False  # whether enable() started tracemalloc, so disable() stops it
+    # Per-thread span stacks
+    local = threading.local()
+    lock = threading.Lock()
+    # Stack path (tuple of span names) -> [calls, total_s, self_s, max_s, peak_bytes]
+    records:dict = {}
+
+
+_NULL_SPAN = contextlib.nullcontext()
+
+
+def _stack() -> list:
+    try:
+        return _State.local.stack
+    except AttributeError:
+        _State.local.stack = []
+        return _State.local.stack
+
+
+class _Span:
+    __slots__ = ("name", "path", "start", "children", "peak", "memory_start")
+
+    def __init__(self, name:str):
+        self.name = name
+
+    def __enter__(self):
+        stack = _stack()
+        self.path = (stack[-1].path if stack else ()) + (self.name,)
+        self.children = 0.0
+        self.peak = 0
+        if _State.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+            self.memory_start = current
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        stack = _stack()
+        stack.pop()
+        peak_bytes = 0
+        if _State.trace_memory:
+            self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            peak_bytes = self.peak - self.memory_start
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, self.peak)
+        if stack:
+            stack[-1].children += elapsed
+
+        with _State.lock:
+            record = _State.records.get(self.path)
+            if record is None:
+                _State.records[self.path] = [1, elapsed, elapsed - self.children, elapsed, peak_bytes]
+            else:
+                record[0] += 1
+                record[1] += elapsed
+                record[2] += elapsed - self.children
+                record[3] = max(record[3], elapsed)
+                record[4] = max(record[4], peak_bytes)
+        return False
+
+
+def enable(trace_memory:bool = False) -> None:
+    """Starts recording spans; trace_memory also starts tracemalloc (slows allocations)."""
+    _State.enabled = True
+    _State.trace_memory = trace_memory
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _State.started_tracemalloc = True
+
+
+def disable() -> None:
+    """Stops recording spans. Recorded data is kept until reset()."""
+    _State.enabled = False
+    # Tracing started by someone else (e.g. python -X tracemalloc) is left running
+    if _State.started_tracemalloc and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _State.started_tracemalloc = False
+
+
+def is_enabled() -> bool:
+    return _State.enabled
+
+
+def reset() -> None:
+    """Drops all recorded spans."""
+    _State.records = {}
+    _State.local = threading.local()
+
+
+def span(name:str):
+    """Context manager timing the enclosed block as `name` (no-op while disabled)."""
+    if not _State.enabled:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def instrumented(name:str|None = None):
+    """Decorator timing every call of the function as a span (default name: its __qualname__)."""
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _State.enabled:
+                return func(*args, **kwargs)
+            with _Span(span_name):
+                return func(*args, **kwargs)
+        wrapper.__instrumented__ = True
+        return wrapper
+    return decorator
+
+
+# ---------------------------------------------------------------- project hooks
+
+def _wrap(owner, attribute:str, name:str) -> None:
+    func = getattr(owner, attribute)
+    if getattr(func, "__instrumented__", False):
+        return
+    setattr(owner, attribute, instrumented(name)(func))
+
+
+def _instrument_matplotlib() -> None:
+    import matplotlib.animation
+    import matplotlib.figure
+
+    _wrap(matplotlib.figure.Figure, "savefig", "savefig")
+    _wrap(matplotlib.animation.Animation, "save", "anim.save")
+
+    func_animation_init = matplotlib.animation.FuncAnimation.__init__
+    if getattr(func_animation_init, "__instrumented__", False):
+        return
+
+    @functools.wraps(func_animation_init)
+    def __init__(self, fig, func, *args, **kwargs):
+        # The per-frame `animate` callbacks are closures, wrap them where they are handed over
+        func_animation_init(self, fig, instrumented("animate")(func), *args, **kwargs)
+    __init__.__instrumented__ = True
+    matplotlib.animation.FuncAnimation.__init__ = __init__
+
+
+def _instrument_module(name:str, module) -> None:
+    if name == "plots":
+        _instrument_matplotlib()
+        _wrap(module.ProjectileMotionVisualizer, "__init__", "load.projectile")
+        _wrap(module.ProjectileMotionVisualizer, "plot_trajectory", "plot_trajectory")
+        _wrap(module.ProjectileMotionVisualizer, "plot_velocity_components", "plot_velocity_components")
+        _wrap(module.ProjectileMotionVisualizer, "animate_projectile", "animate_projectile")
+    elif name == "visualizer":
+        _instrument_matplotlib()
+        _wrap(module, "load_data", "load.oscillator")
+        _wrap(module, "create_oscillation_animation", "create_oscillation_animation")
+    elif name == "vector_viz":
+        _instrument_matplotlib()
+        _wrap(module.VectorVisualizer, "__init__", "load.vectors")
+        _wrap(module.VectorVisualizer, "plot_vectors", "plot_vectors")
+    elif name == "determinant":
+        # determinant.py imports matplotlib lazily; only profiled runs pay for it here
+        _instrument_matplotlib()
+        _wrap(module.Matrix, "visualize", "Matrix.visualize")
+        _wrap(module.Matrix, "applyTransform", "Matrix.applyTransform")
+
+
+def instrument_projects() -> None:
+    """
+    Wraps the project stages in spans: loaders, animate callbacks, savefig, anim.save
+    and Matrix.visualize. Applies to modules already loaded through toolkit.modules and
+    to those loaded later; matplotlib is only patched once a plotting module is loaded.
+    """
+    for name in modules.MODULE_PATHS:
+        module = modules.loaded(name)
+        if module is not None:
+            _instrument_module(name, module)
+    if _instrument_module not in modules.LOAD_HOOKS:
+        modules.LOAD_HOOKS.append(_instrument_module)
+
+
+# ---------------------------------------------------------------- reports
+
+def profile() -> dict:
+    """Recorded spans as a JSON-serializable profile, slowest first."""
+    spans = [{"path": ";".join(path), "name": path[-1], "depth": len(path) - 1,
+              "calls": calls, "total_s": total, "self_s": self_time, "max_s": longest,
+              "peak_bytes": peak}
+             for path, (calls, total, self_time, longest, peak) in _State.records.items()]
+    spans.sort(key=lambda entry: entry["total_s"], reverse=True)
+    meta = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "trace_memory": _State.trace_memory,
+    }
+    return {"meta": meta, "spans": spans}
+
+
+def folded_stacks() -> str:
+    """Self time per stack in the folded format read by flamegraph tools (microseconds)."""
+    return "\n".join(f"{';'.join(path)} {round(record[2] * 1e6)}"
+                     for path, record in sorted(_State.records.items())) + "\n"
+
+
+def summary() -> str:
+    """Indented tree of spans with total/self time, calls and peak memory."""
+    lines = [f"{'span':<48} {'calls':>7} {'total ms':>11} {'self ms':>11} {'peak MiB':>9}"]
+    for path, (calls, total, self_time, _, peak) in sorted(_State.records.items()):
+        label = "  " * (len(path) - 1) + path[-1]
+        lines.append(f"{label:<48} {calls:>7} {total * 1e3:>11.2f} {self_time * 1e3:>11.2f} {peak / 2**20:>9.2f}")
+    return "\n".join(lines)
+
+
+def write_profile(path:str) -> None:
+    """Writes the JSON profile to `path` and the folded stacks next to it (.folded)."""
+    with open(path, "w") as f:
+        json.dump(profile(), f, indent=2)
+    with open(f"{path}.folded", "w") as f:
+        f.write(folded_stacks())
+    print(f"Profile saved to {path}")
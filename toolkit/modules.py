@@ -0,0 +1,91 @@
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Project scripts by module name, relative to the repository root.
+MODULE_PATHS:dict[str, str] = {
+    "determinant": "Linear Algebra/Linear Map Transformation Analysis by Determinant/determinant.py",
+    "analysis": "Linear Algebra/Linear Map Transformation Analysis by Determinant/analysis.py",
+    "vector_engine": "Linear Algebra/Vectors/vector_engine.py",
+    "vector_viz": "Linear Algebra/Vectors/vector_viz.py",
+    "kinematics": "Projectile Motion/kinematics.py",
+    "plots": "Projectile Motion/plots.py",
+    "oscillator": "Mass-Block Collision Harmonic Oscillator/oscillator.py",
+    "visualizer": "Mass-Block Collision Harmonic Oscillator/visualizer.py",
+}
+
+# Called as hook(name, module) after a project module is first loaded (see instrument.py).
+LOAD_HOOKS:list = []
+
+
+def project_dir(name:str) -> str:
+    """Absolute folder of a project module."""
+    return os.path.dirname(os.path.join(ROOT, MODULE_PATHS[name]))
+
+
+def load(name:str):
+    """
+    Imports a project script by name, once.
+
+    The module is registered as toolkit.project.<name>, and under its file name unless
+    another module already has it, so sibling imports inside the scripts (e.g.
+    `from vector_engine import ...`) resolve to the same module object. Its folder is
+    appended to sys.path, after the installed packages.
+
+    Parameters:
+    name (str): A key of MODULE_PATHS.
+
+    Returns:
+    module: The imported module.
+
+    Raises:
+    KeyError: If the module name is unknown.
+    """
+    if name not in MODULE_PATHS:
+        raise KeyError(f"Unknown module '{name}'. Available modules are: {list(MODULE_PATHS)}")
+    module = sys.modules.get(_key(name))
+    if module is not None:
+        return module
+
+    folder = project_dir(name)
+    if folder not in sys.path:
+        sys.path.append(folder)
+
+    # A sibling import may have imported the script under its file name already
+    module = loaded(name)
+    if module is None:
+        # __name__ stays the file name, which pickle uses to find classes and functions
+        spec = importlib.util.spec_from_file_location(name, _path(name))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[_key(name)] = module
+        aliased = sys.modules.setdefault(name, module) is module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[_key(name)]
+            if aliased:
+                del sys.modules[name]
+            raise
+    sys.modules[_key(name)] = module
+    for hook in LOAD_HOOKS:
+        hook(name, module)
+    return module
+
+
+def loaded(name:str):
+    """The project module if it has been imported already, else None."""
+    for key in (_key(name), name):
+        module = sys.modules.get(key)
+        if module is not None and os.path.abspath(getattr(module, "__file__", "") or "") == _path(name):
+            return module
+    return None
+
+
+def _key(name:str) -> str:
+    return f"toolkit.project.{name}"
+
+
+def _path(name:str) -> str:
+    return os.path.join(ROOT, MODULE_PATHS[name])
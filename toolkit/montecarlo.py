@@ -0,0 +1,397 @@
+"""
+Monte Carlo dispersion of projectile launches.
+
+Launch speed, angle and horizontal acceleration are drawn from configurable
+distributions in fixed-size chunks; each chunk is evaluated with the vectorized
+kinematics.projectile_summary and folded into streaming statistics, so memory stays
+bounded by the chunk size whatever the number of draws:
+
+    stats = run_monte_carlo(10**8, {"speed": ("normal", 65.0, 1.0),
+                                    "angle": ("normal", 45.0, 0.5),
+                                    "a_ox": ("uniform", -3.5, -2.5)}, fixed={"mass": 5.0})
+    print(stats.summary()["landing_x"])
+    plot_dispersion(stats, "dispersion.png")
+
+Launches land at y = 0, so a launch height (fixed={"s_oy": ...}) lengthens the flight.
+
+Distributions are (method, *parameters) tuples naming a numpy.random.Generator
+method (normal, uniform, lognormal, triangular, ...), or ("fixed", value). Angles are
+in degrees. Chunks get independent streams spawned from one SeedSequence, so results
+do not depend on how chunks are spread over processes.
+
+The statistics are mergeable: count, mean and covariance (Chan's parallel update),
+min/max, per-quantity histograms for approximate quantiles and 2D histograms of the
+landing (range, flight time) and apogee (x, height) points. Histogram ranges come from
+a pilot chunk (mean ± 8 standard deviations); draws outside are counted as under/overflow.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from toolkit import modules, precision
+
+# Tracked outputs, in the order of the mean vector and covariance matrix
+QUANTITIES:list[str] = ["landing_x", "total_time", "apogee_x", "h_max", "apogee_time",
+                        "angle_of_collapse", "energy_loss"]
+# 2D histograms: name -> (x quantity, y quantity)
+HISTOGRAMS_2D:dict[str, tuple[str, str]] = {
+    "landing": ("landing_x", "total_time"),
+    "apogee": ("apogee_x", "h_max"),
+}
+# Inputs that may be uncertain, with the kinematics argument they feed
+INPUTS:dict[str, str] = {"speed": "v", "angle": "v_angle", "a_ox": "a_ox"}
+# Working set of one draw: inputs, kinematics temporaries and the statistics pass, in float64 values
+_VALUES_PER_DRAW = 64
+
+
+def draw(rng:np.random.Generator, distributions:dict, size:int) -> dict[str, np.ndarray]:
+    """
+    Draws `size` launches.
+
+    Parameters:
+    rng (np.random.Generator): Random stream.
+    distributions (dict): Input name -> (method, *parameters), e.g. ("normal", 65.0, 1.0).
+    size (int): Number of draws.
+
+    Returns:
+    dict[str, np.ndarray]: One array per input.
+
+    Raises:
+    ValueError: For unknown inputs or distribution methods.
+    """
+    samples = {}
+    for name, (method, *parameters) in distributions.items():
+        if name not in INPUTS:
+            raise ValueError(f"Input '{name}' is not supported. Uncertain inputs are: {list(INPUTS)}")
+        if method == "fixed":
+            samples[name] = np.full(size, float(parameters[0]))
+        elif hasattr(rng, method):
+            samples[name] = getattr(rng, method)(*parameters, size=size)
+        else:
+            raise ValueError(f"Distribution '{method}' is not a numpy.random.Generator method")
+    return samples
+
+
+def evaluate(samples:dict[str, np.ndarray], fixed:dict|None = None) -> dict[str, np.ndarray]:
+    """Kinematics of every drawn launch, keyed by QUANTITIES."""
+    kinematics = modules.load("kinematics")
+    fixed = dict(fixed or {})
+    arguments = {"v": 65.0, "v_angle": np.radians(45.0), "a_ox": 0.0, **fixed}
+    for name, values in samples.items():
+        arguments[INPUTS[name]] = np.radians(values) if name == "angle" else values
+    result = kinematics.projectile_summary(**arguments)
+
+    v_ox = arguments["v"] * np.cos(arguments["v_angle"])
+    v_oy = arguments["v"] * np.sin(arguments["v_angle"])
+    s_ox, s_oy = arguments.get("s_ox", 0.0), arguments.get("s_oy", 0.0)
+    a_ox, a_oy = arguments["a_ox"], arguments.get("a_oy", -9.81)
+    mass = arguments.get("mass", 1.0)
+    apogee_time = result["apogee_time"]
+    result["apogee_x"] = s_ox + v_ox * apogee_time + a_ox * apogee_time**2 / 2
+
+    # projectile_summary lands at the launch height (2 * apogee_time, as main.cpp does);
+    # the landing here is the positive root of s_oy + v_oy t + a_oy t² / 2 = 0
+    total_time = (-v_oy - np.sqrt(v_oy**2 - 2 * a_oy * s_oy)) / a_oy
+    vx_final = v_ox + a_ox * total_time
+    vy_final = v_oy + a_oy * total_time
+    energy_initial = mass * (v_ox**2 + v_oy**2) / 2 + mass * (-a_oy) * s_oy
+    energy_final = mass * (vx_final**2 + vy_final**2) / 2
+    result["total_time"] = total_time
+    result["landing_x"] = s_ox + v_ox * total_time + a_ox * total_time**2 / 2
+    result["angle_of_collapse"] = np.degrees(np.arctan2(vy_final, vx_final))
+    result["energy_loss"] = 1 - energy_final / energy_initial
+    return {name: np.asarray(result[name], dtype=result["apogee_time"].dtype) for name in QUANTITIES}
+
+
+class DispersionStats:
+    """Streaming, mergeable statistics over the QUANTITIES of many launches."""
+
+    def __init__(self, ranges:dict[str, tuple[float, float]], bins:int = 1024, bins_2d:int = 256):
+        """
+        Parameters:
+        ranges (dict): Quantity -> (low, high) histogram range.
+        bins (int): Bins of the 1D histograms used for quantiles. Default is 1024.
+        bins_2d (int): Bins per axis of the 2D histograms. Default is 256.
+        """
+        k = len(QUANTITIES)
+        self.ranges = {name: (float(low), float(high)) for name, (low, high) in ranges.items()}
+        self.bins = bins
+        self.bins_2d = bins_2d
+        self.count = 0
+        self.mean = np.zeros(k)
+        self.m2 = np.zeros((k, k))
+        self.minimum = np.full(k, np.inf)
+        self.maximum = np.full(k, -np.inf)
+        self.histograms = np.zeros((k, bins), dtype=np.int64)
+        self.underflow = np.zeros(k, dtype=np.int64)
+        self.overflow = np.zeros(k, dtype=np.int64)
+        self.histograms_2d = {name: np.zeros((bins_2d, bins_2d), dtype=np.int64) for name in HISTOGRAMS_2D}
+
+    def _merge_moments(self, count:int, mean:np.ndarray, m2:np.ndarray) -> None:
+        total = self.count + count
+        if total == 0:
+            return
+        delta = mean - self.mean
+        self.m2 += m2 + np.outer(delta, delta) * (self.count * count / total)
+        self.mean += delta * (count / total)
+        self.count = total
+
+    def update(self, values:dict[str, np.ndarray]) -> None:
+        """Adds one chunk of evaluated launches (output of evaluate())."""
+        matrix = np.stack([np.asarray(values[name], dtype=np.float64) for name in QUANTITIES])
+        count = matrix.shape[1]
+        if count == 0:
+            return
+        mean = matrix.mean(axis=1)
+        centered = matrix - mean[:, None]
+        self._merge_moments(count, mean, centered @ centered.T)
+        self.minimum = np.minimum(self.minimum, matrix.min(axis=1))
+        self.maximum = np.maximum(self.maximum, matrix.max(axis=1))
+
+        for index, name in enumerate(QUANTITIES):
+            low, high = self.ranges[name]
+            row = matrix[index]
+            self.underflow[index] += np.count_nonzero(row < low)
+            self.overflow[index] += np.count_nonzero(row > high)
+            # bincount on precomputed bin indices is several times faster than np.histogram
+            inside = row[(row >= low) & (row <= high)]
+            position = ((inside - low) * (self.bins / (high - low))).astype(np.int64)
+            self.histograms[index] += np.bincount(np.minimum(position, self.bins - 1), minlength=self.bins)
+
+        for name, (x_name, y_name) in HISTOGRAMS_2D.items():
+            x, y = matrix[QUANTITIES.index(x_name)], matrix[QUANTITIES.index(y_name)]
+            (x_low, x_high), (y_low, y_high) = self.ranges[x_name], self.ranges[y_name]
+            inside = (x >= x_low) & (x <= x_high) & (y >= y_low) & (y <= y_high)
+            column = np.minimum(((x[inside] - x_low) * (self.bins_2d / (x_high - x_low))).astype(np.int64), self.bins_2d - 1)
+            row = np.minimum(((y[inside] - y_low) * (self.bins_2d / (y_high - y_low))).astype(np.int64), self.bins_2d - 1)
+            self.histograms_2d[name] += np.bincount(row * self.bins_2d + column,
+                                                    minlength=self.bins_2d**2).reshape(self.bins_2d, self.bins_2d)
+
+    def merge(self, other:"DispersionStats") -> "DispersionStats":
+        """Folds another accumulator with the same ranges into this one."""
+        if other.ranges != self.ranges or other.bins != self.bins or other.bins_2d != self.bins_2d:
+            raise ValueError("Cannot merge dispersion statistics with different histogram ranges or bins")
+        self._merge_moments(other.count, other.mean, other.m2)
+        self.minimum = np.minimum(self.minimum, other.minimum)
+        self.maximum = np.maximum(self.maximum, other.maximum)
+        self.histograms += other.histograms
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        for name in self.histograms_2d:
+            self.histograms_2d[name] += other.histograms_2d[name]
+        return self
+
+    @property
+    def covariance(self) -> np.ndarray:
+        """Sample covariance matrix, rows and columns in QUANTITIES order."""
+        return self.m2 / max(self.count - 1, 1)
+
+    @property
+    def std(self) -> np.ndarray:
+        return np.sqrt(np.diag(self.covariance))
+
+    def quantile(self, name:str, q):
+        """
+        Approximate quantile(s) of a quantity from its histogram, interpolated within bins.
+        Accurate to about one bin width, (high - low) / bins; exact at 0 and 1.
+        """
+        index = QUANTITIES.index(name)
+        low, high = self.ranges[name]
+        q = np.asarray(q, dtype=np.float64)
+        # Cumulative counts at the bin edges, with under/overflow at the range ends
+        cumulative = np.concatenate(([self.underflow[index]], self.underflow[index] + np.cumsum(self.histograms[index])))
+        edges = np.linspace(low, high, self.bins + 1)
+        values = np.interp(q * self.count, cumulative, edges)
+        values = np.where(q <= 0, self.minimum[index], values)
+        return np.where(q >= 1, self.maximum[index], values)
+
+    def summary(self, quantiles=(0.01, 0.05, 0.5, 0.95, 0.99)) -> dict:
+        """Per quantity: mean, std, min, max and the requested quantiles."""
+        std = self.std
+        result = {}
+        for index, name in enumerate(QUANTITIES):
+            entry = {"mean": float(self.mean[index]), "std": float(std[index]),
+                     "min": float(self.minimum[index]), "max": float(self.maximum[index])}
+            for q, value in zip(quantiles, np.atleast_1d(self.quantile(name, quantiles))):
+                entry[f"q{q:g}"] = float(value)
+            result[name] = entry
+        return result
+
+    def save(self, path:str) -> None:
+        """Saves the accumulator as .npz (ranges, moments and histograms)."""
+        np.savez(path, quantities=np.array(QUANTITIES), ranges=np.array([self.ranges[name] for name in QUANTITIES]),
+                 bins=self.bins, bins_2d=self.bins_2d, count=self.count, mean=self.mean, m2=self.m2,
+                 minimum=self.minimum, maximum=self.maximum, histograms=self.histograms,
+                 underflow=self.underflow, overflow=self.overflow,
+                 **{f"histogram_2d_{name}": values for name, values in self.histograms_2d.items()})
+
+    @classmethod
+    def load(cls, path:str) -> "DispersionStats":
+        with np.load(path) as f:
+            stats = cls(dict(zip(f["quantities"].tolist(), map(tuple, f["ranges"]))), int(f["bins"]), int(f["bins_2d"]))
+            stats.count = int(f["count"])
+            for field in ("mean", "m2", "minimum", "maximum", "histograms", "underflow", "overflow"):
+                setattr(stats, field, f[field].copy())
+            stats.histograms_2d = {name: f[f"histogram_2d_{name}"].copy() for name in HISTOGRAMS_2D}
+        return stats
+
+
+def input_means(distributions:dict, size:int = 100_000, seed:int|None = 0) -> dict[str, float]:
+    """Sample means of the inputs from a pilot draw, e.g. the nominal launch for plot_dispersion()."""
+    samples = draw(np.random.default_rng(seed), distributions, size)
+    return {name: float(values.mean()) for name, values in samples.items()}
+
+
+def pilot_ranges(distributions:dict, fixed:dict|None = None, size:int = 100_000, seed:int|None = 0,
+                 spread:float = 8.0) -> dict[str, tuple[float, float]]:
+    """Histogram ranges from a pilot sample: mean ± spread standard deviations, clipped to what can occur."""
+    values = evaluate(draw(np.random.default_rng(seed), distributions, size), fixed)
+    ranges = {}
+    for name in QUANTITIES:
+        column = values[name]
+        center, width = column.mean(), spread * column.std()
+        if width == 0:
+            # Deterministic quantity (every input fixed); give the histogram a nominal width
+            width = max(abs(center) * 1e-6, 1e-12)
+        ranges[name] = (center - width, center + width)
+    return ranges
+
+
+def _run_chunks(distributions:dict, fixed:dict, ranges:dict, bins:int, bins_2d:int,
+                seeds:list, sizes:list[int]) -> DispersionStats:
+    """Worker: draws and accumulates a group of chunks."""
+    stats = DispersionStats(ranges, bins, bins_2d)
+    for seed, size in zip(seeds, sizes):
+        rng = np.random.default_rng(seed)
+        stats.update(evaluate(draw(rng, distributions, size), fixed))
+    return stats
+
+
+def run_monte_carlo(draws:int, distributions:dict, fixed:dict|None = None, chunk_size:int = 1_000_000,
+                    seed:int|None = 0, max_workers:int|None = 1, bins:int = 1024, bins_2d:int = 256,
+                    ranges:dict|None = None) -> DispersionStats:
+    """
+    Runs a Monte Carlo dispersion study.
+
+    Parameters:
+    draws (int): Number of launches.
+    distributions (dict): Uncertain inputs ('speed' m/s, 'angle' degrees, 'a_ox' m/s²)
+    -> (method, *parameters), see draw().
+    fixed (dict): Other projectile_summary arguments (a_oy, s_ox, s_oy, mass), and
+    values for inputs without a distribution (defaults: 65 m/s, 45°, a_ox = 0).
+    chunk_size (int): Draws per chunk; bounds the memory per worker. Default is 10^6,
+    lowered to fit the memory budget (toolkit.precision).
+    seed (int): Root seed; the same seed and chunk size give the same statistics for any
+    worker count.
+    max_workers (int): Worker processes, 1 runs in this process, None uses os.cpu_count().
+    bins, bins_2d (int): Histogram resolution.
+    ranges (dict): Histogram ranges per quantity, estimated from a pilot chunk by default.
+
+    Returns:
+    DispersionStats: The merged statistics.
+    """
+    fixed = dict(fixed or {})
+    if "angle" in fixed:
+        # Keep the degree convention of the distributions for a fixed angle too
+        fixed["v_angle"] = np.radians(fixed.pop("angle"))
+    if "speed" in fixed:
+        fixed["v"] = fixed.pop("speed")
+    ranges = ranges or pilot_ranges(distributions, fixed, seed=None if seed is None else seed + 1)
+
+    workers = max_workers or os.cpu_count() or 1
+    # Every worker holds one chunk at a time
+    chunk_size = precision.rows_within(_VALUES_PER_DRAW * 8 * workers, chunk_size)
+    sizes = [min(chunk_size, draws - start) for start in range(0, draws, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    workers = min(workers, len(sizes)) if sizes else 1
+
+    if workers == 1:
+        return _run_chunks(distributions, fixed, ranges, bins, bins_2d, seeds, sizes)
+
+    # Contiguous groups of chunks, one task per worker; results merge in any order
+    groups = np.array_split(np.arange(len(sizes)), workers)
+    stats = DispersionStats(ranges, bins, bins_2d)
+    with ProcessPoolExecutor(max_workers=workers, initializer=precision.configure,
+                             initargs=precision.policy()) as executor:
+        futures = [executor.submit(_run_chunks, distributions, fixed, ranges, bins, bins_2d,
+                                   [seeds[i] for i in group], [sizes[i] for i in group]) for group in groups]
+        for future in futures:
+            stats.merge(future.result())
+    return stats
+
+
+def plot_dispersion(stats:DispersionStats, save_path:str|None = "dispersion.png", fixed:dict|None = None,
+                    nominal:dict|None = None):
+    """
+    Plots the dispersion on the trajectory figure of ProjectileMotionVisualizer: the
+    nominal trajectory with the apogee density and the landing-range distribution.
+
+    Parameters:
+    stats (DispersionStats): Output of run_monte_carlo.
+    save_path (str): PNG to write (300 dpi like the trajectory plot), None to skip saving.
+    fixed (dict): Fixed arguments used for the study (a_oy, s_oy, mass, ...).
+    nominal (dict): Nominal 'speed', 'angle' (degrees) and 'a_ox' for the drawn trajectory.
+
+    Returns:
+    matplotlib.figure.Figure
+    """
+    import matplotlib.colors as colors
+    from matplotlib.patches import Ellipse
+
+    kinematics, plots = modules.load("kinematics"), modules.load("plots")
+    nominal = {"speed": 65.0, "angle": 45.0, "a_ox": 0.0, **(nominal or {})}
+    fixed = {key: value for key, value in (fixed or {}).items() if key in ("s_ox", "s_oy", "a_oy", "mass")}
+    run = kinematics.simulate_projectile(v=nominal["speed"], v_angle=np.radians(nominal["angle"]),
+                                         a_ox=nominal["a_ox"], **fixed)
+    viz = plots.ProjectileMotionVisualizer(json_data=run, output_folder=os.path.dirname(save_path or "") or ".")
+    fig, artists = viz.trajectory_template()
+    viz.draw_trajectory((fig, artists))
+    ax = artists["ax"]
+    ax.set_title(f"Projectile Motion Dispersion ({stats.count:,} launches)")
+
+    # Apogee density
+    x_name, y_name = HISTOGRAMS_2D["apogee"]
+    (x_low, x_high), (y_low, y_high) = stats.ranges[x_name], stats.ranges[y_name]
+    density = np.ma.masked_equal(stats.histograms_2d["apogee"], 0)
+    image = ax.imshow(density, origin="lower", extent=(x_low, x_high, y_low, y_high), aspect="auto",
+                      cmap="Oranges", norm=colors.LogNorm(), alpha=0.8, zorder=1)
+    fig.colorbar(image, ax=ax, label="Apogee count", fraction=0.04, pad=0.02)
+
+    # 2-sigma covariance ellipse of the apogee point
+    i, j = QUANTITIES.index(x_name), QUANTITIES.index(y_name)
+    covariance = stats.covariance[np.ix_([i, j], [i, j])]
+    eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+    minor, major = 2 * 2 * np.sqrt(np.maximum(eigenvalues, 0))
+    angle = np.degrees(np.arctan2(eigenvectors[1, 1], eigenvectors[0, 1]))
+    ax.add_patch(Ellipse((stats.mean[i], stats.mean[j]), major, minor, angle=angle,
+                         fill=False, color='orange', linestyle='--', linewidth=1.5, label='Apogee 2σ'))
+
+    # Landing range distribution along the ground, scaled to a tenth of the apogee height
+    index = QUANTITIES.index("landing_x")
+    low, high = stats.ranges["landing_x"]
+    edges = np.linspace(low, high, stats.bins + 1)
+    counts = stats.histograms[index]
+    if counts.max() > 0:
+        scale = 0.1 * max(stats.mean[QUANTITIES.index("h_max")], 1e-12) / counts.max()
+        ax.stairs(counts * scale, edges, fill=True, color='red', alpha=0.4, label='Landing distribution')
+    for q in (0.05, 0.95):
+        ax.axvline(float(stats.quantile("landing_x", q)), color='red', linestyle=':', linewidth=1)
+
+    summary = stats.summary()
+    landing, h_max = summary["landing_x"], summary["h_max"]
+    artists["info"].set_text(f"Landing x: {landing['mean']:.2f} ± {landing['std']:.2f} m\n"
+                             f"Landing x 5-95%: {landing['q0.05']:.2f} – {landing['q0.95']:.2f} m\n"
+                             f"Max Height: {h_max['mean']:.2f} ± {h_max['std']:.2f} m\n"
+                             f"Flight Time: {summary['total_time']['mean']:.2f} ± {summary['total_time']['std']:.2f} s\n"
+                             f"Apogee Time: {summary['apogee_time']['mean']:.2f} ± {summary['apogee_time']['std']:.2f} s")
+    ax.legend()
+    ax.relim()
+    ax.autoscale_view()
+    fig.tight_layout()
+
+    if save_path:
+        os.makedirs(os.path.dirname(os.path.abspath(save_path)), exist_ok=True)
+        fig.savefig(save_path, dpi=300, bbox_inches='tight')
+        print(f"Dispersion plot saved as: {save_path}")
+    return fig
@@ -0,0 +1,189 @@
+"""
+Prefetching render pipeline.
+
+A background thread reads and decodes the next datasets into a bounded queue while
+the main thread renders the current one, so disk, parsing and matplotlib overlap
+instead of taking turns:
+
+    report = render_projectile_files(paths, "plots", depth=4)
+    print(format_report(report))
+
+Rendering stays on the calling thread (matplotlib is not thread safe); only loading
+runs in the background. The queue holds at most `depth` decoded datasets and the
+loader blocks once it is full, so at most depth + 2 datasets (queued, being
+decoded, being rendered) are alive at any time.
+
+Per-item timings distinguish decode time (background), wait time (renderer starved
+for input) and render time. When wait time is near zero the run is render-bound and
+a deeper queue gains nothing.
+"""
+import os
+import queue
+import threading
+import time
+
+from toolkit import instrument, modules
+
+_DONE = object()
+
+
+def prefetch(sources, load, depth:int = 2):
+    """
+    Iterates over load(source) for every source, decoding ahead on a background thread.
+
+    Parameters:
+    sources: Iterable of inputs for `load` (paths, specs, ...).
+    load: Function source -> dataset, run on the background thread.
+    depth (int): Decoded datasets kept ready ahead of the consumer. Default is 2.
+
+    Yields:
+    tuple: (source, dataset, {"decode_s", "wait_s"})
+
+    Raises:
+    Exception: Whatever `load` raised, re-raised on the consuming thread.
+    """
+    if depth < 1:
+        raise ValueError(f"Prefetch depth must be at least 1, got {depth}")
+    ready:queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(entry) -> bool:
+        # Blocks while the queue is full (backpressure), but gives up once the consumer stops
+        while not stop.is_set():
+            try:
+                ready.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def producer() -> None:
+        source = None
+        try:
+            for source in sources:
+                if stop.is_set():
+                    return
+                start = time.perf_counter()
+                dataset = load(source)
+                if not put((source, dataset, time.perf_counter() - start, None)):
+                    return
+                del dataset
+        except Exception as error:
+            # Errors from load() and from iterating the sources both reach the consumer
+            put((source, None, 0.0, error))
+        finally:
+            put(_DONE)
+
+    thread = threading.Thread(target=producer, name="toolkit-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            start = time.perf_counter()
+            entry = ready.get()
+            wait = time.perf_counter() - start
+            if entry is _DONE:
+                return
+            source, dataset, decode, error = entry
+            if error is not None:
+                raise error
+            yield source, dataset, {"decode_s": decode, "wait_s": wait}
+    finally:
+        stop.set()
+        thread.join()
+
+
+def run_pipeline(sources, load, render, depth:int = 2) -> dict:
+    """
+    Loads every source with prefetching and renders each dataset on this thread.
+
+    Parameters:
+    sources: Iterable of inputs for `load`.
+    load: Function source -> dataset, run on the background thread.
+    render: Function (source, dataset) -> None, run on the calling thread.
+    depth (int): Decoded datasets kept ready ahead of the renderer. Default is 2.
+
+    Returns:
+    dict: {"items": [{"source", "decode_s", "wait_s", "render_s"}, ...],
+    "wall_s", "decode_s", "wait_s", "render_s", "depth"}
+    """
+    items = []
+    start = time.perf_counter()
+    for source, dataset, timings in prefetch(sources, load, depth):
+        render_start = time.perf_counter()
+        with instrument.span("pipeline.render"):
+            render(source, dataset)
+        items.append({"source": str(source), **timings, "render_s": time.perf_counter() - render_start})
+        # Drop the dataset before blocking on the next one, so it is not kept alive during the wait
+        del dataset
+    report = {"items": items, "wall_s": time.perf_counter() - start, "depth": depth}
+    for stage in ("decode_s", "wait_s", "render_s"):
+        report[stage] = sum(item[stage] for item in items)
+    return report
+
+
+def format_report(report:dict) -> str:
+    """Per-stage totals of a run_pipeline() report."""
+    count = len(report["items"])
+    lines = [f"{count} datasets in {report['wall_s']:.2f} s (prefetch depth {report['depth']})"]
+    for stage, label in (("decode_s", "decode (background)"), ("wait_s", "wait for input"), ("render_s", "render")):
+        total = report[stage]
+        lines.append(f"  {label:<20} {total:9.3f} s total, {total / max(count, 1) * 1e3:9.2f} ms per dataset")
+    serial = report["decode_s"] + report["render_s"]
+    if report["wall_s"] > 0:
+        lines.append(f"  overlap speedup      {serial / report['wall_s']:9.2f}x over load-then-render")
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------- project drivers
+
+def render_projectile_files(paths, output_root:str, depth:int = 2, animation:bool = False) -> dict:
+    """
+    Renders the trajectory and velocity plots (and optionally the GIF) of many
+    projectile JSON files into output_root/<file stem>/, through the pooled templates.
+    A .cols sidecar next to a JSON file (toolkit.writer) is read instead when present.
+    """
+    from toolkit import templates
+    from toolkit.writer import load_run
+    plots = modules.load("plots")
+
+    def load(path):
+        folder = os.path.join(output_root, os.path.splitext(os.path.basename(path))[0])
+        return plots.ProjectileMotionVisualizer(json_data=load_run(path), output_folder=folder)
+
+    def render(path, viz):
+        templates.render_trajectory(viz, os.path.join(viz.output_dir, "trajectory_plot.png"))
+        templates.render_velocity_components(viz, os.path.join(viz.output_dir, "velocity_components.png"))
+        if animation:
+            templates.render_projectile_animation(viz, os.path.join(viz.output_dir, "projectile_motion.gif"))
+
+    return run_pipeline(paths, load, render, depth)
+
+
+def render_oscillator_files(paths, output_root:str, depth:int = 2) -> dict:
+    """
+    Renders the block-spring GIF of many oscillator JSON files into output_root/<file stem>.gif,
+    reading their .cols sidecars when present.
+    """
+    from toolkit import templates
+    from toolkit.writer import load_run
+
+    def render(path, data):
+        stem = os.path.splitext(os.path.basename(path))[0]
+        templates.render_oscillation_animation(data, os.path.join(output_root, f"{stem}.gif"))
+
+    return run_pipeline(paths, load_run, render, depth)
+
+
+def render_matrices(specs, depth:int = 2) -> dict:
+    """
+    Builds and renders many Matrix figures; each spec is a dict of Matrix keyword
+    arguments (type, vector_space_type, n, save_path, ...). The vector spaces and
+    transforms are computed in the background, the figures through the pooled templates.
+    """
+    from toolkit import templates
+    determinant = modules.load("determinant")
+
+    def load(spec):
+        return determinant.Matrix(**{**spec, "render": False})
+
+    return run_pipeline(specs, load, lambda spec, matrix: templates.render_matrix(matrix), depth)
@@ -0,0 +1,135 @@
+"""
+Floating point precision and memory budget shared by the loaders and engines.
+
+The C++ programs store every column as float, while NumPy defaults to float64. The
+policy picks the dtype used when columns are loaded (ProjectileMotionVisualizer,
+bind_oscillation_data, VectorVisualizer.plot_vectors) and when the compute engines
+(kinematics, oscillator, vector_engine, analysis, validate, phase) build arrays:
+
+    precision.configure(dtype="float32", memory_budget="2GB")
+
+Project scripts do not import the toolkit. The ones listed in MODULES have a
+module-level DTYPE (float64 when run on their own) for the arrays they load or compute;
+configure() sets it in those loaded through toolkit.modules, now and later, and returns
+the names of the modules it patched. Analysis reports (analysis.analysis_dtype) follow
+the precision of the matrices, complex eigenvalues included.
+
+The memory budget bounds what is held in memory at once. Batch and chunk sizes of
+validate, phase, sweep and montecarlo are capped to fit it, and load_run() converts a
+JSON output that would not fit once parsed into a .cols sidecar in a cache folder
+(toolkit.writer.CACHE_DIR) and memory-maps it instead. The default budget is half the
+physical memory.
+
+Worker processes do not inherit the policy under every start method; pools pass
+initializer=configure, initargs=policy() to their workers.
+"""
+import os
+import re
+
+import numpy as np
+
+from toolkit import modules
+
+DTYPES:dict[str, type] = {"float32": np.float32, "float64": np.float64}
+# Project modules (toolkit.modules names) whose DTYPE follows the policy
+MODULES:tuple[str, ...] = ("kinematics", "plots", "oscillator", "visualizer", "vector_engine", "vector_viz", "analysis")
+_UNITS = {"": 1, "B": 1, "K": 2**10, "KB": 2**10, "M": 2**20, "MB": 2**20, "G": 2**30, "GB": 2**30, "T": 2**40, "TB": 2**40}
+
+
+class _Policy:
+    dtype:np.dtype = np.dtype(np.float64)
+    memory_budget:int|None = None  # bytes, None for half the physical memory
+
+
+def parse_size(size) -> int:
+    """
+    Parses a byte count such as 1073741824, '512MB', '2G' or '1.5GB' (binary units).
+
+    Raises:
+    ValueError: If the text is not a size.
+    """
+    if isinstance(size, (int, float, np.integer, np.floating)):
+        return int(size)
+    match = re.fullmatch(r"\s*([0-9]*\.?[0-9]+(?:[eE][0-9]+)?)\s*([KMGT]?B?)\s*", str(size).upper())
+    if match is None:
+        raise ValueError(f"Expected a size like 512MB or 2GB, got '{size}'")
+    return int(float(match.group(1)) * _UNITS[match.group(2)])
+
+
+def _apply(name:str, module) -> None:
+    if name in MODULES:
+        module.DTYPE = _Policy.dtype.type
+
+
+def configure(dtype=None, memory_budget=None) -> list[str]:
+    """
+    Sets the policy; arguments left as None keep their current value.
+
+    Parameters:
+    dtype: 'float32', 'float64' or a NumPy floating dtype.
+    memory_budget: Bytes (int) or a size such as '2GB'.
+
+    Returns:
+    list[str]: The MODULES already loaded, whose DTYPE was set; the others get it when loaded.
+
+    Raises:
+    ValueError: For other dtypes or invalid sizes.
+    """
+    if dtype is not None:
+        dtype = np.dtype(DTYPES.get(dtype, dtype) if isinstance(dtype, str) else dtype)
+        if dtype.type not in DTYPES.values():
+            raise ValueError(f"Precision '{dtype}' is not supported. Available precisions are: {list(DTYPES)}")
+        _Policy.dtype = dtype
+    if memory_budget is not None:
+        _Policy.memory_budget = parse_size(memory_budget)
+
+    patched = [name for name in MODULES if modules.loaded(name) is not None]
+    for name in patched:
+        _apply(name, modules.loaded(name))
+    if _apply not in modules.LOAD_HOOKS:
+        modules.LOAD_HOOKS.append(_apply)
+    return patched
+
+
+def policy() -> tuple[str, int|None]:
+    """(dtype name, memory budget) as arguments for configure(), e.g. in worker initializers."""
+    return _Policy.dtype.name, _Policy.memory_budget
+
+
+def dtype() -> np.dtype:
+    return _Policy.dtype
+
+
+def memory_budget() -> int:
+    """Budget in bytes; half the physical memory unless configured (unlimited if unknown)."""
+    if _Policy.memory_budget is not None:
+        return _Policy.memory_budget
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // 2
+    except (AttributeError, ValueError, OSError):
+        return 2**63 - 1
+
+
+def fits(nbytes:int, share:float = 1.0) -> bool:
+    """Whether nbytes stays within `share` of the memory budget."""
+    return nbytes <= memory_budget() * share
+
+
+def rows_within(bytes_per_row:int, limit:int, share:float = 0.25) -> int:
+    """
+    Largest batch of rows, at most `limit`, whose working set fits in `share` of the budget.
+
+    Parameters:
+    bytes_per_row (int): Memory one row costs, temporaries included.
+    limit (int): Batch size used when memory is not the constraint.
+    share (float): Fraction of the budget one batch may use. Default is 0.25.
+
+    Returns:
+    int: The batch size, at least 1.
+    """
+    return max(1, min(int(limit), int(memory_budget() * share) // max(int(bytes_per_row), 1)))
+
+
+def as_array(values, copy:bool = False) -> np.ndarray:
+    """values as an array of the policy dtype; no copy when it already is one (e.g. a memmap)."""
+    return np.array(values, dtype=_Policy.dtype) if copy else np.asarray(values, dtype=_Policy.dtype)
@@ -0,0 +1,291 @@
+"""
+Local store for simulation results, indexed by launch/system parameters.
+
+    store = ResultStore("results")
+    store.put_json("Projectile Motion/json_data/projectile_motion_data_non_symmetric.json")
+    for run in store.runs("projectile", speed=(60, 70), a_ox=(-5, 0)):
+        viz = ProjectileMotionVisualizer(json_data=run.to_dict())
+
+Layout of the store folder:
+
+    index.jsonl                 one line of parameters per run (append-only)
+    runs/<run_id>/run.json      metadata/system_info, column dtypes and chunk offsets
+    runs/<run_id>/<column>.bin  the column as fixed-size zlib-compressed chunks
+    cache/<run_id>/<column>.npy decompressed columns, created on demand for memmap()
+
+Queries only read the index. Columns are decompressed chunk by chunk when sliced,
+or once into the cache when a memory-mapped view is requested.
+"""
+import json
+import os
+import zlib
+
+import numpy as np
+
+# Indexed parameters; runs that do not define one get NaN
+INDEX_FIELDS:list[str] = ["speed", "angle", "a_ox", "a_oy", "mass", "m1", "v1", "m2", "v2", "k"]
+
+# Layout of each kind: (parameters section, time series section)
+SECTIONS:dict[str, tuple[str, str]] = {
+    "projectile": ("metadata", "time_series"),
+    "oscillator": ("system_info", "oscillation_info"),
+}
+
+
+def detect_kind(data:dict) -> str:
+    """'projectile' or 'oscillator' from the JSON layout."""
+    for kind, (parameters, _) in SECTIONS.items():
+        if parameters in data:
+            return kind
+    raise ValueError(f"Unknown result layout with sections {list(data)}")
+
+
+def derive_params(kind:str, data:dict) -> dict[str, float]:
+    """
+    Index parameters recoverable from the outputs themselves.
+
+    Oscillator outputs only record the combined mass and k; the collision inputs m1, v1,
+    m2 and v2 come from the params of put() (`store put --param` on the command line).
+    """
+    if kind == "projectile":
+        metadata, series = data["metadata"], data["time_series"]
+        vx, vy = float(series["velocity_x"][0]), float(series["velocity_y"][0])
+        return {"speed": float(np.hypot(vx, vy)), "angle": float(np.degrees(np.arctan2(vy, vx))),
+                "a_ox": metadata.get("initial_acceleration_x", np.nan),
+                "a_oy": metadata.get("initial_acceleration_y", np.nan),
+                "mass": metadata["mass"]}
+    system_info = data["system_info"]
+    return {"mass": system_info["mass"], "k": system_info["k"]}
+
+
+class LazyColumn:
+    """
+    One stored column; slicing decompresses only the chunks it touches.
+
+    np.asarray(column) decompresses everything; RunView.memmap() gives a
+    memory-mapped array instead.
+    """
+
+    def __init__(self, path:str, dtype:np.dtype, length:int, chunk_size:int, offsets:list[int]):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.length = length
+        self.chunk_size = chunk_size
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return self.length
+
+    @property
+    def shape(self) -> tuple[int]:
+        return (self.length,)
+
+    def chunk(self, index:int) -> np.ndarray:
+        with open(self.path, "rb") as f:
+            f.seek(self.offsets[index])
+            payload = f.read(self.offsets[index + 1] - self.offsets[index])
+        return np.frombuffer(zlib.decompress(payload), dtype=self.dtype)
+
+    def __getitem__(self, key) -> np.ndarray:
+        if isinstance(key, (int, np.integer)):
+            key = int(key) + self.length if key < 0 else int(key)
+            return self.chunk(key // self.chunk_size)[key % self.chunk_size]
+        if not isinstance(key, slice):
+            return np.asarray(self)[key]
+        start, stop, step = key.indices(self.length)
+        if start >= stop:
+            return np.empty(0, dtype=self.dtype)
+        first, last = start // self.chunk_size, (stop - 1) // self.chunk_size
+        values = np.concatenate([self.chunk(index) for index in range(first, last + 1)])
+        offset = first * self.chunk_size
+        return values[start - offset:stop - offset:step]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        values = self[:]
+        return values if dtype is None else values.astype(dtype)
+
+
+class RunView:
+    """Lazy view of one stored run."""
+
+    def __init__(self, store:"ResultStore", run_id:str):
+        self.store = store
+        self.run_id = run_id
+        self.folder = os.path.join(store.root, "runs", run_id)
+        with open(os.path.join(self.folder, "run.json")) as f:
+            self.manifest = json.load(f)
+        self.kind:str = self.manifest["kind"]
+        self.meta:dict = self.manifest["meta"]
+        self.params:dict = self.manifest["params"]
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self.manifest["columns"])
+
+    def __getitem__(self, column:str) -> LazyColumn:
+        entry = self.manifest["columns"][column]
+        return LazyColumn(os.path.join(self.folder, f"{column}.bin"), entry["dtype"], self.manifest["length"],
+                          self.manifest["chunk_size"], entry["offsets"])
+
+    def memmap(self, column:str) -> np.ndarray:
+        """Memory-mapped read-only array of a column, decompressed into the cache once."""
+        cache_path = os.path.join(self.store.root, "cache", self.run_id, f"{column}.npy")
+        if not os.path.exists(cache_path):
+            lazy = self[column]
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            temporary = f"{cache_path}.tmp.npy"
+            out = np.lib.format.open_memmap(temporary, mode="w+", dtype=lazy.dtype, shape=lazy.shape)
+            for index in range(len(lazy.offsets) - 1):
+                start = index * lazy.chunk_size
+                out[start:start + lazy.chunk_size] = lazy.chunk(index)
+            out.flush()
+            del out
+            os.replace(temporary, cache_path)
+        return np.load(cache_path, mmap_mode="r")
+
+    def to_dict(self, memmap:bool = True) -> dict:
+        """The run in its original JSON layout, with memory-mapped (or lazy) columns."""
+        parameters, series = SECTIONS[self.kind]
+        columns = {column: self.memmap(column) if memmap else self[column] for column in self.columns}
+        return {parameters: dict(self.meta), series: columns}
+
+
+class ResultStore:
+    def __init__(self, root:str|os.PathLike, chunk_size:int = 65536):
+        """
+        Opens (or creates) a result store.
+
+        Parameters:
+        root (str | os.PathLike): Store folder.
+        chunk_size (int): Samples per compressed chunk for new runs. Default is 65536.
+        """
+        self.root = os.fspath(root)
+        self.chunk_size = chunk_size
+        os.makedirs(os.path.join(self.root, "runs"), exist_ok=True)
+        self._index_path = os.path.join(self.root, "index.jsonl")
+        self._index:np.ndarray|None = None
+        self._count:int|None = None
+
+    # ------------------------------------------------------------ writing
+
+    def put(self, data:dict, params:dict|None = None, kind:str|None = None) -> str:
+        """
+        Stores one run given in the JSON layout (metadata/time_series or system_info/oscillation_info).
+
+        Parameters:
+        data (dict): The run; time series may be lists or arrays.
+        params (dict): Index parameters not recoverable from the outputs (e.g. m1, v1, m2, v2).
+        kind (str): 'projectile' or 'oscillator', detected from the layout by default.
+
+        Returns:
+        str: The new run id.
+        """
+        kind = kind or detect_kind(data)
+        parameters_section, series_section = SECTIONS[kind]
+        index_params = {**derive_params(kind, data), **(params or {})}
+
+        if self._count is None:
+            self._count = len(self.index)
+        # Creating the folder claims the id, also against other handles or processes on the same store
+        while True:
+            run_id = f"{kind}-{self._count:06d}"
+            folder = os.path.join(self.root, "runs", run_id)
+            try:
+                os.mkdir(folder)
+                break
+            except FileExistsError:
+                self._count += 1
+
+        columns = {}
+        length = 0
+        for column, values in data[series_section].items():
+            values = np.ascontiguousarray(values)
+            length = values.size
+            offsets = [0]
+            with open(os.path.join(folder, f"{column}.bin"), "wb") as f:
+                for start in range(0, values.size, self.chunk_size):
+                    payload = zlib.compress(values[start:start + self.chunk_size].tobytes(), 1)
+                    f.write(payload)
+                    offsets.append(offsets[-1] + len(payload))
+            columns[column] = {"dtype": values.dtype.str, "offsets": offsets}
+
+        manifest = {"kind": kind, "length": length, "chunk_size": self.chunk_size,
+                    "meta": {key: float(value) for key, value in data[parameters_section].items()},
+                    "params": {key: float(value) for key, value in index_params.items()},
+                    "columns": columns}
+        with open(os.path.join(folder, "run.json"), "w") as f:
+            json.dump(manifest, f)
+
+        # The run is complete on disk before it becomes visible in the index
+        entry = {"run_id": run_id, "kind": kind, "length": length, **manifest["params"]}
+        with open(self._index_path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+        self._count += 1
+        self._index = None
+        return run_id
+
+    def put_json(self, json_path:str|os.PathLike, params:dict|None = None) -> str:
+        """Stores a run from a JSON file written by the C++ programs or the toolkit."""
+        with open(json_path) as f:
+            return self.put(json.load(f), params)
+
+    # ------------------------------------------------------------ reading
+
+    @property
+    def index(self) -> np.ndarray:
+        """Structured array with one row per run (run_id, kind, length and INDEX_FIELDS)."""
+        if self._index is None:
+            entries = []
+            if os.path.exists(self._index_path):
+                with open(self._index_path) as f:
+                    entries = [json.loads(line) for line in f if line.strip()]
+            dtype = [("run_id", "U32"), ("kind", "U16"), ("length", np.int64)] + [(field, np.float64) for field in INDEX_FIELDS]
+            index = np.zeros(len(entries), dtype=dtype)
+            for field in INDEX_FIELDS:
+                index[field] = [entry.get(field, np.nan) for entry in entries]
+            index["run_id"] = [entry["run_id"] for entry in entries]
+            index["kind"] = [entry["kind"] for entry in entries]
+            index["length"] = [entry["length"] for entry in entries]
+            self._index = index
+        return self._index
+
+    def query(self, kind:str|None = None, **ranges) -> np.ndarray:
+        """
+        Index rows matching every condition.
+
+        Parameters:
+        kind (str): Restrict to 'projectile' or 'oscillator'.
+        ranges: field=(low, high) for an inclusive range (None for an open end),
+        or field=value for equality, over INDEX_FIELDS and 'length'.
+
+        Returns:
+        np.ndarray: Matching rows of the index.
+
+        Raises:
+        ValueError: If a field is not indexed.
+        """
+        index = self.index
+        mask = np.ones(index.size, dtype=bool)
+        if kind is not None:
+            mask &= index["kind"] == kind
+        for field, condition in ranges.items():
+            if field not in INDEX_FIELDS and field != "length":
+                raise ValueError(f"Field '{field}' is not indexed. Indexed fields are: {INDEX_FIELDS + ['length']}")
+            values = index[field]
+            if isinstance(condition, tuple):
+                low, high = condition
+                if low is not None:
+                    mask &= values >= low
+                if high is not None:
+                    mask &= values <= high
+            else:
+                mask &= np.isclose(values, condition)
+        return index[mask]
+
+    def open(self, run_id:str) -> RunView:
+        return RunView(self, run_id)
+
+    def runs(self, kind:str|None = None, **ranges):
+        """Lazily opens every run matching query(kind, **ranges)."""
+        for run_id in self.query(kind, **ranges)["run_id"]:
+            yield self.open(str(run_id))
@@ -0,0 +1,205 @@
+"""
+Parameter sweeps over the project physics, spread across a process pool.
+
+A sweep is the cartesian product of 1D parameter grids. Its flattened index range
+is cut into fixed-size chunks; each chunk is evaluated by a worker process, which
+writes its rows straight into a shared memory-mapped .npy file. A JSON manifest
+next to the output records the completed chunks, so a killed sweep resumes
+without redoing them:
+
+    table = run_sweep("projectile", {"v": np.linspace(10, 100, 1000),
+                                     "v_angle": np.radians(np.linspace(5, 85, 1000))},
+                      "sweep.npy", fixed={"a_ox": -3.0})
+
+Parameters left out of the grid take their defaults as a one-point axis. Matrix
+types without parameters (reflection, collapse) have no grid; they sweep `count`
+copies of their matrix instead.
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from toolkit import modules, precision
+
+
+def _projectile(params:dict, fixed:dict, size:int) -> dict:
+    return modules.load("kinematics").projectile_summary(**fixed, **params)
+
+
+def _oscillator(params:dict, fixed:dict, size:int) -> dict:
+    arguments = {"v1": 10.0, "m2": 1.0, "v2": 0.0, **fixed, **params}
+    return modules.load("oscillator").collision(**arguments)
+
+
+def _matrix(params:dict, fixed:dict, size:int) -> np.ndarray:
+    analysis = modules.load("analysis")
+    matrix_type = fixed.get("type", "rotation")
+    if not MATRIX_PARAMETERS[matrix_type]:
+        params = {"count": size}
+    matrices = analysis.transformation_matrices(matrix_type, **params)
+    return analysis.analyze_matrices(matrices, n=fixed.get("n", 100))
+
+
+def _projectile_defaults(fixed:dict) -> dict:
+    return {"v": 65.0, "v_angle": np.pi / 4}
+
+
+def _oscillator_defaults(fixed:dict) -> dict:
+    return {"m1": 2.0, "k": 50.0}
+
+
+def _matrix_defaults(fixed:dict) -> dict:
+    return MATRIX_PARAMETERS[fixed.get("type", "rotation")]
+
+
+# Parameters of each matrix type with the defaults of analysis.transformation_matrices
+MATRIX_PARAMETERS:dict[str, dict] = {
+    "rotation": {"angle": np.pi / 4},
+    "scaling": {"scale_x": 2.0, "scale_y": 3.0},
+    "shearing": {"shear_x": 1.0, "shear_y": 0.0},
+    "reflection": {},
+    "collapse": {},
+}
+
+# Sweepable physics: family name -> function(params, fixed, size) returning columns
+FAMILIES:dict = {
+    "projectile": _projectile,
+    "oscillator": _oscillator,
+    "matrix": _matrix,
+}
+# Family name -> function(fixed) giving the swept parameters with their default values
+DEFAULTS:dict = {
+    "projectile": _projectile_defaults,
+    "oscillator": _oscillator_defaults,
+    "matrix": _matrix_defaults,
+}
+
+
+def _evaluate(family:str, grid:dict[str, np.ndarray], fixed:dict, start:int, stop:int) -> tuple[dict, dict]:
+    params = {}
+    if grid:
+        shape = tuple(len(values) for values in grid.values())
+        indices = np.unravel_index(np.arange(start, stop), shape)
+        params = {name: np.asarray(values)[index] for (name, values), index in zip(grid.items(), indices)}
+    result = FAMILIES[family](params, fixed, stop - start)
+    if isinstance(result, np.ndarray):
+        result = {name: result[name] for name in result.dtype.names}
+    return params, result
+
+
+def _row_dtype(family:str, grid:dict[str, np.ndarray], fixed:dict) -> np.dtype:
+    # Evaluate the first grid point to learn the output columns
+    params, result = _evaluate(family, grid, fixed, 0, 1)
+    fields = [(name, np.float64) for name in params]
+    fields += [(name, np.asarray(values).dtype) for name, values in result.items() if name not in params]
+    return np.dtype(fields)
+
+
+def _run_chunk(family:str, grid:dict, fixed:dict, output_path:str, chunk:int, start:int, stop:int) -> int:
+    """Worker: evaluates one chunk and writes it into the shared output file."""
+    params, result = _evaluate(family, grid, fixed, start, stop)
+    table = np.load(output_path, mmap_mode="r+")
+    rows = table[start:stop]
+    for name, values in {**result, **params}.items():
+        rows[name] = values
+    table.flush()
+    del table
+    return chunk
+
+
+def _manifest_path(output_path:str) -> str:
+    return f"{output_path}.manifest.json"
+
+
+def _write_manifest(path:str, manifest:dict) -> None:
+    # Write then rename, so a kill mid-write never leaves a truncated manifest
+    temporary = f"{path}.tmp"
+    with open(temporary, "w") as f:
+        json.dump(manifest, f)
+    os.replace(temporary, path)
+
+
+def run_sweep(family:str, grid:dict, output_path:str, fixed:dict|None = None, chunk_size:int = 10_000,
+              max_workers:int|None = None, resume:bool = True, count:int = 1) -> np.ndarray:
+    """
+    Runs (or resumes) a parameter sweep on a process pool.
+
+    Parameters:
+    family (str): One of FAMILIES ('projectile', 'oscillator', 'matrix').
+    grid (dict): Parameter name -> 1D values, named like the family function arguments
+    (kinematics.projectile_summary, oscillator.collision, analysis.transformation_matrices).
+    Parameters of the family missing from both grid and fixed are swept over their default value.
+    output_path (str): .npy file holding one structured row per grid point.
+    fixed (dict): Parameters shared by every grid point (e.g. {"a_ox": -3.0}, {"type": "shearing"}).
+    chunk_size (int): Grid points per task. Default is 10 000.
+    max_workers (int): Worker processes, defaults to os.cpu_count().
+    resume (bool): Skip chunks recorded in the manifest of an earlier run. Default is True.
+    count (int): Rows of a sweep without parameters (matrix types 'reflection' and
+    'collapse'). Default is 1.
+
+    Returns:
+    np.ndarray: The output table, memory-mapped read-only.
+
+    Raises:
+    ValueError: If the family or matrix type is unknown, a parameter is both swept and fixed,
+    or the manifest belongs to a different sweep.
+    """
+    if family not in FAMILIES:
+        raise ValueError(f"Sweep family '{family}' is not supported. Available families are: {list(FAMILIES)}")
+    fixed = dict(fixed or {})
+    if family == "matrix" and fixed.get("type", "rotation") not in MATRIX_PARAMETERS:
+        raise ValueError(f"Matrix type '{fixed['type']}' is not supported. Available types are: {list(MATRIX_PARAMETERS)}")
+    both = sorted(set(grid) & set(fixed))
+    if both:
+        raise ValueError(f"Parameters {both} are both swept and fixed")
+    # Defaults only fill parameters given neither in the grid nor in fixed
+    defaults = {name: value for name, value in DEFAULTS[family](fixed).items() if name not in fixed}
+    grid = {**defaults, **grid}
+    grid = {name: np.atleast_1d(np.asarray(values, dtype=np.float64)) for name, values in grid.items()}
+    total = int(np.prod([len(values) for values in grid.values()])) if grid else count
+    chunks = [(chunk, start, min(start + chunk_size, total))
+              for chunk, start in enumerate(range(0, total, chunk_size))]
+
+    spec = {
+        "family": family,
+        "grid": {name: values.tolist() for name, values in grid.items()},
+        "fixed": fixed,
+        "chunk_size": chunk_size,
+    }
+    if not grid:
+        spec["count"] = count
+    manifest_path = _manifest_path(output_path)
+    completed:set[int] = set()
+
+    if resume and os.path.exists(manifest_path) and os.path.exists(output_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest["spec"] != spec:
+            raise ValueError(f"{manifest_path} belongs to a different sweep. Delete it or pass resume=False.")
+        completed = set(manifest["completed"])
+        print(f"Resuming sweep: {len(completed)}/{len(chunks)} chunks already done")
+    else:
+        dtype = _row_dtype(family, grid, fixed)
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        table = np.lib.format.open_memmap(output_path, mode="w+", dtype=dtype, shape=(total,))
+        del table
+        manifest = {"spec": spec, "completed": []}
+        _write_manifest(manifest_path, manifest)
+
+    pending = [chunk for chunk in chunks if chunk[0] not in completed]
+    if pending:
+        # Workers evaluate with the caller's precision policy whatever the start method
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=precision.configure,
+                                 initargs=precision.policy()) as executor:
+            futures = [executor.submit(_run_chunk, family, grid, fixed, output_path, *chunk) for chunk in pending]
+            for future in as_completed(futures):
+                completed.add(future.result())
+                manifest["completed"] = sorted(completed)
+                _write_manifest(manifest_path, manifest)
+                print(f"Chunk {len(completed)}/{len(chunks)} done", end="\r")
+        print()
+
+    print(f"Sweep of {total} {family} configurations saved to {output_path}")
+    return np.load(output_path, mmap_mode="r")
@@ -0,0 +1,115 @@
+"""
+Figure templates kept alive across renders.
+
+Building a figure (axes, labels, legends, styled artists) costs far more than
+drawing one dataset into it. Each figure of the projects is split into a template
+and a draw step (ProjectileMotionVisualizer.trajectory_template / draw_trajectory,
+visualizer.build_oscillation_figure / bind_oscillation_data, Matrix.figure_template
+/ draw). The pool builds a template once per process and every render after that
+only swaps artist data, limits and text:
+
+    for run in store.runs("projectile"):
+        viz = ProjectileMotionVisualizer(json_data=run.to_dict(), output_folder="plots")
+        render_trajectory(viz, f"plots/{run.run_id}.png")
+
+Pooled figures are redrawn in place and never closed; call POOL.clear() to free them.
+Sweep workers each get their own pool, since it is module state.
+"""
+import os
+
+from toolkit import modules
+
+
+class FigurePool:
+    """Templates by key, built on first use."""
+
+    def __init__(self):
+        self._templates:dict = {}
+        self._laid_out:set = set()
+
+    def __contains__(self, key) -> bool:
+        return key in self._templates
+
+    def get(self, key, build):
+        """The template stored under `key`, calling build() to create it the first time."""
+        template = self._templates.get(key)
+        if template is None:
+            template = self._templates[key] = build()
+        return template
+
+    def layout(self, key, fig) -> None:
+        """tight_layout once per template, measured with the first dataset drawn in it."""
+        if key not in self._laid_out:
+            fig.tight_layout()
+            self._laid_out.add(key)
+
+    def clear(self) -> None:
+        """Closes every pooled figure."""
+        import matplotlib.pyplot as plt
+        for fig, _ in self._templates.values():
+            plt.close(fig)
+        self._templates = {}
+        self._laid_out = set()
+
+
+# One pool per process
+POOL = FigurePool()
+
+
+def _save_path(path:str) -> str:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    return path
+
+
+def render_trajectory(viz, path:str, dpi:int = 300) -> str:
+    """Saves the trajectory plot of a ProjectileMotionVisualizer through the pooled template."""
+    template = POOL.get("trajectory", viz.trajectory_template)
+    fig = viz.draw_trajectory(template)
+    POOL.layout("trajectory", fig)
+    fig.savefig(_save_path(path), dpi=dpi, bbox_inches='tight')
+    return path
+
+
+def render_velocity_components(viz, path:str, dpi:int = 300) -> str:
+    """Saves the velocity components plot of a ProjectileMotionVisualizer through the pooled template."""
+    template = POOL.get("velocity_components", viz.velocity_components_template)
+    fig = viz.draw_velocity_components(template)
+    POOL.layout("velocity_components", fig)
+    fig.savefig(_save_path(path), dpi=dpi, bbox_inches='tight')
+    return path
+
+
+def render_projectile_animation(viz, path:str, interval:int = 50, trail_length:int = 20, dpi:int|None = None) -> str:
+    """Saves the projectile animation as a GIF (pillow) through the pooled template."""
+    import matplotlib.animation as animation
+
+    template = POOL.get("projectile_animation", viz.animation_template)
+    fig = template[0]
+    animate = viz.draw_animation(template, trail_length)
+    POOL.layout("projectile_animation", fig)
+    anim = animation.FuncAnimation(fig, animate, frames=len(viz.time), interval=interval, blit=True, repeat=False)
+    anim.save(_save_path(path), writer='pillow', fps=1000 // interval, dpi=dpi)
+    return path
+
+
+def render_oscillation_animation(data:dict, path:str, fps:int = 5, dpi:int = 100) -> str:
+    """Saves the block-spring animation of an oscillator run as a GIF (pillow) through the pooled template."""
+    import matplotlib.animation as animation
+
+    visualizer = modules.load("visualizer")
+    template = POOL.get("oscillation_animation", visualizer.build_oscillation_figure)
+    fig = template[0]
+    animate, frames = visualizer.bind_oscillation_data(template, data)
+    POOL.layout("oscillation_animation", fig)
+    anim = animation.FuncAnimation(fig, animate, frames=frames, interval=200, blit=False, repeat=False)
+    anim.save(_save_path(path), writer='pillow', fps=fps, dpi=dpi)
+    return path
+
+
+def render_matrix(matrix) -> str:
+    """Saves Matrix.visualize() output through the pooled template of its vector space type."""
+    determinant = modules.load("determinant")
+    template = POOL.get(("matrix", matrix.vector_space_type),
+                        lambda: determinant.Matrix.figure_template(matrix.vector_space_type))
+    matrix.visualize(template=template)
+    return matrix.save_path
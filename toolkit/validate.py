@@ -0,0 +1,239 @@
+"""
+Bulk validation of simulation outputs against their analytic solutions.
+
+Runs of one kind are concatenated into flat columns and checked in a single
+vectorized pass per batch; per-run reductions use np.maximum.reduceat over the
+run boundaries, so thousands of small runs cost about as much as one large one.
+
+    table = validate(["Projectile Motion/json_data/projectile_motion_data_symmetric.json",
+                      "Mass-Block Collision Harmonic Oscillator/json_data/collision_in_mass_spring.json"])
+    print(format_table(table))
+
+Projectile runs are checked against x(t) = x0 + vx0 t + ax t²/2 (same for y) and
+their velocities; the outputs have no energy column, so the energy drift is that of
+m(v²/2 - ax x - ay y), which stays constant even when a_ox does work on the
+projectile (for a_ox = 0 it is the plain mechanical energy). Oscillator runs are
+checked against x = A cos(wt), v = -Aw sin(wt) (w = sqrt(k / mass) in float64, since the
+6-decimal w would add a phase error growing with t) and a constant total_energy; damped or
+driven runs (damping, drive_force, drive_w in system_info) against
+oscillator.damped_driven, their energy_drift being the largest deviation of
+total_energy from the energy of that reference, relative to its peak.
+
+Relative errors are taken against the largest reference magnitude of the column
+within the run, since the references cross zero (at landing, at every half period).
+"""
+import os
+
+import numpy as np
+
+from toolkit import modules, precision
+from toolkit.store import SECTIONS, detect_kind
+from toolkit.writer import load_run
+
+TABLE_DTYPE = np.dtype([
+    ("name", "U128"),
+    ("kind", "U16"),
+    ("samples", np.int64),
+    ("max_abs_error", np.float64),
+    ("max_rel_error", np.float64),
+    ("energy_drift", np.float64),
+    ("h_max_error", np.float64),        # projectile only, relative
+    ("apogee_time_error", np.float64),  # projectile only, relative
+    ("period_error", np.float64),       # oscillator only, relative
+    ("amplitude_error", np.float64),    # oscillator only, relative
+    ("passed", np.bool_),
+])
+
+# Samples evaluated per vectorized pass; bounds the temporaries to a few hundred MB
+BATCH_SAMPLES:int = 1 << 22
+# Working set of one sample: the flat columns plus the references and temporaries, in values
+_VALUES_PER_SAMPLE = 24
+
+
+def _named_runs(runs):
+    # Accepts JSON (or .cols sidecar) paths, RunView objects from toolkit.store, (name, data) pairs or bare dicts
+    for position, run in enumerate(runs):
+        if isinstance(run, (str, os.PathLike)):
+            yield os.fspath(run), load_run(run)
+        elif hasattr(run, "to_dict"):
+            yield run.run_id, run.to_dict()
+        elif isinstance(run, tuple):
+            yield run
+        else:
+            yield f"run-{position}", run
+
+
+def _concatenate(batch:list[dict], series:str, columns:list[str]) -> tuple[dict, np.ndarray, np.ndarray]:
+    lengths = np.array([len(data[series][columns[0]]) for data in batch])
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    # Reference phases grow with t, so time stays float64 whatever the policy dtype
+    flat = {column: np.concatenate([np.asarray(data[series][column], dtype=np.float64) if column == "time"
+                                    else precision.as_array(data[series][column]) for data in batch])
+            for column in columns if column in batch[0][series]}
+    return flat, starts, np.repeat(np.arange(len(batch)), lengths)
+
+
+def _errors(flat:dict, reference:dict, starts:np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Per-run max absolute error and max scale-relative error over the compared columns."""
+    max_abs = np.zeros(starts.size)
+    max_rel = np.zeros(starts.size)
+    for column, expected in reference.items():
+        error = np.maximum.reduceat(np.abs(flat[column] - expected), starts)
+        scale = np.maximum.reduceat(np.abs(expected), starts)
+        max_abs = np.maximum(max_abs, error)
+        max_rel = np.maximum(max_rel, error / np.where(scale > 0, scale, 1.0))
+    return max_abs, max_rel
+
+
+def _relative(value:np.ndarray, expected:np.ndarray) -> np.ndarray:
+    return np.abs(value - expected) / np.where(expected != 0, np.abs(expected), 1.0)
+
+
+def _check_projectile(batch:list[dict], rows:np.ndarray) -> None:
+    flat, starts, run = _concatenate(batch, "time_series", ["time", "position_x", "position_y", "velocity_x",
+                                                            "velocity_y", "acceleration_x", "acceleration_y"])
+    metadata = [data["metadata"] for data in batch]
+    x0, y0 = flat["position_x"][starts], flat["position_y"][starts]
+    vx0, vy0 = flat["velocity_x"][starts], flat["velocity_y"][starts]
+    if "acceleration_x" in flat:
+        ax, ay = flat["acceleration_x"][starts], flat["acceleration_y"][starts]
+    else:
+        ax = np.array([meta.get("initial_acceleration_x", 0.0) for meta in metadata])
+        ay = np.array([meta.get("initial_acceleration_y", -9.81) for meta in metadata])
+    mass = np.array([meta["mass"] for meta in metadata])
+
+    t = flat["time"] - flat["time"][starts][run]
+    ax_s, ay_s = ax[run], ay[run]
+    reference = {
+        "position_x": x0[run] + vx0[run] * t + ax_s * t**2 / 2,
+        "position_y": y0[run] + vy0[run] * t + ay_s * t**2 / 2,
+        "velocity_x": vx0[run] + ax_s * t,
+        "velocity_y": vy0[run] + ay_s * t,
+    }
+    rows["max_abs_error"], rows["max_rel_error"] = _errors(flat, reference, starts)
+
+    # Energy per unit mass plus the work of both accelerations, constant along the flight
+    invariant = ((flat["velocity_x"]**2 + flat["velocity_y"]**2) / 2
+                 - ax_s * flat["position_x"] - ay_s * flat["position_y"])
+    drift = np.maximum.reduceat(np.abs(invariant - invariant[starts][run]), starts)
+    kinetic_initial = (vx0**2 + vy0**2) / 2
+    rows["energy_drift"] = mass * drift / np.where(kinetic_initial > 0, mass * kinetic_initial, 1.0)
+
+    apogee_time = -vy0 / ay
+    h_max = y0 + vy0 * apogee_time + ay * apogee_time**2 / 2
+    rows["apogee_time_error"] = _relative(np.array([meta["apogee_time"] for meta in metadata]), apogee_time)
+    rows["h_max_error"] = _relative(np.array([meta["h_max"] for meta in metadata]), h_max)
+
+
+def _check_oscillator(batch:list[dict], rows:np.ndarray) -> None:
+    flat, starts, run = _concatenate(batch, "oscillation_info", ["time", "position", "velocity", "total_energy",
+                                                                 "kinetic_energy", "potential_energy"])
+    info = {key: np.array([data["system_info"][key] for data in batch])
+            for key in ("Amplitude", "w", "k", "mass", "period", "kinectic_energy")}
+    # Undamped, undriven runs (the C++ outputs) have none of these keys
+    for key in ("damping", "drive_force"):
+        info[key] = np.array([data["system_info"].get(key, 0.0) for data in batch])
+    info["drive_w"] = np.array([data["system_info"].get("drive_w", np.nan) for data in batch])
+    info["drive_w"] = np.where(np.isnan(info["drive_w"]), np.sqrt(info["k"] / info["mass"]), info["drive_w"])
+    forced = (info["damping"] != 0) | (info["drive_force"] != 0)
+
+    # w is stored with 6 decimals, a phase error growing with t; recompute it from k and mass
+    amplitude, w = info["Amplitude"][run], np.sqrt(info["k"] / info["mass"])[run]
+    if forced.any():
+        expected = modules.load("oscillator").damped_driven(
+            amplitude, w, info["mass"][run], info["k"][run], flat["time"],
+            info["damping"][run], info["drive_force"][run], info["drive_w"][run])
+        reference = {"position": expected["position"], "velocity": expected["velocity"]}
+    else:
+        phase = w * flat["time"]
+        reference = {"position": amplitude * np.cos(phase), "velocity": -w * amplitude * np.sin(phase)}
+    rows["max_abs_error"], rows["max_rel_error"] = _errors(flat, reference, starts)
+
+    if "total_energy" in flat:
+        energy = flat["total_energy"]
+    else:
+        energy = info["mass"][run] * flat["velocity"]**2 / 2 + info["k"][run] * flat["position"]**2 / 2
+    drift = np.maximum.reduceat(np.abs(energy - energy[starts][run]), starts)
+    initial = np.abs(energy[starts])
+    rows["energy_drift"] = drift / np.where(initial > 0, initial, 1.0)
+    if forced.any():
+        # Energy is not conserved under damping or a drive: compare with the energy of the reference instead
+        deviation = np.maximum.reduceat(np.abs(energy - expected["total_energy"]), starts)
+        peak = np.maximum.reduceat(np.abs(expected["total_energy"]), starts)
+        rows["energy_drift"] = np.where(forced, deviation / np.where(peak > 0, peak, 1.0), rows["energy_drift"])
+
+    rows["period_error"] = _relative(info["period"], 2 * np.pi * np.sqrt(info["mass"] / info["k"]))
+    rows["amplitude_error"] = _relative(info["Amplitude"], np.sqrt(2 * info["kinectic_energy"] / info["k"]))
+
+
+_CHECKS:dict = {
+    "projectile": _check_projectile,
+    "oscillator": _check_oscillator,
+}
+
+
+def validate(runs, rtol:float = 1e-4, batch_samples:int = BATCH_SAMPLES) -> np.ndarray:
+    """
+    Checks runs against their analytic solutions.
+
+    Parameters:
+    runs: Iterable of JSON paths, toolkit.store RunView objects, (name, data) pairs or
+    data dicts in the metadata/time_series or system_info/oscillation_info layout.
+    rtol (float): Largest relative error, energy drift and metadata mismatch for a run
+    to pass. The C++ outputs are rounded to 6 decimals, so the default is 1e-4.
+    batch_samples (int): Samples concatenated per vectorized pass, lowered to fit the
+    memory budget (toolkit.precision).
+
+    Returns:
+    np.ndarray: One TABLE_DTYPE row per run, in input order. Checks that do not
+    apply to a kind are NaN.
+    """
+    batch_samples = precision.rows_within(_VALUES_PER_SAMPLE * precision.dtype().itemsize, batch_samples)
+    rows = []
+    pending:dict[str, list] = {kind: [] for kind in _CHECKS}
+    pending_samples = dict.fromkeys(_CHECKS, 0)
+
+    def flush(kind:str) -> None:
+        batch = pending[kind]
+        if not batch:
+            return
+        table = np.zeros(len(batch), dtype=TABLE_DTYPE)
+        for field in TABLE_DTYPE.names[3:-1]:
+            table[field] = np.nan
+        table["kind"] = kind
+        table["name"] = [name for _, name, _ in batch]
+        table["samples"] = [len(next(iter(data[SECTIONS[kind][1]].values()))) for _, _, data in batch]
+        _CHECKS[kind]([data for _, _, data in batch], table)
+        rows.extend(zip((position for position, _, _ in batch), table))
+        pending[kind] = []
+        pending_samples[kind] = 0
+
+    for position, (name, data) in enumerate(_named_runs(runs)):
+        kind = detect_kind(data)
+        pending[kind].append((position, name, data))
+        pending_samples[kind] += len(next(iter(data[SECTIONS[kind][1]].values())))
+        if pending_samples[kind] >= batch_samples:
+            flush(kind)
+    for kind in _CHECKS:
+        flush(kind)
+
+    rows.sort(key=lambda row: row[0])
+    table = np.array([row for _, row in rows], dtype=TABLE_DTYPE)
+    checks = np.stack([np.nan_to_num(table[field], nan=0.0) for field in TABLE_DTYPE.names[4:-1]])
+    table["passed"] = np.all(checks <= rtol, axis=0) if table.size else np.zeros(0, dtype=bool)
+    return table
+
+
+def format_table(table:np.ndarray) -> str:
+    """Fixed-width text rendering of a validate() table."""
+    fields = TABLE_DTYPE.names[3:-1]
+    header = f"{'run':<40} {'kind':<10} {'samples':>9} " + " ".join(f"{field:>17}" for field in fields) + "  status"
+    lines = [header]
+    for row in table:
+        name = str(row["name"])
+        name = name if len(name) <= 40 else "..." + name[-37:]
+        values = " ".join(f"{'-':>17}" if np.isnan(row[field]) else f"{row[field]:>17.3e}" for field in fields)
+        lines.append(f"{name:<40} {row['kind']:<10} {row['samples']:>9} {values}  {'ok' if row['passed'] else 'FAIL'}")
+    failed = np.count_nonzero(~table["passed"])
+    lines.append(f"{table.size} runs, {failed} failed")
+    return "\n".join(lines)
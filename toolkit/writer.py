@@ -0,0 +1,395 @@
+"""
+Writer for the JSON formats of the C++ programs, straight from NumPy arrays.
+
+write_run() produces the same text as save_to_json (Projectile Motion/main.cpp) and
+saveJson (collision main.cpp): two-space indentation, one line per scalar, every time
+series inline on one line, numbers in fixed notation with `precision` decimals
+(setprecision(6) in the C++). Given the same float32 values, the output is byte for
+byte identical; keys keep the C++ order (metadata in insertion order, the std::map
+sections of the oscillator sorted).
+
+Numbers are formatted in bulk: each chunk is scaled to integers, split into digit
+columns and assembled as a byte matrix, instead of one string conversion per value.
+Values whose rounding is ambiguous at double precision are re-rounded exactly with
+printf-style formatting, so the text always matches '%.6f'.
+
+The same pass can write a binary columnar sidecar (<file>.cols) holding the raw
+columns, which read_sidecar() memory-maps:
+
+    magic b"CPCOLS1\\n" | uint64 header length | JSON header | padding | columns
+
+The header holds the kind, the parameters section and, per column, its dtype,
+length and absolute byte offset (64-byte aligned). load_run() reads a run from
+either format, preferring the sidecar when it is at least as recent as the JSON
+(write_run gives both the same modification time); a JSON rewritten later, e.g. by
+another `simulate --output` without --sidecar, is read instead of a stale sidecar. A JSON output too large to parse
+within the memory budget (toolkit.precision) is converted to a sidecar in a streaming
+pass and memory-mapped instead; that sidecar goes to a cache folder (CACHE_DIR), named
+after the JSON's path, size and modification time, never next to the input.
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+import numpy as np
+
+from toolkit import precision
+from toolkit.store import SECTIONS, detect_kind
+
+SIDECAR_MAGIC:bytes = b"CPCOLS1\n"
+SIDECAR_SUFFIX:str = ".cols"
+CHUNK_SIZE:int = 65536
+_ALIGNMENT = 64
+# Largest scaled magnitude formatted through int64 digit columns
+_INT_LIMIT = 2.0**62
+# Memory of a parsed JSON output per byte of text: a Python float (24 B) and a list slot (8 B) per ~10 characters
+_PARSED_BYTES_PER_BYTE = 4
+# Text read per step when converting a JSON output to a sidecar
+_READ_BLOCK = 1 << 24
+# Sidecars converted by load_run for JSON outputs over the memory budget
+CACHE_DIR:str = os.path.join(tempfile.gettempdir(), "toolkit-sidecars")
+
+
+def _exact(values:np.ndarray, precision:int) -> np.ndarray:
+    """Scaled integers rounded exactly like printf, one value at a time."""
+    return np.array([int(f"{value:.{precision}f}".replace(".", "")) for value in values.tolist()], dtype=np.int64)
+
+
+def _fill_digits(rows:np.ndarray, start:int, count:int, numbers:np.ndarray) -> None:
+    """Writes `numbers` zero-padded to `count` digits into rows[start:start + count]."""
+    if count == 0:
+        return
+    # int32 arithmetic is about twice as fast where the numbers fit
+    numbers = numbers.astype(np.int32) if numbers.max() < 2**31 else numbers.copy()
+    for row in range(start + count - 1, start - 1, -1):
+        numbers, digit = np.divmod(numbers, 10)
+        rows[row] = digit
+        rows[row] += ord("0")
+
+
+def format_fixed(values:np.ndarray, precision:int = 6, separator:bytes = b", ") -> bytes:
+    """
+    Formats a 1D array as separator-joined fixed-point numbers, like C++ `fixed << setprecision`.
+
+    Parameters:
+    values (np.ndarray): Numbers to format; float32 values format exactly as the C++ floats do.
+    precision (int): Decimals per number. Default is 6.
+    separator (bytes): Inserted between numbers. Default is b", ".
+
+    Returns:
+    bytes: ASCII text, e.g. b"0.000000, -9.810000".
+    """
+    values = np.asarray(values).ravel()
+    if values.size == 0:
+        return b""
+    scaled = values.astype(np.float64) * 10.0**precision
+    if not np.all(np.isfinite(scaled)) or np.abs(scaled).max() >= _INT_LIMIT:
+        # nan/inf and huge magnitudes are rare, leave them to printf formatting
+        return separator.join(f"{value:.{precision}f}".encode() for value in values.tolist())
+
+    rounded = np.rint(scaled)
+    # Ties (or near ties within the rounding error of the scaling) need exact decimal rounding
+    fraction = np.abs(scaled - np.floor(scaled))
+    ambiguous = np.abs(fraction - 0.5) <= 2 * np.spacing(np.abs(scaled))
+    magnitude = np.abs(rounded).astype(np.int64)
+    if ambiguous.any():
+        magnitude[ambiguous] = np.abs(_exact(values[ambiguous], precision))
+
+    # Character cells, one row per position (sign, integer digits, point, decimals, separator)
+    # so each pass writes contiguous memory; transposed once at the end
+    width = max(len(str(int(magnitude.max()))), precision + 1)
+    integer_width = width - precision
+    dot = 1 if precision else 0
+    rows = np.empty((1 + width + dot + len(separator), values.size), dtype=np.uint8)
+    sign = np.signbit(values)
+    rows[0] = ord("-")
+    if precision:
+        rows[1 + integer_width] = ord(".")
+    rows[rows.shape[0] - len(separator):] = np.frombuffer(separator, dtype=np.uint8)[:, None]
+    integer_part, fraction_part = np.divmod(magnitude, 10**precision)
+    _fill_digits(rows, 1, integer_width, integer_part)
+    _fill_digits(rows, 2 + integer_width, precision, fraction_part)
+
+    # Integer digits actually printed, at least one ("0.xxxxxx"); leading cells are masked out
+    printed = np.searchsorted(10 ** np.arange(1, integer_width, dtype=np.int64), integer_part, side="right") + 1
+    keep = np.ones(rows.shape, dtype=bool)
+    keep[0] = sign
+    keep[1:1 + integer_width] = np.arange(integer_width)[:, None] >= integer_width - printed
+    keep[rows.shape[0] - len(separator):, -1] = False
+    matrix, keep = rows.T, keep.T
+    return matrix[keep].tobytes()
+
+
+def sidecar_path(json_path:str|os.PathLike) -> str:
+    return os.path.splitext(os.fspath(json_path))[0] + SIDECAR_SUFFIX
+
+
+def is_fresh(sidecar:str|os.PathLike, json_path:str|os.PathLike) -> bool:
+    """Whether a sidecar exists and was written no earlier than its JSON file."""
+    try:
+        return os.stat(sidecar).st_mtime_ns >= os.stat(json_path).st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def _number(value:float, precision:int) -> str:
+    return format_fixed(np.array([value]), precision).decode()
+
+
+def write_run(data:dict, path:str|os.PathLike, precision:int = 6, sidecar:bool = True,
+              sidecar_dtype=None, kind:str|None = None) -> str:
+    """
+    Writes a run in the C++ JSON format and, in the same pass, its columnar sidecar.
+
+    Parameters:
+    data (dict): metadata/time_series or system_info/oscillation_info layout, with
+    time series as arrays or lists (e.g. kinematics.simulate_projectile output).
+    path (str | os.PathLike): JSON file to write.
+    precision (int): Decimals per number. Default is 6, as in the C++.
+    sidecar (bool): Also write <path without extension>.cols. Default is True.
+    sidecar_dtype: dtype of the sidecar columns, defaults to each column's own dtype.
+    kind (str): 'projectile' or 'oscillator', detected from the layout by default.
+
+    Returns:
+    str: The JSON path.
+    """
+    kind = kind or detect_kind(data)
+    parameters_section, series_section = SECTIONS[kind]
+    parameters = data[parameters_section]
+    series = {key: np.asarray(values) for key, values in data[series_section].items()}
+    if kind == "oscillator":
+        # saveJson iterates std::maps, i.e. sorted keys
+        parameters = dict(sorted(parameters.items()))
+        series = dict(sorted(series.items()))
+    if sidecar_dtype is not None:
+        stored = {key: values.astype(sidecar_dtype, copy=False) for key, values in series.items()}
+    else:
+        stored = series
+
+    path = os.fspath(path)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    cols = None
+    if sidecar:
+        header, offsets, size = _sidecar_layout(kind, parameters_section, parameters, stored)
+        cols = open(sidecar_path(path), "wb")
+        cols.write(header)
+        cols.truncate(size)
+    try:
+        with open(path, "wb") as f:
+            f.write(b"{\n")
+            f.write(f'  "{parameters_section}": {{\n'.encode())
+            f.write(",\n".join(f'    "{key}": {_number(value, precision)}' for key, value in parameters.items()).encode())
+            f.write(b"\n  },\n")
+            f.write(f'  "{series_section}": {{\n'.encode())
+            for position, (key, values) in enumerate(series.items()):
+                f.write(f'    "{key}": ['.encode())
+                if cols is not None:
+                    cols.seek(offsets[position])
+                for start in range(0, values.size, CHUNK_SIZE):
+                    if start:
+                        f.write(b", ")
+                    f.write(format_fixed(values[start:start + CHUNK_SIZE], precision))
+                    if cols is not None:
+                        cols.write(np.ascontiguousarray(stored[key][start:start + CHUNK_SIZE]).tobytes())
+                f.write(b"],\n" if position < len(series) - 1 else b"]\n")
+            f.write(b"  }\n}\n")
+    finally:
+        if cols is not None:
+            cols.close()
+    if cols is not None:
+        # The JSON was finished last; stamp the sidecar with its time so load_run sees them as a pair
+        stat = os.stat(path)
+        os.utime(sidecar_path(path), ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    return path
+
+
+# ---------------------------------------------------------------- sidecar
+
+def _sidecar_layout(kind:str, parameters_section:str, parameters:dict, series:dict) -> tuple[bytes, list[int], int]:
+    """Header bytes (magic, length, JSON), column offsets and total file size."""
+    columns = {key: {"dtype": values.dtype.str, "length": int(values.size), "offset": 0}
+               for key, values in series.items()}
+    header = {"kind": kind, "parameters": parameters_section,
+              parameters_section: {key: float(value) for key, value in parameters.items()},
+              "columns": columns}
+    # The offsets depend on the header length, which depends on the offsets; iterate to a fixed point
+    offsets:list[int] = []
+    while True:
+        encoded = json.dumps(header).encode()
+        position = len(SIDECAR_MAGIC) + 8 + len(encoded)
+        updated = []
+        for values in series.values():
+            position = -(-position // _ALIGNMENT) * _ALIGNMENT
+            updated.append(position)
+            position += values.nbytes
+        if updated == offsets:
+            return SIDECAR_MAGIC + np.uint64(len(encoded)).tobytes() + encoded, offsets, position
+        offsets = updated
+        for column, offset in zip(columns.values(), offsets):
+            column["offset"] = offset
+
+
+def read_sidecar(path:str|os.PathLike, mmap:bool = True) -> dict:
+    """
+    Reads a .cols sidecar back into the JSON layout.
+
+    Parameters:
+    path (str | os.PathLike): The .cols file.
+    mmap (bool): Memory-map the columns (read-only) instead of reading them. Default is True.
+
+    Returns:
+    dict: {parameters section: {...}, time series section: {column: array}}
+
+    Raises:
+    ValueError: If the file is not a sidecar.
+    """
+    path = os.fspath(path)
+    with open(path, "rb") as f:
+        if f.read(len(SIDECAR_MAGIC)) != SIDECAR_MAGIC:
+            raise ValueError(f"{path} is not a columnar sidecar")
+        length = int(np.frombuffer(f.read(8), dtype=np.uint64)[0])
+        header = json.loads(f.read(length))
+        columns = {}
+        for key, column in header["columns"].items():
+            if mmap:
+                columns[key] = np.memmap(path, dtype=column["dtype"], mode="r", offset=column["offset"],
+                                         shape=(column["length"],))
+            else:
+                f.seek(column["offset"])
+                columns[key] = np.fromfile(f, dtype=column["dtype"], count=column["length"])
+    parameters_section, series_section = SECTIONS[header["kind"]]
+    return {parameters_section: header[parameters_section], series_section: columns}
+
+
+def load_run(path:str|os.PathLike, prefer_sidecar:bool = True, mmap:bool = True) -> dict:
+    """
+    Loads a run from its JSON file, or from the .cols sidecar next to it when present
+    and not older than the JSON.
+
+    The result can be passed to ProjectileMotionVisualizer(json_data=...) or
+    create_oscillation_animation(data=...) either way.
+    """
+    path = os.fspath(path)
+    if path.endswith(SIDECAR_SUFFIX):
+        return read_sidecar(path, mmap)
+    columns = sidecar_path(path)
+    if prefer_sidecar and is_fresh(columns, path):
+        return read_sidecar(columns, mmap)
+    if not precision.fits(os.path.getsize(path) * _PARSED_BYTES_PER_BYTE, share=0.5):
+        # json.load would not fit: stream the columns into a sidecar and map it
+        try:
+            return read_sidecar(_cached_sidecar(path), mmap=True)
+        except ValueError:
+            pass  # not in the C++ layout, fall back to the parser
+    with open(path) as f:
+        return json.load(f)
+
+
+def _cached_sidecar(path:str) -> str:
+    """Sidecar of a JSON output in CACHE_DIR, converted on first use; a rewritten JSON gets a new entry."""
+    stat = os.stat(path)
+    key = f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}:{precision.dtype().name}"
+    cached = os.path.join(CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + SIDECAR_SUFFIX)
+    if not os.path.exists(cached):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Converted under a temporary name, so concurrent loaders never map a partial file
+        partial = f"{cached}.{os.getpid()}.partial"
+        try:
+            json_to_sidecar(path, partial)
+            os.replace(partial, cached)
+        finally:
+            if os.path.exists(partial):
+                os.remove(partial)
+    return cached
+
+
+def _write_sidecar(path:str, kind:str, parameters:dict, series:dict) -> str:
+    """Writes a sidecar from columns that may themselves be memory-mapped."""
+    parameters_section, _ = SECTIONS[kind]
+    header, offsets, size = _sidecar_layout(kind, parameters_section, parameters, series)
+    with open(path, "wb") as f:
+        f.write(header)
+        f.truncate(size)
+        for offset, values in zip(offsets, series.values()):
+            f.seek(offset)
+            for start in range(0, values.size, CHUNK_SIZE * 16):
+                f.write(np.ascontiguousarray(values[start:start + CHUNK_SIZE * 16]).tobytes())
+    return path
+
+
+def json_to_sidecar(path:str|os.PathLike, output:str|os.PathLike|None = None, dtype=None) -> str:
+    """
+    Converts a JSON output in the C++ layout (one key per line, series inline) into a
+    sidecar in bounded memory: the text is read in blocks and each series is parsed
+    block by block into a temporary column file.
+
+    Parameters:
+    path (str | os.PathLike): The JSON output.
+    output (str | os.PathLike): Sidecar to write, <path without extension>.cols by default.
+    dtype: Column dtype, the toolkit.precision dtype by default.
+
+    Returns:
+    str: The sidecar path.
+
+    Raises:
+    ValueError: If the file is not in the layout written by the C++ programs or write_run.
+    """
+    path = os.fspath(path)
+    output = os.fspath(output) if output is not None else sidecar_path(path)
+    dtype = np.dtype(dtype or precision.dtype())
+    series_sections = {series: kind for kind, (_, series) in SECTIONS.items()}
+
+    with open(path, "rb") as f, tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(output))) as scratch:
+        # Scalars, one per line, up to the time series section
+        parameters, kind = {}, None
+        for line in iter(f.readline, b""):
+            section = re.match(rb'\s*"([^"]+)": \{', line)
+            if section and section.group(1).decode() in series_sections:
+                kind = series_sections[section.group(1).decode()]
+                break
+            scalar = re.match(rb'\s*"([^"]+)": ([^,\s{]+),?\s*$', line)
+            if scalar:
+                parameters[scalar.group(1).decode()] = float(scalar.group(2))
+        if kind is None:
+            raise ValueError(f"{path} has no time series section")
+
+        # Series: '"key": [v, v, ...]' split across blocks; the unparsed tail carries over
+        files = {}
+        buffer, key = b"", None
+        while True:
+            block = f.read(_READ_BLOCK)
+            buffer += block
+            while True:
+                if key is None:
+                    opening = buffer.find(b"[")
+                    if opening < 0:
+                        break
+                    name = re.search(rb'"([^"]+)":\s*$', buffer[:opening])
+                    if name is None:
+                        raise ValueError(f"{path} is not in the C++ JSON layout")
+                    key, buffer = name.group(1).decode(), buffer[opening + 1:]
+                    files[key] = open(os.path.join(scratch, f"{len(files)}.bin"), "wb")
+                closing = buffer.find(b"]")
+                cut = closing if closing >= 0 else buffer.rfind(b",")
+                if cut < 0:
+                    break
+                text = buffer[:cut].decode()
+                if text.strip():
+                    np.fromstring(text, dtype=np.float64, sep=",").astype(dtype).tofile(files[key])
+                if closing >= 0:
+                    files[key].close()
+                    buffer, key = buffer[closing + 1:], None
+                else:
+                    buffer = buffer[cut + 1:]
+            if not block:
+                break
+        if key is not None:
+            raise ValueError(f"{path} ends inside the series '{key}'")
+
+        series = {name: np.memmap(handle.name, dtype=dtype, mode="r") if os.path.getsize(handle.name)
+                  else np.zeros(0, dtype=dtype) for name, handle in files.items()}
+        _write_sidecar(output, kind, parameters, series)
+        del series
+    return output